@@ -41,6 +41,11 @@ from .fast64_internal.f3d.f3d_writer import f3d_writer_register, f3d_writer_unre
 from .fast64_internal.f3d.f3d_parser import f3d_parser_register, f3d_parser_unregister
 from .fast64_internal.f3d.flipbook import flipbook_register, flipbook_unregister
 from .fast64_internal.f3d.op_largetexture import op_largetexture_register, op_largetexture_unregister, ui_oplargetexture
+from .fast64_internal.f3d.f3d_texture_cache import (
+    F3D_ClearTextureCache,
+    texture_cache_register,
+    texture_cache_unregister,
+)
 
 from .fast64_internal.f3d_material_converter import (
     MatUpdateConvert,
@@ -125,9 +130,14 @@ class F3D_GlobalSettingsPanel(bpy.types.Panel):
                 "While inlining, all meshes will be restored to world default values.\n         You can configure these values in the world properties tab.",
                 icon="INFO",
             )
+            col.prop(fast64_settings, "optimize_draw_order")
         col.prop(scene, "ignoreTextureRestrictions")
         if scene.ignoreTextureRestrictions:
             col.box().label(text="Width/height must be < 1024. Must be png format.")
+        col.prop(fast64_settings, "texture_cache_enabled")
+        if fast64_settings.texture_cache_enabled:
+            prop_split(col, fast64_settings, "texture_cache_size", "Cache Size (MB)")
+            col.operator(F3D_ClearTextureCache.bl_idname)
 
 
 class Fast64_GlobalSettingsPanel(bpy.types.Panel):
@@ -234,6 +244,22 @@ class Fast64Settings_Properties(bpy.types.PropertyGroup):
     )
     dont_ask_color_management: bpy.props.BoolProperty(name="Don't ask to set color management properties")
     texture_name_includes_ci_format: bpy.props.BoolProperty(name="Include CI Format In File Name", default=False)
+    optimize_draw_order: bpy.props.BoolProperty(
+        name="Optimize Material Draw Order",
+        description="When bleeding, reorder the materials of opaque meshes to reduce texture loads and mode changes. Meshes that blend are kept in order",
+        default=False,
+    )
+    texture_cache_enabled: bpy.props.BoolProperty(
+        name="Cache Converted Textures",
+        description="Keep converted texture data on disk, so textures that did not change are not converted again on the next export",
+        default=False,
+    )
+    texture_cache_size: bpy.props.IntProperty(
+        name="Texture Cache Size (MB)",
+        description="Least recently used textures are removed from the cache past this size",
+        default=256,
+        min=1,
+    )
 
     repo_settings_tab: bpy.props.BoolProperty(default=True, name="Repo Settings")
     repo_settings_path: bpy.props.StringProperty(name="Path", subtype="FILE_PATH", update=repo_path_update)
@@ -251,6 +277,7 @@ class Fast64Settings_Properties(bpy.types.PropertyGroup):
         data["autoLoad"] = self.auto_repo_load_settings
         data["autoPickTextureFormat"] = self.auto_pick_texture_format
         data["textureNameIncludesCiFormat"] = self.texture_name_includes_ci_format
+        data["optimizeDrawOrder"] = self.optimize_draw_order
         if self.auto_pick_texture_format:
             data["preferRGBAOverCI"] = self.prefer_rgba_over_ci
         return data
@@ -259,6 +286,7 @@ class Fast64Settings_Properties(bpy.types.PropertyGroup):
         set_prop_if_in_data(self, "auto_repo_load_settings", data, "autoLoad")
         set_prop_if_in_data(self, "auto_pick_texture_format", data, "autoPickTextureFormat")
         set_prop_if_in_data(self, "texture_name_includes_ci_format", data, "textureNameIncludesCiFormat")
+        set_prop_if_in_data(self, "optimize_draw_order", data, "optimizeDrawOrder")
         set_prop_if_in_data(self, "prefer_rgba_over_ci", data, "preferRGBAOverCI")
 
 
@@ -489,6 +517,7 @@ def register():
     flipbook_register()
     f3d_parser_register()
     op_largetexture_register()
+    texture_cache_register()
 
     # ROM
 
@@ -524,6 +553,7 @@ def unregister():
 
     hm64_unregister()
     utility_anim_unregister()
+    texture_cache_unregister()
     op_largetexture_unregister()
     flipbook_unregister()
     f3d_writer_unregister()
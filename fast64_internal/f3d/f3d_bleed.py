@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import re
 import bpy
 
 from dataclasses import dataclass, field
@@ -11,6 +12,7 @@ from .f3d_gbi import (
     DPSetAlphaCompare,
     DPSetAlphaDither,
     DPSetColorDither,
+    DPSetCombineMode,
     DPSetCombineKey,
     DPSetCycleType,
     DPSetDepthSource,
@@ -127,10 +129,13 @@ class BleedGraphics:
     def __init__(self):
         self.bled_gfx_lists = dict()
         self.reset_gfx_lists = set()
+        # texture loads skipped because their data was still in tmem, per draw layer
+        self.tmem_stats: dict[object, TmemStats] = {}
         # build world default cmds to compare against, f3d types needed for reset cmd building
         self.f3d = get_F3D_GBI()
         self.is_f3d_old = bpy.context.scene.f3d_type == "F3D"
         self.is_f3dex2 = "F3DEX2" in bpy.context.scene.f3d_type
+        self.optimize_draw_order = bpy.context.scene.fast64.settings.optimize_draw_order
         self.build_default_geo()
         self.build_default_othermodes()
 
@@ -199,9 +204,19 @@ class BleedGraphics:
                 fModel.getAllMaterials().items(),
                 fModel.matWriteMethod,
                 fModel.getRenderMode(drawLayer),
+                fMesh.drawLayer,
             )
             self.add_reset_cmds(fMesh.draw, reset_cmd_dict, fModel.matWriteMethod, fModel.getRenderMode(drawLayer))
         self.clear_gfx_lists(fModel)
+        self.report_tmem_stats()
+
+    def report_tmem_stats(self):
+        for draw_layer, stats in self.tmem_stats.items():
+            if stats.elided_loads:
+                print(
+                    f"Draw layer {draw_layer}: skipped {stats.elided_loads} of {stats.loads} texture loads "
+                    f"already in TMEM ({stats.elided_bytes} bytes)."
+                )
 
     # clear the gfx lists so they don't export
     def clear_gfx_lists(self, fModel: FModel):
@@ -259,19 +274,27 @@ class BleedGraphics:
         fmodel_materials,
         mat_write_method: GfxMatWriteMethod,
         default_render_mode: tuple[str] = None,
+        draw_layer=None,
     ):
         if bled_mat := self.bled_gfx_lists.get(id(cmd_list)):
             return bled_mat
         bleed_state = self.bleed_start
         cur_fmat = None
         bleed_gfx_lists = BleedGfxLists()
+        # only the last material's loads are known to be in tmem at the start, the rest is followed in draw order
+        tmem_stats = self.tmem_stats.setdefault(draw_layer, TmemStats())
+        tmem_residency = self.get_tmem_residency(last_mat, tmem_stats)
         fmesh_static_cmds, fmesh_jump_cmds = self.on_bleed_start(cmd_list)
+        if self.optimize_draw_order:
+            fmesh_jump_cmds = self.order_jump_cmds(fmesh_jump_cmds, last_mat, fmodel_materials, default_render_mode)
         start_cmds = cmd_list.commands  # commands that preceed any jump list
         for jump_list_cmd in fmesh_jump_cmds:
             # bleed mat and tex
             if jump_list_cmd.displayList.tag & GfxListTag.MaterialRevert:
                 _, mat = find_material_from_jump_cmd(fmodel_materials, jump_list_cmd)
                 if mat is not None:
+                    if mat is not last_mat:
+                        tmem_residency = self.get_tmem_residency(mat, tmem_stats)
                     last_mat = mat
             if jump_list_cmd.displayList.tag & GfxListTag.Material:
                 _, cur_fmat = find_material_from_jump_cmd(fmodel_materials, jump_list_cmd)
@@ -280,9 +303,10 @@ class BleedGraphics:
                     print("could not find material used in fmesh draw")
                     continue
                 if not (cur_fmat.isTexLarge[0] or cur_fmat.isTexLarge[1]):
-                    bleed_gfx_lists.bled_tex = self.bleed_textures(cur_fmat, last_mat, bleed_state)
+                    bleed_gfx_lists.bled_tex = self.bleed_textures(cur_fmat, last_mat, bleed_state, tmem_residency)
                 else:
                     bleed_gfx_lists.bled_tex = cur_fmat.texture_DL.commands
+                    tmem_residency.add_loads(self.get_tmem_loads(cur_fmat.texture_DL.commands))
                 bleed_gfx_lists.bled_mats = self.bleed_mat(
                     cur_fmat, last_mat, start_cmds, mat_write_method, default_render_mode, bleed_state
                 )
@@ -292,6 +316,9 @@ class BleedGraphics:
             if jump_list_cmd.displayList.tag & GfxListTag.Geometry:
                 tri_list = jump_list_cmd.displayList
                 self.bleed_tri_group(tri_list, cur_fmat, bleed_state)
+                if not cur_fmat or (cur_fmat.isTexLarge[0] or cur_fmat.isTexLarge[1]):
+                    # large textures are loaded in parts between triangles
+                    tmem_residency.add_loads(self.get_tmem_loads(tri_list.commands))
                 self.inline_triGroup(tri_list, bleed_gfx_lists, cmd_list)
                 self.on_tri_group_bleed_end(tri_list, cur_fmat, bleed_gfx_lists)
                 # reset bleed gfx lists after inlining
@@ -305,62 +332,177 @@ class BleedGraphics:
         self.bled_gfx_lists[id(cmd_list)] = cur_fmat
         return last_mat
 
-    def build_tmem_dict(self, cmd_list: GfxList):
-        im_buffer = None
-        tmem_dict = dict()
-        tile_dict = {i: 0 for i in range(8)}  # an assumption that hopefully never needs correction
-        for cmd in cmd_list.commands:
+    def get_tmem_residency(self, last_mat: FMaterial | None, stats: TmemStats) -> TmemResidency:
+        tmem_residency = TmemResidency(stats)
+        if last_mat:
+            tmem_residency.add_loads(self.get_tmem_loads(last_mat.texture_DL.commands))
+        return tmem_residency
+
+    def get_tmem_loads(self, commands: list[GbiMacro]) -> list[TmemLoad]:
+        image_index = None
+        tile_dict: dict[int, DPSetTile] = {}
+        loads = []
+        for j, cmd in enumerate(commands):
             if type(cmd) == DPSetTextureImage:
-                im_buffer = cmd
-                continue
-            if type(cmd) == DPSetTile:
-                tile_dict[cmd.tile] = cmd.tmem
-            if type(cmd) in (DPLoadTLUTCmd, DPLoadTile, DPLoadBlock):
-                tmem_dict[tile_dict[cmd.tile]] = im_buffer
-                continue
-        return tmem_dict
+                image_index = j
+            elif type(cmd) == DPSetTile:
+                tile_dict[cmd.tile] = cmd
+            elif type(cmd) in (DPLoadTLUTCmd, DPLoadTile, DPLoadBlock):
+                set_tile = tile_dict.get(cmd.tile)
+                try:
+                    words, size = self.get_tmem_footprint(set_tile, cmd)
+                except (AttributeError, KeyError, TypeError):
+                    # no tile or non literal values, the load can never be skipped and may write anywhere
+                    loads.append(TmemLoad(None, range(TMEM_WORDS), 0, image_index, j))
+                    continue
+                key = (commands[image_index], set_tile, cmd) if image_index is not None else None
+                loads.append(TmemLoad(key, words, size, image_index, j))
+        return loads
+
+    # the TMEM words written by a load, and the number of bytes it reads
+    def get_tmem_footprint(self, set_tile: DPSetTile, load_cmd: GbiMacro) -> tuple[list[int], int]:
+        if type(load_cmd) == DPLoadTLUTCmd:
+            # each palette entry is quadricated into a whole word
+            count = load_cmd.count + 1
+            return [(set_tile.tmem + i) % TMEM_WORDS for i in range(count)], count * 2
+        texel_bits = 4 << self.f3d.G_IM_SIZ_VARS[set_tile.siz]
+        # 32 bit texels are split into two 16 bit halves, one in each half of TMEM
+        is_32b = texel_bits == 32
+        if type(load_cmd) == DPLoadBlock:
+            texels = min(load_cmd.lrs, self.f3d.G_TX_LDBLK_MAX_TXL) - load_cmd.uls + 1
+            size = (texels * texel_bits + 7) // 8
+            word_count = ((texels * 16 if is_32b else texels * texel_bits) + 63) // 64
+        else:  # load tile coordinates are 10.2 fixed point
+            texels = (load_cmd.lrs >> 2) - (load_cmd.uls >> 2) + 1
+            rows = (load_cmd.lrt >> 2) - (load_cmd.ult >> 2) + 1
+            size = (texels * texel_bits + 7) // 8 * rows
+            word_count = set_tile.line * rows
+        words = list(range(set_tile.tmem, set_tile.tmem + word_count))
+        if is_32b:
+            words += [word + TMEM_WORDS // 2 for word in words]
+        return [word % TMEM_WORDS for word in words], size
+
+    # remove loads whose data is still in tmem, every other load is now resident
+    def elide_resident_loads(self, commands: CopyOnWriteCommands, tmem_residency: TmemResidency):
+        stats = tmem_residency.stats
+        elided_images, kept_images = set(), set()
+        for load in self.get_tmem_loads(commands.source):
+            stats.loads += 1
+            if tmem_residency.is_resident(load):
+                commands.remove(load.load_index)
+                elided_images.add(load.image_index)
+                stats.elided_loads += 1
+                stats.elided_bytes += load.size
+            else:
+                tmem_residency.add(load)
+                kept_images.add(load.image_index)
+        # set tex images are only removed if none of the loads using them are kept
+        for image_index in elided_images - kept_images:
+            commands.remove(image_index)
 
-    def bleed_textures(self, cur_fmat: FMaterial, last_mat: FMaterial, bleed_state: int):
+    def bleed_textures(
+        self,
+        cur_fmat: FMaterial,
+        last_mat: FMaterial,
+        bleed_state: int,
+        tmem_residency: TmemResidency | None = None,
+    ):
+        if tmem_residency is None:
+            # without the draw order, only the loads of the last material are known to be in tmem
+            tmem_residency = self.get_tmem_residency(last_mat, TmemStats())
+        commands_bled = CopyOnWriteCommands(cur_fmat.texture_DL.commands)
+        self.elide_resident_loads(commands_bled, tmem_residency)
         if last_mat:
             # bleed cmds if matching tile has duplicate cmds
-            # deep copy breaks on Image objects so I will only copy the levels needed
-            commands_bled = copy.copy(cur_fmat.texture_DL)
-            commands_bled.commands = copy.copy(cur_fmat.texture_DL.commands)  # copy the commands also
-            # eliminate set tex images, but only if there is an overlap of the same image at the same tmem location
-            last_im_loads = self.build_tmem_dict(last_mat.texture_DL)
-            new_im_loads = self.build_tmem_dict(commands_bled)
-            removable_images = []
-            for tmem, image in new_im_loads.items():
-                if tmem in last_im_loads and last_im_loads[tmem] == image:
-                    removable_images.append(image)
-            # now go through list and cull out loads for the specific cmds
-            # this will be the set tex image, and the loading cmds
-            rm_load = False
-            for j, cmd in enumerate(cur_fmat.texture_DL.commands):
-                # remove set tex explicitly
-                if cmd in removable_images:
-                    commands_bled.commands[j] = None
-                    rm_load = True
-                    continue
-                if rm_load and type(cmd) == DPSetTile:
-                    commands_bled.commands[j] = None
-                if rm_load and type(cmd) in (DPLoadTLUTCmd, DPLoadTile, DPLoadBlock):
-                    commands_bled.commands[j] = None
-                    rm_load = None
-                    continue
-            # now eval as normal conditionals
             for j, cmd in enumerate(cur_fmat.texture_DL.commands):
-                if not cmd:
-                    continue  # some cmds are None from previous step
-                if self.bleed_individual_cmd(commands_bled, cmd, last_mat.texture_DL.commands) is True:
-                    commands_bled.commands[j] = None
-            # remove Nones from list
-            while None in commands_bled.commands:
-                commands_bled.commands.remove(None)
-            bled_tex = commands_bled
-        else:
-            bled_tex = cur_fmat.texture_DL
-        return bled_tex.commands
+                if j in commands_bled.removed:
+                    continue  # already removed as a resident load
+                if self.bleed_individual_cmd(cur_fmat.texture_DL, cmd, last_mat.texture_DL.commands) is True:
+                    commands_bled.remove(j)
+        return commands_bled.commands
+
+    # reorder the materials of a draw list to reduce state changes, only where draw order can't affect blending
+    def order_jump_cmds(
+        self,
+        jump_cmds: list[SPDisplayList],
+        last_mat: FMaterial,
+        fmodel_materials,
+        default_render_mode: tuple[str] = None,
+    ) -> list[SPDisplayList]:
+        units = get_draw_units(jump_cmds, fmodel_materials)
+        if units is None or len(units) < 2:
+            return jump_cmds
+        if not all(self.is_order_independent(unit.fmaterial, default_render_mode) for unit in units):
+            return jump_cmds
+
+        draw_states: dict[int, DrawState] = {}
+        for fmaterial in [unit.fmaterial for unit in units] + ([last_mat] if last_mat else []):
+            if id(fmaterial) not in draw_states:
+                draw_states[id(fmaterial)] = self.get_draw_state(fmaterial)
+        # greedily draw the cheapest material to switch to next, preferring the same material,
+        # ties keep the original order
+        last_fmaterial = last_mat
+        remaining = units
+        ordered_units: list[DrawUnit] = []
+        while remaining:
+            last_state = draw_states[id(last_fmaterial)] if last_fmaterial else None
+            costs = [
+                (
+                    get_state_change_cost(last_state, draw_states[id(unit.fmaterial)]),
+                    unit.fmaterial is not last_fmaterial,
+                )
+                for unit in remaining
+            ]
+            unit = remaining[costs.index(min(costs))]
+            remaining = [other for other in remaining if other is not unit]
+            ordered_units.append(unit)
+            last_fmaterial = unit.fmaterial
+
+        ordered_cmds = []
+        last_unit = None
+        for unit in ordered_units:
+            if last_unit is not None and last_unit.fmaterial is unit.fmaterial:
+                # draw the next tri groups with the same material without reverting and reapplying it
+                if last_unit.revert_cmd is not None:
+                    ordered_cmds.pop()
+            else:
+                ordered_cmds.append(unit.material_cmd)
+            ordered_cmds.extend(unit.geometry_cmds)
+            if unit.revert_cmd is not None:
+                ordered_cmds.append(unit.revert_cmd)
+            last_unit = unit
+        return ordered_cmds
+
+    # the tmem loads and mode cmds compared to find the cost of switching between materials
+    def get_draw_state(self, fmaterial: FMaterial) -> DrawState:
+        modes = {}
+        for cmd in fmaterial.mat_only_DL.commands:
+            if isinstance(cmd, (SPSetOtherModeSub, DPSetRenderMode, DPSetCombineMode)):
+                modes[type(cmd)] = cmd
+            elif isinstance(cmd, SPSetOtherMode):
+                modes[(SPSetOtherMode, cmd.cmd)] = cmd
+        return DrawState(self.get_tmem_loads(fmaterial.texture_DL.commands), modes)
+
+    # whether a material is opaque and depth tested, so that tris drawn with it can be drawn in any order
+    def is_order_independent(self, fmaterial: FMaterial, default_render_mode: tuple[str] = None):
+        set_modes, clear_modes = self.default_set_geo.flagList.copy(), self.default_clear_geo.flagList.copy()
+        render_mode = default_render_mode
+        for cmd in fmaterial.mat_only_DL.commands:
+            if isinstance(cmd, GEO_CMDS):
+                get_flags(set_modes, clear_modes, cmd, self.default_clear_geo)
+            elif isinstance(cmd, DPSetRenderMode):
+                render_mode = cmd.flagList
+            elif isinstance(cmd, SPSetOtherMode) and cmd.sets_rendermode(self.f3d):
+                render_mode = cmd.flagList
+        if "G_ZBUFFER" not in set_modes or not render_mode:
+            return False
+        presets = [flag for flag in render_mode if isinstance(flag, str) and flag.startswith("G_RM_")]
+        if presets:
+            return any("_ZB_" in flag for flag in presets) and all(
+                ORDER_INDEPENDENT_RENDER_MODES.fullmatch(flag) for flag in presets
+            )
+        # custom render modes must test and update depth, and never force blending with the framebuffer
+        return {"Z_CMP", "Z_UPD", "ZMODE_OPA"}.issubset(render_mode) and "FORCE_BL" not in render_mode
 
     def bleed_mat(
         self,
@@ -455,22 +597,19 @@ class BleedGraphics:
                 commands_bled.commands.insert(0, revert_cmd)
 
         # remove SPEndDisplayList
-        while SPEndDisplayList() in commands_bled.commands:
-            commands_bled.commands.remove(SPEndDisplayList())
-        return commands_bled.commands
+        return remove_end_dl(commands_bled.commands)
 
     def bleed_tri_group(self, tri_list: GfxList, cur_fmat: fMaterial, bleed_state: int):
         # remove SPEndDisplayList from triGroup
-        while SPEndDisplayList() in tri_list.commands:
-            tri_list.commands.remove(SPEndDisplayList())
+        tri_list.commands[:] = remove_end_dl(tri_list.commands)
         if not cur_fmat or (cur_fmat.isTexLarge[0] or cur_fmat.isTexLarge[1]):
             tri_list = self.bleed_cmd_list(tri_list, None, bleed_state)
 
     # this is a little less versatile than comparing by last used material
     def bleed_cmd_list(self, target_cmd_list: GfxList, default_render_mode: list[str], bleed_state: int):
         usage_dict = dict()
-        commands_bled = copy.copy(target_cmd_list)  # copy the commands
-        commands_bled.commands = copy.copy(target_cmd_list.commands)  # copy the commands
+        commands_bled = copy.copy(target_cmd_list)  # copy the gfx list, the commands are only copied if any are bled
+        kept_commands = CopyOnWriteCommands(target_cmd_list.commands)
         for j, cmd in enumerate(target_cmd_list.commands):
             # some cmds you can bleed vs world defaults, others only if they repeat within this gfx list
             bleed_cmd_status = self.bleed_individual_cmd(commands_bled, cmd, default_render_mode=default_render_mode)
@@ -479,10 +618,8 @@ class BleedGraphics:
             last_use = usage_dict.get((type(cmd), getattr(cmd, "tile", None)), None)
             usage_dict[(type(cmd), getattr(cmd, "tile", None))] = cmd
             if last_use == cmd or bleed_cmd_status != self.bleed_self_conflict:
-                commands_bled.commands[j] = None
-        # remove Nones from list
-        while None in commands_bled.commands:
-            commands_bled.commands.remove(None)
+                kept_commands.remove(j)
+        commands_bled.commands = kept_commands.commands
         return commands_bled
 
     # Put triGroup bleed gfx in the FMesh.draw object
@@ -521,8 +658,7 @@ class BleedGraphics:
                 cmd_list.commands[j] = None
                 non_jump_dl_cmds.append(cmd)
         # remove Nones from list
-        while None in cmd_list.commands:
-            cmd_list.commands.remove(None)
+        cmd_list.commands[:] = [cmd for cmd in cmd_list.commands if cmd is not None]
         return non_jump_dl_cmds, jump_dl_cmds
 
     def on_tri_group_bleed_end(self, triGroup: FTriGroup, last_mat: FMaterial, bleed_gfx_lists: BleedGfxLists):
@@ -539,8 +675,7 @@ class BleedGraphics:
             return False
         # revert certain cmds for extra safety
         reset_cmds = self.create_reset_cmds(reset_cmd_dict, mat_write_method, default_render_mode)
-        while SPEndDisplayList() in cmd_list.commands:
-            cmd_list.commands.remove(SPEndDisplayList())
+        cmd_list.commands[:] = remove_end_dl(cmd_list.commands)
         cmd_list.commands.extend(reset_cmds)
         cmd_list.commands.append(SPEndDisplayList())
         self.optimize_syncs(cmd_list)
@@ -697,6 +832,136 @@ class BleedGfxLists:
     bled_tex: GfxList = field(default_factory=list)
 
 
+# render modes that depth test opaque or alpha tested surfaces, and cycle 1 modes that don't blend with memory
+ORDER_INDEPENDENT_RENDER_MODES = re.compile(
+    r"G_RM_((AA_|RA_)?ZB_(OPA_SURF|OPA_INTER|OPA_TERR|TEX_EDGE|TEX_TERR)2?|PASS|NOOP2?|FOG_SHADE_A|FOG_PRIM_A)"
+)
+# how many bytes of texture loads a single mode or combiner change is considered to cost, including its sync
+STATE_CHANGE_COST = 64
+
+
+# a material jump, the tri groups drawn with it and its revert, moved as one when ordering materials
+@dataclass
+class DrawUnit:
+    fmaterial: FMaterial
+    material_cmd: SPDisplayList
+    geometry_cmds: list[SPDisplayList] = field(default_factory=list)
+    revert_cmd: SPDisplayList | None = None
+
+
+@dataclass
+class DrawState:
+    loads: list[TmemLoad]
+    modes: dict[object, GbiMacro]
+
+
+def get_draw_units(jump_cmds: list[SPDisplayList], fmodel_materials) -> list[DrawUnit] | None:
+    units: list[DrawUnit] = []
+    for cmd in jump_cmds:
+        last_unit = units[-1] if units else None
+        if cmd.displayList.tag & GfxListTag.Geometry and last_unit and last_unit.revert_cmd is None:
+            last_unit.geometry_cmds.append(cmd)
+        elif last_unit and last_unit.revert_cmd is None and cmd.displayList is last_unit.fmaterial.revert:
+            last_unit.revert_cmd = cmd
+        elif cmd.displayList.tag & GfxListTag.Material:
+            _, fmaterial = find_material_from_jump_cmd(fmodel_materials, cmd)
+            if fmaterial is None:
+                return None
+            units.append(DrawUnit(fmaterial, cmd))
+        else:  # tris before any material or jumps to other draw lists, the order is kept as is
+            return None
+    return units
+
+
+def get_state_change_cost(last_state: DrawState | None, state: DrawState) -> int:
+    last_loads = last_state.loads if last_state else []
+    last_modes = last_state.modes if last_state else {}
+    cost = 0
+    for load in state.loads:
+        if load.key is None or not any(load.key == last_load.key for last_load in last_loads):
+            cost += load.size
+    changed_modes = [
+        key for key in state.modes.keys() | last_modes.keys() if state.modes.get(key) != last_modes.get(key)
+    ]
+    return cost + len(changed_modes) * STATE_CHANGE_COST
+
+
+TMEM_WORDS = 512  # 4 KiB of 64 bit words
+
+
+# a texture or palette load in a cmd list, the key is None if what it loads could not be determined
+@dataclass
+class TmemLoad:
+    key: tuple[DPSetTextureImage, DPSetTile, GbiMacro] | None
+    words: list[int]
+    size: int  # bytes read from RDRAM
+    image_index: int | None
+    load_index: int
+
+
+@dataclass
+class TmemStats:
+    loads: int = 0
+    elided_loads: int = 0
+    elided_bytes: int = 0
+
+
+class TmemResidency:
+    """
+    Which load last wrote each TMEM word, following the draw order.
+    A load can be skipped if every word it writes still holds its data, even if other materials were drawn in between.
+    """
+
+    def __init__(self, stats: TmemStats | None = None):
+        self.words: list[tuple | None] = [None] * TMEM_WORDS
+        self.stats = stats if stats is not None else TmemStats()
+
+    def is_resident(self, load: TmemLoad) -> bool:
+        if load.key is None:
+            return False
+        last_key = load.key  # a load's words share one key, so each key is only compared once
+        for word in load.words:
+            key = self.words[word]
+            if key is not last_key:
+                if key is None or key != load.key:
+                    return False
+                last_key = key
+        return True
+
+    def add(self, load: TmemLoad):
+        for word in load.words:
+            self.words[word] = load.key
+
+    def add_loads(self, loads: list[TmemLoad]):
+        for load in loads:
+            self.add(load)
+
+
+class CopyOnWriteCommands:
+    """
+    A view of a command list that bleeding removes commands from by index.
+    The list is only copied if a command was removed, in a single pass, so the result must not be modified in place.
+    """
+
+    def __init__(self, source: list[GbiMacro]):
+        self.source = source
+        self.removed: set[int] = set()
+
+    def remove(self, index: int):
+        self.removed.add(index)
+
+    @property
+    def commands(self) -> list[GbiMacro]:
+        if not self.removed:
+            return self.source
+        return [cmd for i, cmd in enumerate(self.source) if i not in self.removed]
+
+
+def remove_end_dl(commands: list[GbiMacro]) -> list[GbiMacro]:
+    end_dl = SPEndDisplayList()
+    return [cmd for cmd in commands if cmd != end_dl]
+
+
 # helper function used for sm64
 def find_material_from_jump_cmd(
     material_list: tuple[tuple[bpy.types.Material, str], tuple[FMaterial, tuple[int, int]]],
@@ -3,8 +3,10 @@ from __future__ import annotations
 
 from typing import Sequence, Union, Tuple, TypeVar
 from dataclasses import dataclass, fields, field
-import bpy, os, enum, copy
+import bpy, os, enum, copy, operator
+import numpy as np
 from ..utility import *
+from .f3d_texture_cache import clearImagePixelHashes
 
 from typing import TYPE_CHECKING
 
@@ -1808,6 +1810,8 @@ def _SHIFTL(value, amount, mask):
 
 MTX_SIZE = 64
 VTX_SIZE = 16
+# Vtx as laid out in memory, see Vtx.to_binary
+VTX_DTYPE = np.dtype([("position", ">i2", (3,)), ("flag", ">i2"), ("uv", ">i2", (2,)), ("colorOrNormal", "u1", (4,))])
 GFX_SIZE = 8
 VP_SIZE = 16  # it's 16 bytes but vanilla GBI has only one s64 for alignment, not two
 LIGHT_SIZE = 16
@@ -2035,30 +2039,30 @@ class GfxFormatter:
 
         data = CScrollData()
         data.functionCalls.append(funcName)
-        data.header += f"extern {func};\n"
-        data.source += f"{func} {{\n"
+        data.append_header(f"extern {func};\n")
+        data.append_source(f"{func} {{\n")
 
-        variables = ""
-        code = ""
+        variables = []
+        code = []
         dataIndex = 0
 
         # Since some commands are actually multiple commands in one, we have to use the command size and divide by GFX_SIZE.
         for command in gfxList.commands:
             gfxVariables, gfxCode = self.processGfxScrollCommand(dataIndex // GFX_SIZE, command, gfxList.name)
-            variables += gfxVariables
-            code += gfxCode
+            variables.append(gfxVariables)
+            code.append(gfxCode)
             dataIndex += command.size(f3d)
-        gfxScrollCode = variables + code
+        gfxScrollCode = "".join(variables) + "".join(code)
 
         if gfxScrollCode == "":
             return CScrollData()
         else:
             if self.seg2virtFuncName is not None:
-                data.source += f"\tGfx *mat = {self.seg2virtFuncName}({gfxList.name});\n"
+                data.append_source(f"\tGfx *mat = {self.seg2virtFuncName}({gfxList.name});\n")
             else:
-                data.source += f"\tGfx *mat = {gfxList.name};\n"
-            data.source += gfxScrollCode
-            data.source += f"\n}};\n\n"
+                data.append_source(f"\tGfx *mat = {gfxList.name};\n")
+            data.append_source(gfxScrollCode)
+            data.append_source(f"\n}};\n\n")
             return data
 
     def processGfxScrollCommand(self, commandIndex: int, command: "GbiMacro", gfxListName: str) -> Tuple[str, str]:
@@ -2119,10 +2123,55 @@ class Vtx:
 
 class VtxList:
     def __init__(self, name):
-        self.vertices = []
+        # whole loads of VTX_DTYPE vertices, the storage until Vtx objects are needed
+        self.arrays: list[np.ndarray] = []
+        self.arrayVertexCount = 0
+        self._vertices: Optional[list[Vtx]] = None
         self.name = name
         self.startAddress = 0
 
+    @property
+    def vertices(self) -> list[Vtx]:
+        """
+        The vertices as Vtx objects, built from the arrays the first time they are needed.
+        From then on this list is the storage, so it can be modified like before.
+        """
+        if self._vertices is None:
+            vtxArray = self.get_array()
+            self._vertices = list(
+                map(
+                    Vtx,
+                    vtxArray["position"].tolist(),
+                    vtxArray["uv"].tolist(),
+                    vtxArray["colorOrNormal"].tolist(),
+                    vtxArray["flag"].tolist(),
+                )
+            )
+            self.arrays = []
+            self.arrayVertexCount = 0
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, vertices: list[Vtx]):
+        self._vertices = vertices
+        self.arrays = []
+        self.arrayVertexCount = 0
+
+    def vertex_count(self) -> int:
+        if self._vertices is not None:
+            return len(self._vertices)
+        return self.arrayVertexCount
+
+    def get_array(self) -> np.ndarray:
+        """The stored loads as one VTX_DTYPE array, only valid while there are no Vtx objects"""
+        if len(self.arrays) != 1:
+            # concatenate into VTX_DTYPE, it would otherwise promote the fields to native byte order
+            vtxArray = np.empty(self.arrayVertexCount, VTX_DTYPE)
+            if self.arrays:
+                np.concatenate(self.arrays, out=vtxArray)
+            self.arrays = [vtxArray]
+        return self.arrays[0]
+
     def set_addr(self, startAddress):
         startAddress = get64bitAlignedAddr(startAddress)
         self.startAddress = startAddress
@@ -2134,9 +2183,36 @@ class VtxList:
         romfile.write(self.to_binary())
 
     def size(self):
-        return len(self.vertices) * VTX_SIZE
+        return self.vertex_count() * VTX_SIZE
+
+    def extend_arrays(
+        self, positions: np.ndarray, uvs: np.ndarray, colorOrNormals: np.ndarray, packedNormals: np.ndarray
+    ):
+        """Appends a whole load of quantized vertices at once, one row per vertex"""
+        # Vtx.to_c writes values as they are and Vtx.to_binary wraps uvs, so only loads that pack unchanged are stored packed
+        packable = (
+            self._vertices is None
+            and ((positions >= -(2**15)) & (positions < 2**15)).all()
+            and ((packedNormals >= -(2**15)) & (packedNormals < 2**15)).all()
+            and ((uvs > -(2**15)) & (uvs < 2**15)).all()
+            and ((colorOrNormals >= 0) & (colorOrNormals < 0x100)).all()
+        )
+        if not packable:
+            self.vertices.extend(
+                map(Vtx, positions.tolist(), uvs.tolist(), colorOrNormals.tolist(), packedNormals.tolist())
+            )
+            return
+        vtxArray = np.empty(len(positions), VTX_DTYPE)
+        vtxArray["position"] = positions
+        vtxArray["flag"] = packedNormals
+        vtxArray["uv"] = uvs
+        vtxArray["colorOrNormal"] = colorOrNormals
+        self.arrays.append(vtxArray)
+        self.arrayVertexCount += len(vtxArray)
 
     def to_binary(self):
+        if self._vertices is None:
+            return bytearray(self.get_array().tobytes())
         data = bytearray(0)
         for vert in self.vertices:
             data.extend(vert.to_binary())
@@ -2145,13 +2221,39 @@ class VtxList:
     def to_c(self):
         data = CData()
         data.header = f"extern Vtx {self.name}[{len(self.vertices)}];\n"
-        data.source = f"Vtx {self.name}[{len(self.vertices)}] = {{\n"
-        for vert in self.vertices:
-            data.source += f"\t{vert.to_c()},\n"
-        data.source += "};\n\n"
+        data.append_source(f"Vtx {self.name}[{len(self.vertices)}] = {{\n")
+        data.append_source("".join([f"\t{vert.to_c()},\n" for vert in self.vertices]))
+        data.append_source("};\n\n")
         return data
 
 
+@dataclass
+class CompiledGfxList:
+    """
+    The binary layout of a GfxList's commands, reused until the commands change.
+    Commands holding addresses of other data are encoded on every write, since those addresses can still change.
+    """
+
+    f3d: "F3D"
+    commands: list[GbiMacro]
+    """The commands compiled, to tell when the GfxList changed"""
+    sizes: list[int]
+    size: int
+    ptrOffsets: list[int]
+    """Relocation table, the offsets of pointers from the start of the list"""
+    addressCommands: list[int]
+    """Indices of the commands encoded on every write"""
+    dynamicDisplayLists: list[int]
+    """Indices of the SPDisplayList commands calling dynamic display lists, for size_total"""
+    encoded: Optional[list[bytes]] = None
+    """Every command's encoding, with the address commands left empty, done on the first write"""
+
+    def matches(self, commands: list[GbiMacro], f3d) -> bool:
+        return (
+            self.f3d is f3d and len(self.commands) == len(commands) and all(map(operator.is_, self.commands, commands))
+        )
+
+
 class GfxList:
     def __init__(self, name, tag, DLFormat):
         self.commands: list[GbiMacro] = []
@@ -2159,65 +2261,90 @@ class GfxList:
         self.startAddress: int = 0
         self.tag: GfxListTag = tag
         self.DLFormat: "DLFormat" = DLFormat
+        self.compiled: Optional[CompiledGfxList] = None
+
+    def compile(self, f3d) -> CompiledGfxList:
+        if self.compiled is not None and self.compiled.matches(self.commands, f3d):
+            return self.compiled
+
+        commands = list(self.commands)
+        sizes = [command.size(f3d) for command in commands]
+        ptrOffsets = []
+        offset = 0
+        for command, size in zip(commands, sizes):
+            if type(command) in F3DClassesWithPointers:
+                for ptrOffset in command.get_ptr_offsets(f3d):
+                    ptrOffsets.append(offset + ptrOffset)
+            offset += size
+        self.compiled = CompiledGfxList(
+            f3d,
+            commands,
+            sizes,
+            sum(sizes),
+            ptrOffsets,
+            [i for i, command in enumerate(commands) if isinstance(command, F3DClassesWithAddresses)],
+            [
+                i
+                for i, command in enumerate(commands)
+                if isinstance(command, SPDisplayList) and command.displayList.DLFormat != DLFormat.Static
+            ],
+        )
+        return self.compiled
 
     def set_addr(self, startAddress, f3d):
         startAddress = get64bitAlignedAddr(startAddress)
         self.startAddress = startAddress
-        print(f"GfxList {self.name}: {str(startAddress)}, {str(self.size(f3d))}")
-        return startAddress, startAddress + self.size(f3d)
+        size = self.size(f3d)
+        print(f"GfxList {self.name}: {str(startAddress)}, {str(size)}")
+        return startAddress, startAddress + size
 
     def save_binary(self, romfile, f3d, segments):
-        print(f"GfxList {self.name}: {str(self.startAddress)}, {str(self.size(f3d))}")
         romfile.seek(self.startAddress)
         romfile.write(self.to_binary(f3d, segments))
 
     def size(self, f3d):
-        return sum([command.size(f3d) for command in self.commands])
+        return self.compile(f3d).size
 
     # Size, including display lists called with SPDisplayList
     def size_total(self, f3d):
-        def use_siz_tot(command):
-            return isinstance(command, SPDisplayList) and command.displayList.DLFormat != DLFormat.Static
-
-        return sum(
-            [
-                command.displayList.size_total(f3d) if use_siz_tot(command) else command.size(f3d)
-                for command in self.commands
-            ]
-        )
+        compiled = self.compile(f3d)
+        size = compiled.size
+        for i in compiled.dynamicDisplayLists:
+            size += compiled.commands[i].displayList.size_total(f3d) - compiled.sizes[i]
+        return size
 
     def get_ptr_addresses(self, f3d):
-        ptrs = []
-        address = self.startAddress
-        for command in self.commands:
-            if type(command) in F3DClassesWithPointers:
-                for offset in command.get_ptr_offsets(f3d):
-                    ptrs.append(address + offset)
-            address += command.size(f3d)
-        return ptrs
+        return [self.startAddress + offset for offset in self.compile(f3d).ptrOffsets]
 
     def to_binary(self, f3d, segments):
-        data = bytearray(0)
-        for command in self.commands:
-            data.extend(command.to_binary(f3d, segments))
-        return data
+        compiled = self.compile(f3d)
+        if compiled.encoded is None:
+            addressCommands = set(compiled.addressCommands)
+            compiled.encoded = [
+                b"" if i in addressCommands else command.to_binary(f3d, None)
+                for i, command in enumerate(compiled.commands)
+            ]
+        encoded = list(compiled.encoded)
+        for i in compiled.addressCommands:
+            encoded[i] = compiled.commands[i].to_binary(f3d, segments)
+        return bytearray(b"".join(encoded))
 
     def to_c_static(self, name: str):
-        data = f"Gfx {name}[] = {{\n"
+        data = [f"Gfx {name}[] = {{\n"]
         for command in self.commands:
             if command.default_formatting:
-                data += f"\t{command.to_c(True)},\n"
+                data.append(f"\t{command.to_c(True)},\n")
             else:
-                data += command.to_c(True)
-        data += "};\n\n"
-        return data
+                data.append(command.to_c(True))
+        data.append("};\n\n")
+        return "".join(data)
 
     def to_c_dynamic(self):
-        data = f"Gfx* {self.name}(Gfx* glistp) {{\n"
+        data = [f"Gfx* {self.name}(Gfx* glistp) {{\n"]
         for command in self.commands:
-            data += f"\t{command.to_c(False)};\n"
-        data += "\treturn glistp;\n}\n\n"
-        return data
+            data.append(f"\t{command.to_c(False)};\n")
+        data.append("\treturn glistp;\n}\n\n")
+        return "".join(data)
 
     def to_c(self, f3d, name_override: Optional[str] = None):
         data = CData()
@@ -2422,6 +2549,8 @@ class FModel:
         matWriteMethod: GfxMatWriteMethod,
     ):
         self.name = toAlnum(name)  # used for texture prefixing
+        # images may have been edited since the last export
+        clearImagePixelHashes()
         # dict of light name : Lights
         self.lights: dict[str, Lights] = {}
         # dict of (texture, (texture format, palette format)) : FImage
@@ -2749,11 +2878,11 @@ class FModel:
         staticData.append(self.to_c_lights())
 
         texData = self.to_c_textures(texCSeparate, savePNG, texDir, gfxFormatter.texArrayBitSize)
-        staticData.header += texData.header
+        staticData.append_header(texData.header)
         if texCSeparate:
-            texC.source += texData.source
+            texC.append_source(texData.source)
         else:
-            staticData.source += texData.source
+            staticData.append_source(texData.source)
 
         dynamicData.append(self.to_c_materials(gfxFormatter))
 
@@ -2786,12 +2915,12 @@ class FModel:
             data.append(gfxScrollData)
 
         data.topLevelScrollFunc = f"scroll_{funcName}"
-        data.source += f"void {data.topLevelScrollFunc}() {{\n"
+        data.append_source(f"void {data.topLevelScrollFunc}() {{\n")
         for scrollFunc in data.functionCalls:
-            data.source += f"\t{scrollFunc}();\n"
-        data.source += f"}};\n"
+            data.append_source(f"\t{scrollFunc}();\n")
+        data.append_source(f"}};\n")
 
-        data.header += f"extern void {data.topLevelScrollFunc}();\n"
+        data.append_header(f"extern void {data.topLevelScrollFunc}();\n")
         return data
 
     def to_c_vertex_scroll(self, gfxFormatter: GfxFormatter) -> CScrollData:
@@ -2801,7 +2930,7 @@ class FModel:
             for triGroup in mesh.triangleGroups:
                 data.append(
                     gfxFormatter.vertexScrollToC(
-                        triGroup.fMaterial, triGroup.vertexList.name, len(triGroup.vertexList.vertices)
+                        triGroup.fMaterial, triGroup.vertexList.name, triGroup.vertexList.vertex_count()
                     )
                 )
 
@@ -2820,7 +2949,7 @@ class FModel:
 
     def save_textures(self, exportPath):
         # TODO: Saving texture should come from FImage
-        texturesSaved = 0
+        images = []
         for imageKey, fImage in self.textures.items():
             if isinstance(imageKey, FPaletteKey):
                 continue
@@ -2828,23 +2957,8 @@ class FModel:
 
             # remove '.inc.c'
             imageFileName = fImage.filename[:-6] + ".png"
-
-            image = imageKey.image
-            isPacked = image.packed_file is not None
-            if not isPacked:
-                image.pack()
-            oldpath = image.filepath
-            try:
-                image.filepath = bpy.path.abspath(os.path.join(exportPath, imageFileName))
-                image.save()
-                texturesSaved += 1
-                if not isPacked:
-                    image.unpack()
-            except Exception as e:
-                image.filepath = oldpath
-                raise Exception(str(e))
-            image.filepath = oldpath
-        return texturesSaved
+            images.append((imageKey.image, bpy.path.abspath(os.path.join(exportPath, imageFileName))))
+        return saveImagesAsPNG(images)
 
     def freePalettes(self):
         pass
@@ -3253,10 +3367,10 @@ class Lights:
         data = CData()
         data.header = f"extern Lights{str(len(self.l))} {self.name};\n"
         data.source = f"Lights{str(len(self.l))} {self.name} = gdSPDefLights{str(len(self.l))}(\n"
-        data.source += "\t" + self.a.to_c()
+        data.append_source("\t" + self.a.to_c())
         for light in self.l:
-            data.source += ",\n\t" + light.to_c()
-        data.source += ");\n\n"
+            data.append_source(",\n\t" + light.to_c())
+        data.append_source(");\n\n")
         return data
 
 
@@ -3332,9 +3446,9 @@ class FImage:
         # This is to force 8 byte alignment
         if bitsPerValue != 64:
             code.source = f"Gfx {self.aligner_name}[] = {{gsSPEndDisplayList()}};\n"
-        code.source += f"u{str(bitsPerValue)} {self.name}[] = {{\n\t"
-        code.source += texData
-        code.source += "\n};\n\n"
+        code.append_source(f"u{str(bitsPerValue)} {self.name}[] = {{\n\t")
+        code.append_source(texData)
+        code.append_source("\n};\n\n")
         return code
 
     def to_c_data(self, bitsPerValue):
@@ -5668,3 +5782,6 @@ F3DClassesWithPointers = [
     DPLoadTLUT_pal256,
     DPLoadTLUT,
 ]
+
+# Commands whose binary encoding includes addresses of other data
+F3DClassesWithAddresses = (*F3DClassesWithPointers, SPBranchLessZraw)
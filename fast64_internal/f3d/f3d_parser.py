@@ -5,6 +5,8 @@ import re
 import math
 import traceback
 import ast
+import functools
+import numpy as np
 
 from typing import Union, Optional, Callable, Any, TYPE_CHECKING
 from collections import defaultdict
@@ -271,14 +273,12 @@ def interpretLoadVertices(romfile, vertexBuffer, transformMatrix, command, segme
     romfile.seek(dataStartAddr)
     data = romfile.read(dataLength)
 
-    for i in range(numVerts):
-        vert = Vector(readVectorFromShorts(data, i * 16))
-        vert = transformMatrix @ vert
-        transformedVert = bytearray(6)
-        writeVectorToShorts(transformedVert, 0, vert)
-
+    # decode all loaded vertices at once instead of per short
+    scale = bpy.context.scene.fast64.sm64.blender_to_sm64_scale
+    for i, (x, y, z) in enumerate(struct.iter_unpack(">3h10x", data[: numVerts * 16])):
+        vert = transformMatrix @ Vector((x / scale, y / scale, z / scale))
         start = (startIndex + i) * 16
-        vertexBuffer[start : start + 6] = transformedVert
+        vertexBuffer[start : start + 6] = struct.pack(">3h", *(int(round(value * scale)) for value in vert))
         vertexBuffer[start + 6 : start + 16] = data[i * 16 + 6 : i * 16 + 16]
 
 
@@ -1389,9 +1389,9 @@ class F3DContext:
         self.materialChanged = True
 
     def get_file_macro_value(self, macro: str, filedata: str):
-        match = re.search(rf"#\s*define\s+{macro}\s+([0-9a-fA-FxX]*)", filedata, re.DOTALL)
-        assert match is not None, f"match is null for {macro}"
-        return match.group(1)
+        value = getCSymbolIndex(filedata).defines.get(macro)
+        assert value is not None, f"match is null for {macro}"
+        return value
 
     def loadMultiBlock(self, params: "list[str | int]", dlData: str, is4bit: bool):
         # handles OoT's macros
@@ -1878,8 +1878,15 @@ class F3DContext:
         else:
             raise PluginError("Attempting to delete material context that is None.")
 
-    def createVertexGroups(self, obj: bpy.types.Object) -> None:
+    def createVertexGroups(self, obj: bpy.types.Object, firstIndices: Optional[np.ndarray] = None) -> None:
+        # after merging by distance, a vertex keeps the group of the first vertex merged into it
+        if firstIndices is not None:
+            mergedIndices = np.full(len(self.verts), -1, dtype=np.int32)
+            mergedIndices[firstIndices] = np.arange(len(firstIndices), dtype=np.int32)
         for groupName, indices in self.limbGroups.items():
+            if firstIndices is not None:
+                indices = mergedIndices[indices]
+                indices = indices[indices >= 0].tolist()
             group = obj.vertex_groups.new(name=self.limbToBoneName[groupName])
             group.add(indices, 1, "REPLACE")
 
@@ -1891,11 +1898,41 @@ class F3DContext:
             raise PluginError("Number of verts in mesh not divisible by 3, currently " + str(len(self.verts)))
 
         triangleCount = int(len(self.verts) / 3)
-        verts = [f3dVert.position for f3dVert in self.verts]
-        faces = [[3 * i + j for j in range(3)] for i in range(triangleCount)]
         print("Vertices: " + str(len(self.verts)) + ", Triangles: " + str(triangleCount))
 
-        mesh.from_pydata(vertices=verts, edges=[], faces=faces)
+        # every triangle has its own 3 vertices, so there is one loop for every vertex
+        positions = np.array([f3dVert.position for f3dVert in self.verts], dtype=np.float64).reshape(-1, 3)
+        uvs = np.array([f3dVert.uv for f3dVert in self.verts], dtype=np.float32).reshape(-1, 2)
+        colors = np.ones((len(self.verts), 4), dtype=np.float32)
+        colors[:, :3] = np.array([f3dVert.rgb for f3dVert in self.verts], dtype=np.float32).reshape(-1, 3)
+        alphas = np.ones((len(self.verts), 4), dtype=np.float32)
+        alphas[:, :3] = np.array([f3dVert.alpha for f3dVert in self.verts], dtype=np.float32)[:, None]
+        materialIndices = np.array(self.triMatIndices, dtype=np.int32)
+        if importNormals:
+            normals = np.array([f3dVert.normal for f3dVert in self.verts], dtype=np.float32).reshape(-1, 3)
+
+        if removeDoubles:
+            firstIndices, remap = mergeByDistance(positions)
+            positions = positions[firstIndices]
+            triangles = remap.reshape(-1, 3)
+            # triangles with merged corners are removed, like remove_doubles does
+            keptTriangles = (
+                (triangles[:, 0] != triangles[:, 1])
+                & (triangles[:, 1] != triangles[:, 2])
+                & (triangles[:, 2] != triangles[:, 0])
+            )
+            if not keptTriangles.all():
+                keptLoops = np.repeat(keptTriangles, 3)
+                triangles = triangles[keptTriangles]
+                materialIndices = materialIndices[keptTriangles]
+                uvs, colors, alphas = uvs[keptLoops], colors[keptLoops], alphas[keptLoops]
+                if importNormals:
+                    normals = normals[keptLoops]
+        else:
+            firstIndices = None
+            triangles = np.arange(len(self.verts), dtype=np.int32).reshape(-1, 3)
+
+        createTriangleMesh(mesh, positions, triangles, materialIndices, smooth=not importNormals)
         uv_layer_name = mesh.uv_layers.new().name
         # if self.materialContext.f3d_mat.rdp_settings.g_lighting:
         # else:
@@ -1904,42 +1941,27 @@ class F3DContext:
             # Changed in Blender 4.1: "Meshes now always use custom normals if they exist." (and use_auto_smooth was removed)
             if bpy.app.version < (4, 1, 0):
                 mesh.use_auto_smooth = True
-            mesh.normals_split_custom_set([f3dVert.normal for f3dVert in self.verts])
-
-        self.createVertexGroups(obj)
+            mesh.normals_split_custom_set(normals.tolist())
 
-        for i in range(len(mesh.polygons)):
-            mesh.polygons[i].material_index = self.triMatIndices[i]
+        self.createVertexGroups(obj, firstIndices)
 
         # Workaround for an issue in Blender 3.5 where putting this above the `if importNormals` block
         # causes wrong uvs/normals and sometimes crashes.
         uv_layer = mesh.uv_layers[uv_layer_name].data
-
-        for i in range(len(mesh.loops)):
-            # This should be okay, since we aren't trying to optimize vertices
-            # There will be one loop for every vertex
-            uv_layer[i].uv = self.verts[i].uv
+        uv_layer.foreach_set("uv", uvs.reshape(-1))
 
         # The mesh.vertex_colors API is deprecated since Blender 3.2,
         # and its usage by fast64 here breaks in Blender 5.1 somehow.
         # (can't replicate in simple cases)
         if bpy.app.version < (3, 2, 0):
-            color_layer = mesh.vertex_colors.new(name="Col").data
-            for i in range(len(mesh.loops)):
-                color_layer[i].color = self.verts[i].rgb.to_4d()
-
-            alpha_layer = mesh.vertex_colors.new(name="Alpha").data
-            for i in range(len(mesh.loops)):
-                alpha_layer[i].color = [self.verts[i].alpha] * 3 + [1]
+            mesh.vertex_colors.new(name="Col").data.foreach_set("color", colors.reshape(-1))
+            mesh.vertex_colors.new(name="Alpha").data.foreach_set("color", alphas.reshape(-1))
         else:
             col_attr = mesh.color_attributes.new("Col", "BYTE_COLOR", "CORNER")
-            for i in range(len(mesh.loops)):
-                col_attr.data[i].color = (*self.verts[i].rgb, 1)
+            col_attr.data.foreach_set("color", colors.reshape(-1))
 
             alpha_attr = mesh.color_attributes.new("Alpha", "BYTE_COLOR", "CORNER")
-            for i in range(len(mesh.loops)):
-                a = self.verts[i].alpha
-                alpha_attr.data[i].color = (a, a, a, 1)
+            alpha_attr.data.foreach_set("color", alphas.reshape(-1))
 
         if bpy.context.mode != "OBJECT":
             bpy.ops.object.mode_set(mode="OBJECT")
@@ -1947,13 +1969,6 @@ class F3DContext:
 
         for material in self.materials:
             obj.data.materials.append(material)
-        if not importNormals:
-            bpy.ops.object.shade_smooth()
-        if removeDoubles:
-            bpy.ops.object.mode_set(mode="EDIT")
-            bpy.ops.mesh.select_all(action="SELECT")
-            bpy.ops.mesh.remove_doubles()
-            bpy.ops.object.mode_set(mode="OBJECT")
 
         obj.location = bpy.context.scene.cursor.location
 
@@ -2037,7 +2052,7 @@ def parseF3D(
 
 
 def parseDLData(dlData: str, dlName: str):
-    matchResult = re.search(r"Gfx\s*" + re.escape(dlName) + r"\s*\[\s*\w*\s*\]\s*=\s*\{([^\}]*)\}", dlData)
+    matchResult = getCSymbolIndex(dlData).match(dlName, dlPattern, lambda symbolType: symbolType == "Gfx")
     if matchResult is None:
         raise PluginError("Cannot find display list named " + dlName)
 
@@ -2060,9 +2075,7 @@ def parseVertexData(
     if vertexDataName in f3dContext.vertexData:
         return f3dContext.vertexData[vertexDataName]
 
-    matchResult = re.search(
-        r"Vtx\s*" + re.escape(vertexDataName) + r"\s*\[\s*[0-9x]*\s*\]\s*=\s*\{([^;]*);", dlData, re.DOTALL
-    )
+    matchResult = getCSymbolIndex(dlData).match(vertexDataName, vertexPattern, lambda symbolType: symbolType == "Vtx")
     if matchResult is None:
         raise PluginError("Cannot find vertex list named " + vertexDataName)
     data = matchResult.group(1)
@@ -2104,11 +2117,7 @@ def parseLightsData(lightsData, lightsName, f3dContext):
     # if lightsName in f3dContext.lightData:
     # 	return f3dContext.lightData[lightsName]
 
-    matchResult = re.search(
-        r"Lights([0-9n])\s*" + re.escape(lightsName) + r"\s*=\s*gdSPDefLights[0-9]\s*\(([^\)]*)\)\s*;\s*",
-        lightsData,
-        re.DOTALL,
-    )
+    matchResult = getCSymbolIndex(lightsData).match(lightsName, lightsPattern, lightsTypePattern.fullmatch)
     if matchResult is None:
         raise PluginError("Cannot find lights data named " + lightsName)
     data = matchResult.group(2)
@@ -2158,13 +2167,7 @@ def CI4toRGBA32(value):
 
 
 def parseTextureData(dlData, textureName, f3dContext, imageFormat, imageSize, width, isLUT, f3d):
-    matchResult = re.search(
-        r"([A-Za-z0-9\_]+)\s*"
-        + re.escape(textureName)
-        + r"\s*\[\s*[0-9a-zA-Z_\(\),\s]*\s*\]\s*=\s*\{([^\}]*)\s*\}\s*;\s*",
-        dlData,
-        re.DOTALL,
-    )
+    matchResult = getCSymbolIndex(dlData).match(textureName, texturePattern, lambda symbolType: True)
     if matchResult is None:
         print("Cannot find texture named " + textureName)
         return F3DTextureReference(textureName, width), False
@@ -2187,104 +2190,127 @@ def parseTextureData(dlData, textureName, f3dContext, imageFormat, imageSize, wi
 
         # Blender UV origin is bottom right, while N64 is top right, so we must flip LUT since we read it as data
         if isLUT:
-            flippedValues = image.pixels[:]
             width, height = image.size
-            for j in range(height):
-                image.pixels[width * j * 4 : width * (j + 1) * 4] = flippedValues[
-                    width * (height - (j + 1)) * 4 : width * (height - j) * 4
-                ]
+            pixels = np.empty(width * height * image.channels, dtype=np.float32)
+            image.pixels.foreach_get(pixels)
+            image.pixels.foreach_set(pixels.reshape(height, -1)[::-1].reshape(-1))
 
         loadedFromImageFile = True
     else:
-        values = [value.strip() for value in data.split(",") if value.strip() != ""]
-        newValues = []
-        for value in values:
-            intValue = math_eval(value, f3d)
-            if valueSize == "u8" or valueSize == "s8" or valueSize == "char" or valueSize == "Texture":
-                size = 1
-            elif valueSize == "u16" or valueSize == "s16" or valueSize == "short":
-                size = 2
-            elif valueSize == "u32" or valueSize == "s32" or valueSize == "int":
-                size = 4
-            else:
-                size = 8
-            newValues.extend(int.to_bytes(intValue, size, "big")[:])
-        values = newValues
+        if valueSize == "u8" or valueSize == "s8" or valueSize == "char" or valueSize == "Texture":
+            size = 1
+        elif valueSize == "u16" or valueSize == "s16" or valueSize == "short":
+            size = 2
+        elif valueSize == "u32" or valueSize == "s32" or valueSize == "int":
+            size = 4
+        else:
+            size = 8
+        values = parseTextureValues(data, size, f3d)
 
         if width == 0:
             width = 16
         height = int(ceil(len(values) / (width * int(imageSize[9:-1]) / 8)))
         # print("Texture: " + str(len(values)) + ", width = " + str(width) + ", height = " + str(height))
         image = bpy.data.images.new(textureName, width, height, alpha=True)
-        if imageFormat == "G_IM_FMT_RGBA":
-            if imageSize == "G_IM_SIZ_16b":
-                for i in range(int(len(values) / 2)):
-                    image.pixels[4 * i : 4 * (i + 1)] = RGBA16toRGBA32(
-                        int.from_bytes(values[2 * i : 2 * (i + 1)], "big")
-                    )
-            elif imageSize == "G_IM_SIZ_32b":
-                image.pixels[:] = values
-            else:
-                print("Unhandled size for RGBA: " + str(imageSize))
-        elif imageFormat == "G_IM_FMT_IA":
-            if imageSize == "G_IM_SIZ_4b":
-                for i in range(len(values)):
-                    image.pixels[8 * i : 8 * i + 4] = IA4toRGBA32((values[i] >> 4) & 15)
-                    image.pixels[8 * i + 4 : 8 * i + 8] = IA4toRGBA32(values[i] & 15)
-            elif imageSize == "G_IM_SIZ_8b":
-                for i in range(len(values)):
-                    image.pixels[4 * i : 4 * (i + 1)] = IA8toRGBA32(values[i])
-            elif imageSize == "G_IM_SIZ_16b":
-                for i in range(int(len(values) / 2)):
-                    image.pixels[4 * i : 4 * (i + 1)] = IA16toRGBA32(int.from_bytes(values[2 * i : 2 * (i + 1)], "big"))
-            else:
-                print("Unhandled size for IA: " + str(imageSize))
-        elif imageFormat == "G_IM_FMT_I":
-            if imageSize == "G_IM_SIZ_4b":
-                for i in range(len(values)):
-                    image.pixels[8 * i : 8 * i + 4] = I4toRGBA32((values[i] >> 4) & 15)
-                    image.pixels[8 * i + 4 : 8 * i + 8] = I4toRGBA32(values[i] & 15)
-            elif imageSize == "G_IM_SIZ_8b":
-                for i in range(len(values)):
-                    image.pixels[4 * i : 4 * (i + 1)] = I8toRGBA32(values[i])
-            else:
-                print("Unhandled size for I: " + str(imageSize))
-        elif imageFormat == "G_IM_FMT_CI":
-            if imageSize == "G_IM_SIZ_4b":
-                for i in range(len(values)):
-                    image.pixels[8 * i : 8 * i + 4] = CI4toRGBA32((values[i] >> 4) & 15)
-                    image.pixels[8 * i + 4 : 8 * i + 8] = CI4toRGBA32(values[i] & 15)
-            elif imageSize == "G_IM_SIZ_8b":
-                for i in range(len(values)):
-                    image.pixels[4 * i : 4 * (i + 1)] = CI8toRGBA32(values[i])
-            else:
-                print("Unhandled size for CI: " + str(imageSize))
+        pixels = np.empty(width * height * 4, dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+
+        texels = decodeTexels(values, imageFormat, imageSize)
+        if texels is not None:
+            texels = texels.reshape(-1)[: len(pixels)]
+            pixels[: len(texels)] = texels
 
         # Blender UV origin is bottom right, while N64 is top right, so we must flip non LUT
         if not isLUT:
-            flippedValues = image.pixels[:]
-            for j in range(height):
-                image.pixels[width * j * 4 : width * (j + 1) * 4] = flippedValues[
-                    width * (height - (j + 1)) * 4 : width * (height - j) * 4
-                ]
+            pixels = pixels.reshape(height, width * 4)[::-1].reshape(-1)
+        image.pixels.foreach_set(pixels)
 
     return image, loadedFromImageFile
 
 
+def parseTextureValues(data: str, size: int, f3d: F3D) -> np.ndarray:
+    """Returns the big endian bytes of a C texture array's values as uint8"""
+
+    intValues = []
+    for value in data.split(","):
+        value = value.strip()
+        if value != "":
+            try:
+                intValues.append(int(value, 0))
+            except ValueError:
+                intValues.append(math_eval(value, f3d))
+
+    if len(intValues) > 0 and (min(intValues) < 0 or max(intValues) >= 1 << (size * 8)):
+        for intValue in intValues:
+            int.to_bytes(intValue, size, "big")  # raises the overflow error for the invalid value
+
+    return np.array(intValues, dtype=np.uint64).astype(f">u{size}").view(np.uint8)
+
+
+def decodeTexels(values: np.ndarray, imageFormat: str, imageSize: str) -> Optional[np.ndarray]:
+    """
+    Converts texture bytes to RGBA floats (one row per texel) for all texels at once,
+    the per texel functions (RGBA16toRGBA32, ...) are the reference for each format
+    """
+
+    def channels(intensity: np.ndarray, alpha: np.ndarray):
+        return np.stack((intensity, intensity, intensity, alpha), axis=1)
+
+    def nibbles(values: np.ndarray):
+        return np.stack(((values >> 4) & 15, values & 15), axis=1).reshape(-1)
+
+    values = values.astype(np.int64)
+    shorts = (values[0 : len(values) // 2 * 2 : 2] << 8) | values[1 : len(values) // 2 * 2 : 2]
+
+    if imageFormat == "G_IM_FMT_RGBA":
+        if imageSize == "G_IM_SIZ_16b":
+            return np.stack(
+                (((shorts >> 11) & 31) / 31, ((shorts >> 6) & 31) / 31, ((shorts >> 1) & 31) / 31, shorts & 1), axis=1
+            )
+        elif imageSize == "G_IM_SIZ_32b":
+            return values[: len(values) // 4 * 4].reshape(-1, 4) / 255
+        else:
+            print("Unhandled size for RGBA: " + str(imageSize))
+    elif imageFormat == "G_IM_FMT_IA":
+        if imageSize == "G_IM_SIZ_4b":
+            texels = nibbles(values)
+            return channels(((texels >> 1) & 7) / 7, texels & 1)
+        elif imageSize == "G_IM_SIZ_8b":
+            return channels(((values >> 4) & 15) / 15, (values & 15) / 15)
+        elif imageSize == "G_IM_SIZ_16b":
+            return channels(((shorts >> 8) & 255) / 255, (shorts & 255) / 255)
+        else:
+            print("Unhandled size for IA: " + str(imageSize))
+    elif imageFormat == "G_IM_FMT_I":
+        if imageSize == "G_IM_SIZ_4b":
+            texels = nibbles(values)
+            return channels(texels / 15, np.ones(len(texels)))
+        elif imageSize == "G_IM_SIZ_8b":
+            return channels(values / 255, np.ones(len(values)))
+        else:
+            print("Unhandled size for I: " + str(imageSize))
+    elif imageFormat == "G_IM_FMT_CI":
+        if imageSize == "G_IM_SIZ_4b":
+            texels = nibbles(values)
+            return channels(texels / 255, np.ones(len(texels)))
+        elif imageSize == "G_IM_SIZ_8b":
+            return channels(values / 255, np.ones(len(values)))
+        else:
+            print("Unhandled size for CI: " + str(imageSize))
+    return None
+
+
 def parseMacroList(data: str):
-    end = 0
     start = 0
     isCommand = True
     commands: "list[ParsedMacro]" = []
     parenthesesCount = 0
 
     command = None
-    while end < len(data) - 1:
-        end += 1
-        if data[end] == "(":
-            parenthesesCount += 1
-        elif data[end] == ")":
-            parenthesesCount -= 1
+    # only parentheses change the state, the first character is skipped
+    for match in parenthesesPattern.finditer(data, 1):
+        end = match.start()
+        parenthesesCount += 1 if match.group() == "(" else -1
 
         if isCommand and parenthesesCount > 0:
             command = data[start:end].strip()
@@ -2304,26 +2330,103 @@ def parseMacroList(data: str):
 
 
 def parseMacroArgs(data: str):
+    if len(data) == 0:
+        return []
+
     start = 0
     params: "list[str]" = []
     parenthesesCount = 0
 
-    for end in range(len(data)):
-        if data[end] == "(":
+    # the last character always ends the last param, even if it's a comma
+    for match in macroArgsPattern.finditer(data, 0, len(data) - 1):
+        char = match.group()
+        if char == "(":
             parenthesesCount += 1
-        elif data[end] == ")":
+        elif char == ")":
             parenthesesCount -= 1
+        elif parenthesesCount == 0:
+            params.append("".join(data[start : match.start()].split()))
+            start = match.start() + 1
 
-        if (data[end] == "," or end == len(data) - 1) and parenthesesCount == 0:
-            if end == len(data) - 1:
-                end += 1
-            param = "".join(data[start:end].split())
-            params.append(param)
-            start = end + 1
+    parenthesesCount += {"(": 1, ")": -1}.get(data[-1], 0)
+    if parenthesesCount == 0:
+        params.append("".join(data[start:].split()))
 
     return params
 
 
+parenthesesPattern = re.compile(r"[()]")
+macroArgsPattern = re.compile(r"[(),]")
+
+# patterns matched at the start of a declaration, the name is the one found by the symbol index
+dlPattern = re.compile(r"Gfx\s*\w+\s*\[\s*\w*\s*\]\s*=\s*\{([^\}]*)\}")
+vertexPattern = re.compile(r"Vtx\s*\w+\s*\[\s*[0-9x]*\s*\]\s*=\s*\{([^;]*);", re.DOTALL)
+lightsTypePattern = re.compile(r"Lights[0-9n]")
+lightsPattern = re.compile(r"Lights([0-9n])\s*\w+\s*=\s*gdSPDefLights[0-9]\s*\(([^\)]*)\)\s*;\s*", re.DOTALL)
+texturePattern = re.compile(
+    r"([A-Za-z0-9\_]+)\s*\w+\s*\[\s*[0-9a-zA-Z_\(\),\s]*\s*\]\s*=\s*\{([^\}]*)\s*\}\s*;\s*", re.DOTALL
+)
+matrixPattern = re.compile(r"Mtx\s*(\w+)\s*=\s*\{(.*?)\}\s*;", re.DOTALL)
+matrixIncludePattern = re.compile(r"Mtx\s*(\w+)\s*=\s*(.*?)\s*;", re.DOTALL)
+
+
+class CSymbolIndex:
+    """
+    Declarations (``type name[...] = ...``) and defines of some C source, found in one pass over the data.
+    Lookups only match at the declarations with the requested name instead of searching the whole data.
+    """
+
+    declarationPattern = re.compile(r"\b([A-Za-z_]\w*)\s+([A-Za-z_]\w*)\s*(?:\[[^\]=;{}]*\]\s*)*=")
+    definePattern = re.compile(r"#\s*define\s+(\w+)\s+([0-9a-fA-FxX]*)")
+
+    def __init__(self, data: str):
+        self.data = data
+        # name : [(type, declaration start)], in source order
+        self.declarations: dict[str, list[tuple[str, int]]] = {}
+        for match in self.declarationPattern.finditer(data):
+            self.declarations.setdefault(match.group(2), []).append((match.group(1), match.start()))
+
+        self.defines: dict[str, str] = {}
+        for match in self.definePattern.finditer(data):
+            self.defines.setdefault(match.group(1), match.group(2))
+
+    def match(self, name: str, pattern: re.Pattern, isType: Callable[[str], Any]) -> Optional[re.Match]:
+        """Returns the first match of pattern at a declaration of name with a matching type"""
+
+        for symbolType, start in self.declarations.get(name, ()):
+            if isType(symbolType):
+                matchResult = pattern.match(self.data, start)
+                if matchResult is not None:
+                    return matchResult
+        return None
+
+    def matchAll(self, symbolType: str, pattern: re.Pattern) -> list[re.Match]:
+        """Returns the matches of pattern at every declaration of this type, in source order"""
+
+        starts = sorted(
+            start
+            for declarations in self.declarations.values()
+            for declType, start in declarations
+            if declType == symbolType
+        )
+        matches = []
+        end = 0
+        for start in starts:
+            if start < end:  # inside the previous match
+                continue
+            matchResult = pattern.match(self.data, start)
+            if matchResult is not None:
+                matches.append(matchResult)
+                end = matchResult.end()
+        return matches
+
+
+@functools.lru_cache(maxsize=4)
+def getCSymbolIndex(data: str) -> CSymbolIndex:
+    """The symbol index of this data, built once and reused by all lookups in the same import"""
+    return CSymbolIndex(data)
+
+
 def getImportData(filepaths):
     data = ""
     for path in filepaths:
@@ -2334,11 +2437,12 @@ def getImportData(filepaths):
 
 
 def parseMatrices(sceneData: str, f3dContext: F3DContext, importScale: float = 1):
-    finditer = list(re.finditer(rf"Mtx\s*([a-zA-Z0-9\_]+)\s*=\s*\{{(.*?)\}}\s*;", sceneData, flags=re.DOTALL))
+    symbolIndex = getCSymbolIndex(sceneData)
+    finditer = symbolIndex.matchAll("Mtx", matrixPattern)
 
     # newer assets system
     if len(finditer) == 0:
-        finditer = list(re.finditer(r"Mtx\s*([a-zA-Z0-9\_]+)\s*=\s*(.*?)\s*;", sceneData, flags=re.DOTALL))
+        finditer = symbolIndex.matchAll("Mtx", matrixIncludePattern)
 
     for match in finditer:
         name = "&" + match.group(1)
@@ -0,0 +1,181 @@
+import bpy, hashlib, os
+import numpy as np
+from typing import Callable, Optional
+from bpy.utils import register_class, unregister_class
+
+# bump when the converted data for the same pixels and settings changes, so older entries are never used
+TEXTURE_CACHE_VERSION = 1
+
+
+class TextureCache:
+    """
+    Converted texture and palette data stored on disk across exports, keyed by a hash of the image pixels
+    and the conversion settings. Least recently used entries are removed once the cache grows past maxSize bytes.
+    """
+
+    def __init__(self, directory: str, maxSize: int):
+        self.directory = directory
+        self.maxSize = maxSize
+        self.size: Optional[int] = None  # bytes used on disk, counted on the first write
+
+    def getKey(self, image: bpy.types.Image, settings: tuple) -> str:
+        key = hashlib.blake2b(digest_size=20)
+        key.update(repr((TEXTURE_CACHE_VERSION, tuple(image.size), image.channels, settings)).encode())
+        key.update(getImagePixelHash(image))
+        return key.hexdigest()
+
+    def getPath(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".bin")
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self.getPath(key)
+        try:
+            with open(path, "rb") as cacheFile:
+                data = cacheFile.read()
+            # the modification time is used as the last use time
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def put(self, key: str, data: bytes):
+        path = self.getPath(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path + ".tmp", "wb") as cacheFile:
+                cacheFile.write(data)
+            os.replace(path + ".tmp", path)
+        except OSError:
+            return
+        if self.size is None:
+            self.size = sum(size for _, size, _ in self.getEntries())
+        else:
+            self.size += len(data)
+        if self.size > self.maxSize:
+            self.evict()
+
+    def getEntries(self) -> list[tuple[float, int, str]]:
+        """(last use time, size, path) of every entry"""
+        entries = []
+        try:
+            dirEntries = list(os.scandir(self.directory))
+        except OSError:
+            return entries
+        for entry in dirEntries:
+            if entry.name.endswith(".bin"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def evict(self):
+        entries = sorted(self.getEntries())
+        self.size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self.size <= self.maxSize:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self.size -= size
+
+    def clear(self) -> int:
+        """Removes every entry, returns the number of bytes freed"""
+        freed = 0
+        for _, size, path in self.getEntries():
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            freed += size
+        self.size = 0
+        return freed
+
+
+def getTextureCacheDirectory() -> str:
+    path = os.path.join("fast64", "texture_cache")
+    try:
+        return bpy.utils.user_resource("DATAFILES", path, create=True)
+    except:  # 3.0
+        return bpy.utils.user_resource("DATAFILES", path=path, create=True)
+
+
+textureCaches: dict[tuple[str, int], TextureCache] = {}
+
+# (image pointer, name, size, channels) : digest of the image pixels, so each image is only hashed once per export.
+# Cleared when an export starts, since pixels can be edited between exports without changing anything else.
+imagePixelHashes: dict[tuple[int, str, tuple[int, int], int], bytes] = {}
+
+
+def clearImagePixelHashes():
+    imagePixelHashes.clear()
+
+
+def getImagePixelHash(image: bpy.types.Image) -> bytes:
+    imageKey = (image.as_pointer(), image.name_full, tuple(image.size), image.channels)
+    if imageKey not in imagePixelHashes:
+        pixels = np.empty(len(image.pixels), dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+        imagePixelHashes[imageKey] = hashlib.blake2b(pixels.tobytes(), digest_size=20).digest()
+    return imagePixelHashes[imageKey]
+
+
+def getTextureCache() -> Optional[TextureCache]:
+    """The cache for the current scene's settings, or None if texture caching is disabled"""
+    settings = bpy.context.scene.fast64.settings
+    if not settings.texture_cache_enabled:
+        return None
+    directory = getTextureCacheDirectory()
+    if not directory:
+        return None
+    maxSize = settings.texture_cache_size * 1024 * 1024
+    if (directory, maxSize) not in textureCaches:
+        textureCaches[(directory, maxSize)] = TextureCache(directory, maxSize)
+    return textureCaches[(directory, maxSize)]
+
+
+def cachedTextureConversion(image: bpy.types.Image, settings: tuple, convert: Callable[[], bytes]) -> bytes:
+    """Returns the cached result of convert() for the image's current pixels and these settings, or converts and caches it"""
+    cache = getTextureCache()
+    if cache is None:
+        return convert()
+    key = cache.getKey(image, settings)
+    data = cache.get(key)
+    if data is None:
+        data = convert()
+        cache.put(key, bytes(data))
+    return data
+
+
+class F3D_ClearTextureCache(bpy.types.Operator):
+    bl_idname = "scene.f3d_clear_texture_cache"
+    bl_label = "Clear Texture Cache"
+    bl_description = "Remove all converted textures cached by previous exports"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        directory = getTextureCacheDirectory()
+        if not directory:
+            self.report({"WARNING"}, "No texture cache directory.")
+            return {"CANCELLED"}
+        freed = TextureCache(directory, 0).clear()
+        for cache in textureCaches.values():
+            cache.size = None
+        self.report({"INFO"}, f"Cleared texture cache ({freed / (1024 * 1024):.1f} MB).")
+        return {"FINISHED"}  # must return a set
+
+
+texture_cache_classes = (F3D_ClearTextureCache,)
+
+
+def texture_cache_register():
+    for cls in texture_cache_classes:
+        register_class(cls)
+
+
+def texture_cache_unregister():
+    for cls in reversed(texture_cache_classes):
+        unregister_class(cls)
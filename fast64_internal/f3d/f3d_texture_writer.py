@@ -2,6 +2,7 @@ from typing import Union, Optional
 from dataclasses import dataclass, field
 import bpy
 from math import ceil, floor
+import numpy as np
 
 from .f3d_enums import *
 from .f3d_material import (
@@ -16,6 +17,7 @@ from .f3d_material import (
 from .f3d_gbi import *
 from .f3d_gbi import _DPLoadTextureBlock
 from .flipbook import TextureFlipbook
+from .f3d_texture_cache import cachedTextureConversion
 
 from ..utility import *
 
@@ -1103,62 +1105,67 @@ def savePaletteLoad(
 # Functions for converting and writing texture and palette data
 
 
-def extractConvertCIPixel(image, pixels, i, j, palFormat):
-    color = [1, 1, 1, 1]
-    for field in range(image.channels):
-        color[field] = pixels[(j * image.size[0] + i) * image.channels + field]
+def extractConvertCIPixels(image, palFormat) -> np.ndarray:
+    """The RGBA16 or IA16 color of every pixel (getRGBA16Tuple / getIA16Tuple), in texture order"""
+    if palFormat not in {"RGBA16", "IA16"}:
+        raise PluginError("Internal error, palette format is " + palFormat)
+    colors = np.ones((image.size[0] * image.size[1], 4), dtype=np.float32)
+    channels = min(image.channels, 4)
+    colors[:, :channels] = getTexturePixels(image, channels)
+
     if palFormat == "RGBA16":
-        pixelColor = getRGBA16Tuple(color)
-    elif palFormat == "IA16":
-        pixelColor = getIA16Tuple(color)
+        red, green, blue = (quantizeTextureValues(colors[:, field], 0x1F) for field in range(3))
+        return (red << 11) | (green << 6) | (blue << 1) | (colors[:, 3] > 0.5)
     else:
-        raise PluginError("Internal error, palette format is " + palFormat)
-    return pixelColor
+        intensity = np.round(getTextureLuminance(colors) * 0xFF).astype(np.int64)
+        return (intensity << 8) | np.trunc(colors[:, 3].astype(np.float64) * 0xFF).astype(np.int64)
 
 
 def getColorsUsedInImage(image, palFormat):
-    palette = []
-    # N64 is -Y, Blender is +Y
-    pixels = image.pixels[:]
-    for j in reversed(range(image.size[1])):
-        for i in range(image.size[0]):
-            pixelColor = extractConvertCIPixel(image, pixels, i, j, palFormat)
-            if pixelColor not in palette:
-                palette.append(pixelColor)
-    return palette
+    def convert():
+        # N64 is -Y, Blender is +Y
+        colors, firstIndices = np.unique(extractConvertCIPixels(image, palFormat), return_index=True)
+        # palette is in order of first use
+        return colors[np.argsort(firstIndices)].astype("<i8").tobytes()
+
+    return np.frombuffer(cachedTextureConversion(image, ("Palette", palFormat), convert), dtype="<i8").tolist()
 
 
 def mergePalettes(pal0, pal1):
     palette = [c for c in pal0]
+    colors = set(palette)
     for c in pal1:
-        if c not in palette:
+        if c not in colors:
             palette.append(c)
+            colors.add(c)
     return palette
 
 
 def getColorIndicesOfTexture(image, palette, palFormat):
-    texture = []
+    paletteIndices = {}
+    for index, color in enumerate(palette):
+        paletteIndices.setdefault(color, index)
+
     # N64 is -Y, Blender is +Y
-    pixels = image.pixels[:]
-    for j in reversed(range(image.size[1])):
-        for i in range(image.size[0]):
-            pixelColor = extractConvertCIPixel(image, pixels, i, j, palFormat)
-            if pixelColor not in palette:
-                raise PluginError(f"Bug: {image.name} palette len {len(palette)} missing CI")
-            texture.append(palette.index(pixelColor))
-    return texture
+    colors, texture = np.unique(extractConvertCIPixels(image, palFormat), return_inverse=True)
+    colorIndices = []
+    for pixelColor in colors.tolist():
+        if pixelColor not in paletteIndices:
+            raise PluginError(f"Bug: {image.name} palette len {len(palette)} missing CI")
+        colorIndices.append(paletteIndices[pixelColor])
+    return np.array(colorIndices, dtype=np.int64)[texture.reshape(-1)].tolist()
 
 
 def compactNibbleArray(texture, width, height):
-    nibbleData = bytearray(0)
+    nibbles = np.asarray(texture, dtype=np.int64) & 0xF
     dataSize = int(width * height / 2)
 
-    nibbleData = [((texture[i * 2] & 0xF) << 4) | (texture[i * 2 + 1] & 0xF) for i in range(dataSize)]
+    nibbleData = (nibbles[0 : dataSize * 2 : 2] << 4) | nibbles[1 : dataSize * 2 : 2]
 
     if (width * height) % 2 == 1:
-        nibbleData.append((texture[-1] & 0xF) << 4)
+        nibbleData = np.append(nibbleData, nibbles[-1] << 4)
 
-    return bytearray(nibbleData)
+    return bytearray(nibbleData.astype(np.uint8).tobytes())
 
 
 def writePaletteData(fPalette: FImage, palette: list[int]):
@@ -1179,204 +1186,102 @@ def writeCITextureData(
     if fImage.converted:
         return
 
-    texture = getColorIndicesOfTexture(image, palette, palFmt)
+    def convert():
+        texture = getColorIndicesOfTexture(image, palette, palFmt)
+        if texFmt == "CI4":
+            return compactNibbleArray(texture, image.size[0], image.size[1])
+        else:
+            return bytearray(texture)
 
-    if texFmt == "CI4":
-        fImage.data = compactNibbleArray(texture, image.size[0], image.size[1])
-    else:
-        fImage.data = bytearray(texture)
+    # the texture's indices depend on the whole (possibly shared) palette
+    settings = ("CI", texFmt, palFmt, tuple(palette))
+    fImage.data = bytearray(cachedTextureConversion(image, settings, convert))
     fImage.converted = True
 
 
+def getTexturePixels(image: bpy.types.Image, fieldCount: int = 4) -> np.ndarray:
+    """
+    The image's pixels in texture order (top row first), as one row of fieldCount values per pixel.
+    Pixel fields start every image.channels values, like indexing image.pixels directly.
+    """
+    pixels = np.empty(len(image.pixels), dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    if not np.isfinite(pixels).all():
+        raise PluginError(f"Image {image.name} has pixels that are not finite numbers.")
+    width, height = image.size
+    pixelIndices = np.arange(width * height).reshape((height, width))[::-1].reshape(-1)
+    return pixels[(pixelIndices * image.channels)[:, None] + np.arange(fieldCount)]
+
+
+def quantizeTextureValues(values: np.ndarray, mask: int) -> np.ndarray:
+    """int(round(value * mask)) & mask for every value"""
+    return np.round(values.astype(np.float64) * mask).astype(np.int64) & mask
+
+
+def getTextureLuminance(pixels: np.ndarray) -> np.ndarray:
+    # colorToLuminance goes through mathutils, so it is called once per distinct color for identical results
+    if len(pixels) == 0:
+        return np.empty(0, dtype=np.float64)
+    return mapUniqueRows(pixels[:, :3], lambda color: [colorToLuminance(color)], np.float64)[:, 0]
+
+
 def writeNonCITextureData(image: bpy.types.Image, fImage: FImage, texFmt: str):
     if fImage.converted:
         return
+    fImage.data = bytearray(
+        cachedTextureConversion(image, ("NonCI", texFmt), lambda: convertNonCITexture(image, texFmt))
+    )
+    fImage.converted = True
+
+
+def convertNonCITexture(image: bpy.types.Image, texFmt: str) -> bytearray:
     fmt = texFormatOf[texFmt]
     bitSize = texBitSizeF3D[texFmt]
 
-    pixels = image.pixels[:]
     if fmt == "G_IM_FMT_RGBA":
         if bitSize == "G_IM_SIZ_16b":
-            fImage.data = bytearray(
-                [
-                    byteVal
-                    for doubleByte in [
-                        (
-                            (
-                                ((int(round(pixels[(j * image.size[0] + i) * image.channels + 0] * 0x1F)) & 0x1F) << 3)
-                                | (
-                                    (int(round(pixels[(j * image.size[0] + i) * image.channels + 1] * 0x1F)) & 0x1F)
-                                    >> 2
-                                )
-                            ),
-                            (
-                                ((int(round(pixels[(j * image.size[0] + i) * image.channels + 1] * 0x1F)) & 0x03) << 6)
-                                | (
-                                    (int(round(pixels[(j * image.size[0] + i) * image.channels + 2] * 0x1F)) & 0x1F)
-                                    << 1
-                                )
-                                | (1 if pixels[(j * image.size[0] + i) * image.channels + 3] > 0.5 else 0)
-                            ),
-                        )
-                        for j in reversed(range(image.size[1]))
-                        for i in range(image.size[0])
-                    ]
-                    for byteVal in doubleByte
-                ]
-            )
+            pixels = getTexturePixels(image)
+            red, green, blue = (quantizeTextureValues(pixels[:, field], 0x1F) for field in range(3))
+            alpha = pixels[:, 3] > 0.5
+            texels = [(red << 3) | (green >> 2), ((green & 0x03) << 6) | (blue << 1) | alpha]
         elif bitSize == "G_IM_SIZ_32b":
-            fImage.data = bytearray(
-                [
-                    int(round(pixels[(j * image.size[0] + i) * image.channels + field] * 0xFF)) & 0xFF
-                    for j in reversed(range(image.size[1]))
-                    for i in range(image.size[0])
-                    for field in range(image.channels)
-                ]
-            )
+            texels = [quantizeTextureValues(getTexturePixels(image, image.channels), 0xFF)]
         else:
             raise PluginError("Invalid combo: " + fmt + ", " + bitSize)
 
     elif fmt == "G_IM_FMT_YUV":
         raise PluginError("YUV not yet implemented.")
-        if bitSize == "G_IM_SIZ_16b":
-            pass
-        else:
-            raise PluginError("Invalid combo: " + fmt + ", " + bitSize)
 
     elif fmt == "G_IM_FMT_CI":
         raise PluginError("Internal error, writeNonCITextureData called for CI image.")
 
     elif fmt == "G_IM_FMT_IA":
+        pixels = getTexturePixels(image)
+        luminance = getTextureLuminance(pixels)
         if bitSize == "G_IM_SIZ_4b":
-            fImage.data = bytearray(
-                [
-                    (
-                        (
-                            int(
-                                round(
-                                    colorToLuminance(
-                                        pixels[
-                                            (j * image.size[0] + i)
-                                            * image.channels : (j * image.size[0] + i)
-                                            * image.channels
-                                            + 3
-                                        ]
-                                    )
-                                    * 0x7
-                                )
-                            )
-                            & 0x7
-                        )
-                        << 1
-                    )
-                    | (1 if pixels[(j * image.size[0] + i) * image.channels + 3] > 0.5 else 0)
-                    for j in reversed(range(image.size[1]))
-                    for i in range(image.size[0])
-                ]
-            )
+            texels = [(quantizeTextureValues(luminance, 0x7) << 1) | (pixels[:, 3] > 0.5)]
         elif bitSize == "G_IM_SIZ_8b":
-            fImage.data = bytearray(
-                [
-                    (
-                        (
-                            int(
-                                round(
-                                    colorToLuminance(
-                                        pixels[
-                                            (j * image.size[0] + i)
-                                            * image.channels : (j * image.size[0] + i)
-                                            * image.channels
-                                            + 3
-                                        ]
-                                    )
-                                    * 0xF
-                                )
-                            )
-                            & 0xF
-                        )
-                        << 4
-                    )
-                    | (int(round(pixels[(j * image.size[0] + i) * image.channels + 3] * 0xF)) & 0xF)
-                    for j in reversed(range(image.size[1]))
-                    for i in range(image.size[0])
-                ]
-            )
+            texels = [(quantizeTextureValues(luminance, 0xF) << 4) | quantizeTextureValues(pixels[:, 3], 0xF)]
         elif bitSize == "G_IM_SIZ_16b":
-            fImage.data = bytearray(
-                [
-                    byteVal
-                    for doubleByte in [
-                        (
-                            int(
-                                round(
-                                    colorToLuminance(
-                                        pixels[
-                                            (j * image.size[0] + i)
-                                            * image.channels : (j * image.size[0] + i)
-                                            * image.channels
-                                            + 3
-                                        ]
-                                    )
-                                    * 0xFF
-                                )
-                            )
-                            & 0xFF,
-                            int(round(pixels[(j * image.size[0] + i) * image.channels + 3] * 0xFF)) & 0xFF,
-                        )
-                        for j in reversed(range(image.size[1]))
-                        for i in range(image.size[0])
-                    ]
-                    for byteVal in doubleByte
-                ]
-            )
+            texels = [quantizeTextureValues(luminance, 0xFF), quantizeTextureValues(pixels[:, 3], 0xFF)]
         else:
             raise PluginError("Invalid combo: " + fmt + ", " + bitSize)
     elif fmt == "G_IM_FMT_I":
+        luminance = getTextureLuminance(getTexturePixels(image))
         if bitSize == "G_IM_SIZ_4b":
-            fImage.data = bytearray(
-                [
-                    int(
-                        round(
-                            colorToLuminance(
-                                pixels[
-                                    (j * image.size[0] + i) * image.channels : (j * image.size[0] + i) * image.channels
-                                    + 3
-                                ]
-                            )
-                            * 0xF
-                        )
-                    )
-                    & 0xF
-                    for j in reversed(range(image.size[1]))
-                    for i in range(image.size[0])
-                ]
-            )
+            texels = [quantizeTextureValues(luminance, 0xF)]
         elif bitSize == "G_IM_SIZ_8b":
-            fImage.data = bytearray(
-                [
-                    int(
-                        round(
-                            colorToLuminance(
-                                pixels[
-                                    (j * image.size[0] + i) * image.channels : (j * image.size[0] + i) * image.channels
-                                    + 3
-                                ]
-                            )
-                            * 0xFF
-                        )
-                    )
-                    & 0xFF
-                    for j in reversed(range(image.size[1]))
-                    for i in range(image.size[0])
-                ]
-            )
+            texels = [quantizeTextureValues(luminance, 0xFF)]
         else:
             raise PluginError("Invalid combo: " + fmt + ", " + bitSize)
     else:
         raise PluginError("Invalid image format " + fmt)
 
+    # texels are one or more bytes each, stored in order
+    data = np.concatenate([values.reshape((len(values), -1)) for values in texels], axis=1).reshape(-1).astype(np.uint8)
+
     # We stored 4bit values in byte arrays, now to convert
     if bitSize == "G_IM_SIZ_4b":
-        fImage.data = compactNibbleArray(fImage.data, image.size[0], image.size[1])
-
-    fImage.converted = True
+        return compactNibbleArray(data, image.size[0], image.size[1])
+    else:
+        return bytearray(data.tobytes())
@@ -1,9 +1,10 @@
 from typing import Union, Optional, Callable, Any, List, TypeVar, Generic, cast
 from dataclasses import dataclass
 import functools
-import bpy, mathutils, os, re, copy, math
+import bpy, mathutils, os, re, copy, math, heapq
 from mathutils import Vector
 from math import ceil
+import numpy as np
 from bpy.utils import register_class, unregister_class
 
 from .f3d_enums import *
@@ -65,13 +66,13 @@ class VertexGroupInfo:
 
 
 VG = TypeVar("VG", bound=VertexGroupInfo | None)
+VT = TypeVar("VT", bound="F3DVert")
 
 
 class MeshInfo(Generic[VG]):
     def __init__(self, groupInfo: VG = None) -> None:
         self.vert = {}  # all faces connected to a vert
         self.edge = {}  # all faces connected to an edge
-        self.f3dVert = {}  # f3d vertex of a given loop
         self.edgeValid = {}  # bool given two faces
         self.validNeighbors = {}  # all neighbors of a face with a valid connecting edge
         self.texDimensions = {}  # texture dimensions for each material
@@ -132,6 +133,184 @@ def check_face_materials(
             )
 
 
+def foreachGetArray(collection: bpy.types.bpy_prop_collection, attr: str, width: int, dtype) -> np.ndarray:
+    data = np.empty(len(collection) * width, dtype=dtype)
+    collection.foreach_get(attr, data)
+    return data if width == 1 else data.reshape((-1, width))
+
+
+def getLoopColors(mesh: bpy.types.Mesh) -> np.ndarray:
+    """getLoopColor for every loop of the mesh, as a (loop count, 4) array"""
+    colors = np.ones((len(mesh.loops), 4), dtype=np.float32)
+    if len(mesh.loops) == 0:
+        return colors
+    color_layer = getColorLayer(mesh, layer="Col")
+    alpha_layer = getColorLayer(mesh, layer="Alpha")
+
+    # Gamma correction goes through blender's color management, so it is done per distinct color
+    if color_layer is not None:
+        rgb = foreachGetArray(color_layer, "color", 4, np.float32)[:, :3]
+        colors[:, :3] = mapUniqueRows(rgb, gammaCorrect) if is3_2_or_above() else rgb
+    if alpha_layer is not None:
+        alphaRGB = foreachGetArray(alpha_layer, "color", 4, np.float32)[:, :3]
+        if is3_2_or_above():
+            colors[:, 3] = mapUniqueRows(alphaRGB, lambda color: [colorToLuminance(gammaCorrect(color))])[:, 0]
+        else:
+            colors[:, 3] = mapUniqueRows(alphaRGB, lambda color: [colorToLuminance(color)])[:, 0]
+    return colors
+
+
+class MeshArrays:
+    """
+    Mesh data read in bulk with foreach_get, with the same conversions getF3DVert applies per loop.
+    Indexed by loop index (uvs, normals, colors, loopHas*) or loop triangle index (tri*).
+    """
+
+    def __init__(self, obj: bpy.types.Object, uv_data: bpy.types.bpy_prop_collection):
+        mesh: bpy.types.Mesh = obj.data
+        # N64 is -Y, Blender is +Y
+        uvs = foreachGetArray(uv_data, "uv", 2, np.float32)
+        uvs[np.isnan(uvs)] = 0
+        uvs[:, 1] = 1 - uvs[:, 1]
+        self.uvs = uvs
+
+        # same quantization as getLoopNormal
+        normals = foreachGetArray(mesh.loops, "normal", 3, np.float32).astype(np.float64)
+        self.normals = (np.round(normals * 2**16) / 2**16).astype(np.float32)
+        self.colors = getLoopColors(mesh)
+
+        self.triLoops = foreachGetArray(mesh.loop_triangles, "loops", 3, np.uint32).astype(np.int64)
+        self.triVertices = foreachGetArray(mesh.loop_triangles, "vertices", 3, np.uint32).astype(np.int64)
+        self.triMaterials = foreachGetArray(mesh.loop_triangles, "material_index", 1, np.uint32).astype(np.int64)
+
+        # whether the material a loop is drawn with uses vertex colors / normals
+        self.loopHasRGB = np.zeros(len(mesh.loops), dtype=bool)
+        self.loopHasNormal = np.zeros(len(mesh.loops), dtype=bool)
+        for material_index in np.unique(self.triMaterials).tolist():
+            has_rgb, has_normal, _ = getRgbNormalSettings(obj.material_slots[material_index].material.f3d_mat)
+            loops = self.triLoops[self.triMaterials == material_index]
+            self.loopHasRGB[loops] = has_rgb
+            self.loopHasNormal[loops] = has_normal
+
+    def getLoopCompareRows(self) -> np.ndarray:
+        """
+        One row per loop, two loops of the same vertex have equal rows exactly when their F3DVerts are equal.
+        Positions are left out, since they only depend on the vertex.
+        """
+        hasRGB = self.loopHasRGB[:, np.newaxis]
+        hasNormal = self.loopHasNormal[:, np.newaxis]
+        columns = (
+            self.uvs,
+            hasRGB,
+            np.where(hasRGB, self.colors[:, :3], 0),
+            hasNormal,
+            np.where(hasNormal, self.normals, 0),
+            self.colors[:, 3:],
+        )
+        return np.hstack([column.astype(np.float64) for column in columns])
+
+
+def groupTrianglesByKey(keys: np.ndarray):
+    """
+    keys holds one key per triangle corner, shaped (triangle count, 3).
+    Sorts the (key, triangle) pairs by key then triangle, without repeated pairs.
+    Returns the key, triangle and first corner of each pair, and the start / end of each key's group of pairs.
+    Groups are ordered by first appearance of their key.
+    """
+    flatKeys = keys.ravel()
+    corners = np.arange(len(flatKeys))
+    order = np.lexsort((corners, flatKeys))
+    sortedKeys, sortedCorners = flatKeys[order], corners[order]
+    sortedTriangles = sortedCorners // 3
+
+    isFirst = np.ones(len(order), dtype=bool)
+    isFirst[1:] = (sortedKeys[1:] != sortedKeys[:-1]) | (sortedTriangles[1:] != sortedTriangles[:-1])
+    sortedKeys, sortedTriangles, sortedCorners = sortedKeys[isFirst], sortedTriangles[isFirst], sortedCorners[isFirst]
+
+    starts = np.flatnonzero(np.r_[True, sortedKeys[1:] != sortedKeys[:-1]])
+    ends = np.r_[starts[1:], len(sortedKeys)]
+    groupOrder = np.argsort(sortedCorners[starts], kind="stable")
+    return sortedKeys, sortedTriangles, sortedCorners, starts[groupOrder], ends[groupOrder]
+
+
+def getTrianglePairs(triangles: np.ndarray, corners: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Every pair of triangles within a group from groupTrianglesByKey,
+    as rows of (earlier triangle, later triangle, first corner of the earlier triangle in the group)
+    """
+    sortedStarts = np.sort(starts)
+    sortedEnds = np.r_[sortedStarts[1:], len(triangles)]
+    groupEnds = np.repeat(sortedEnds, sortedEnds - sortedStarts)
+    positions = np.arange(len(triangles))
+
+    pairs = [np.empty((0, 3), dtype=np.int64)]
+    for offset in range(1, int(np.max(ends - starts, initial=0))):
+        first = positions[positions + offset < groupEnds]
+        pairs.append(np.column_stack((triangles[first], triangles[first + offset], corners[first])))
+    return np.concatenate(pairs)
+
+
+def fillMeshInfo(infoDict: MeshInfo, obj: bpy.types.Object, uv_data):
+    """
+    Fills the face adjacency and edge validity of infoDict from the loop triangles of obj.
+    An edge between two faces is valid if both faces would use the same F3DVerts for it.
+    """
+    mesh: bpy.types.Mesh = obj.data
+    meshArrays = MeshArrays(obj, uv_data)
+    faces = list(mesh.loop_triangles)
+    vertexCount = len(mesh.vertices)
+
+    for face in faces:
+        infoDict.validNeighbors[face] = []
+
+    keys, triangles, _, starts, ends = groupTrianglesByKey(meshArrays.triVertices)
+    triangleList = triangles.tolist()
+    for vertIndex, start, end in zip(keys[starts].tolist(), starts.tolist(), ends.tolist()):
+        infoDict.vert[vertIndex] = [faces[triangle] for triangle in triangleList[start:end]]
+
+    # same order as MeshLoopTriangle.edge_keys, each (min, max) key encoded as min * vertexCount + max
+    triVertices = meshArrays.triVertices
+    nextTriVertices = np.roll(triVertices, -1, axis=1)
+    edgeKeys = np.minimum(triVertices, nextTriVertices) * vertexCount + np.maximum(triVertices, nextTriVertices)
+
+    keys, triangles, corners, starts, ends = groupTrianglesByKey(edgeKeys)
+    triangleList = triangles.tolist()
+    for edgeKey, start, end in zip(keys[starts].tolist(), starts.tolist(), ends.tolist()):
+        infoDict.edge[divmod(edgeKey, vertexCount)] = [faces[triangle] for triangle in triangleList[start:end]]
+
+    # Faces sharing more than one edge are compared on the first shared edge of the earlier face
+    pairs = getTrianglePairs(triangles, corners, starts, ends)
+    pairs = pairs[np.lexsort((pairs[:, 2], pairs[:, 1], pairs[:, 0]))]
+    isFirst = np.ones(len(pairs), dtype=bool)
+    isFirst[1:] = (pairs[1:, 0] != pairs[:-1, 0]) | (pairs[1:, 1] != pairs[:-1, 1])
+    pairs = pairs[isFirst]
+    # then visited in the order faces and their edge keys are iterated
+    pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 2], pairs[:, 0]))]
+    faceIndices, otherFaceIndices, pairCorners = pairs[:, 0], pairs[:, 1], pairs[:, 2]
+
+    def getLoopsFromVerts(vertIndices: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+        # first corner of each triangle that uses the vert, like getLoopFromVert
+        vertCorners = np.argmax(triVertices[triangles] == vertIndices[:, np.newaxis], axis=1)
+        return meshArrays.triLoops[triangles, vertCorners]
+
+    compareRows = meshArrays.getLoopCompareRows()
+    pairEdgeKeys = edgeKeys.ravel()[pairCorners]
+    edgeValid = np.ones(len(pairs), dtype=bool)
+    for edgeVerts in (pairEdgeKeys // vertexCount, pairEdgeKeys % vertexCount):
+        loops = getLoopsFromVerts(edgeVerts, faceIndices)
+        otherLoops = getLoopsFromVerts(edgeVerts, otherFaceIndices)
+        edgeValid &= np.all(compareRows[loops] == compareRows[otherLoops], axis=1)
+
+    edgeValidDict = infoDict.edgeValid
+    validNeighborDict = infoDict.validNeighbors
+    for faceIndex, otherFaceIndex, valid in zip(faceIndices.tolist(), otherFaceIndices.tolist(), edgeValid.tolist()):
+        face, otherFace = faces[faceIndex], faces[otherFaceIndex]
+        edgeValidDict[(otherFace, face)] = valid
+        if valid:
+            validNeighborDict[face].append(otherFace)
+            validNeighborDict[otherFace].append(face)
+
+
 def getInfoDict_impl(obj: bpy.types.Object, groupInfo: VG) -> MeshInfo[VG]:
     mesh: bpy.types.Mesh = obj.data
     material_slots = obj.material_slots
@@ -152,12 +331,6 @@ def getInfoDict_impl(obj: bpy.types.Object, groupInfo: VG) -> MeshInfo[VG]:
 
     infoDict = MeshInfo(groupInfo)
 
-    vertDict = infoDict.vert
-    edgeDict = infoDict.edge
-    f3dVertDict = infoDict.f3dVert
-    edgeValidDict = infoDict.edgeValid
-    validNeighborDict = infoDict.validNeighbors
-
     uv_data: bpy.types.bpy_prop_collection | list[bpy.types.MeshUVLoop] = None
     if len(obj.data.uv_layers) == 0:
         uv_data = obj.data.uv_layers.new().data
@@ -168,44 +341,7 @@ def getInfoDict_impl(obj: bpy.types.Object, groupInfo: VG) -> MeshInfo[VG]:
                 uv_data = uv_layer.data
         if uv_data is None:
             raise PluginError("Object '" + get_original_name(obj) + "' does not have a UV layer named 'UVMap.'")
-    for face in mesh.loop_triangles:
-        validNeighborDict[face] = []
-        material = obj.material_slots[face.material_index].material
-        if material is None:
-            raise PluginError(
-                f"There are some faces on your mesh object {get_original_name(obj)}"
-                " that are assigned to an empty material slot."
-            )
-        for vertIndex in face.vertices:
-            if vertIndex not in vertDict:
-                vertDict[vertIndex] = []
-            if face not in vertDict[vertIndex]:
-                vertDict[vertIndex].append(face)
-        for edgeKey in face.edge_keys:
-            if edgeKey not in edgeDict:
-                edgeDict[edgeKey] = []
-            if face not in edgeDict[edgeKey]:
-                edgeDict[edgeKey].append(face)
-
-        for loopIndex in face.loops:
-            convertInfo = LoopConvertInfo(uv_data, obj, obj.material_slots[face.material_index].material)
-            f3dVertDict[loopIndex] = getF3DVert(mesh.loops[loopIndex], face, convertInfo, mesh)
-    for face in mesh.loop_triangles:
-        for edgeKey in face.edge_keys:
-            for otherFace in edgeDict[edgeKey]:
-                if otherFace == face:
-                    continue
-                if (otherFace, face) not in edgeValidDict and (face, otherFace) not in edgeValidDict:
-                    edgeValid = (
-                        f3dVertDict[getLoopFromVert(edgeKey[0], face)]
-                        == f3dVertDict[getLoopFromVert(edgeKey[0], otherFace)]
-                        and f3dVertDict[getLoopFromVert(edgeKey[1], face)]
-                        == f3dVertDict[getLoopFromVert(edgeKey[1], otherFace)]
-                    )
-                    edgeValidDict[(otherFace, face)] = edgeValid
-                    if edgeValid:
-                        validNeighborDict[face].append(otherFace)
-                        validNeighborDict[otherFace].append(face)
+    fillMeshInfo(infoDict, obj, uv_data)
     return infoDict
 
 
@@ -633,18 +769,47 @@ def edgeValid(edgeValidDict, face, otherFace):
         return edgeValidDict[(otherFace, face)]
 
 
-def getLowestUnvisitedNeighborCountFace(unvisitedFaces, infoDict):
-    lowestNeighborFace = unvisitedFaces[0]
-    lowestNeighborCount = len(infoDict.validNeighbors[lowestNeighborFace])
-    for face in unvisitedFaces:
-        neighborCount = len(infoDict.validNeighbors[face])
-        if neighborCount < lowestNeighborCount:
-            lowestNeighborFace = face
-            lowestNeighborCount = neighborCount
-    return lowestNeighborFace
+class NeighborCountQueue:
+    """
+    Finds the unvisited face with the fewest valid neighbors, ties going to the face that comes first in faces.
+    Faces are bucketed by neighbor count, each bucket being a heap of indices into faces.
+    Neighbor counts only ever go down, so outdated entries are skipped lazily when they reach the top of a bucket.
+    """
+
+    def __init__(self, faces: list, validNeighbors: dict, visitedFaces: set):
+        self.faces = faces
+        self.validNeighbors = validNeighbors
+        self.visitedFaces = visitedFaces
+        self.buckets: dict[int, list[int]] = {}
+        for i, face in enumerate(faces):
+            # indices are added in ascending order, which is already a valid heap
+            self.buckets.setdefault(len(validNeighbors[face]), []).append(i)
+        self.minCount = min(self.buckets, default=0)
+
+    def update(self, index: int):
+        """Call after the neighbor count of faces[index] went down"""
+        count = len(self.validNeighbors[self.faces[index]])
+        heapq.heappush(self.buckets.setdefault(count, []), index)
+        self.minCount = min(self.minCount, count)
+
+    def lowest(self):
+        count = self.minCount
+        while True:
+            bucket = self.buckets.get(count, [])
+            while len(bucket) > 0:
+                face = self.faces[bucket[0]]
+                if face not in self.visitedFaces and len(self.validNeighbors[face]) == count:
+                    self.minCount = count
+                    return face
+                heapq.heappop(bucket)
+            count += 1
 
 
 def getNextNeighborFace(faces, face, lastEdgeKey, visitedFaces, possibleFaces, infoDict):
+    """
+    faces and visitedFaces only need to support membership tests.
+    possibleFaces is a stack, the most recently queued unvisited face is the next one to try.
+    """
     if lastEdgeKey is not None:
         handledEdgeKeys = [lastEdgeKey]
         nextEdgeKey = face.edge_keys[(face.edge_keys.index(lastEdgeKey) + 1) % 3]
@@ -663,48 +828,49 @@ def getNextNeighborFace(faces, face, lastEdgeKey, visitedFaces, possibleFaces, i
                     nextFaceAndEdge = (linkedFace, nextEdgeKey)
                 else:
                     # Move face to front of queue
-                    if linkedFace in possibleFaces:
-                        possibleFaces.remove(linkedFace)
-                    possibleFaces.insert(0, linkedFace)
+                    possibleFaces.append(linkedFace)
         handledEdgeKeys.append(nextEdgeKey)
         nextEdgeKey = face.edge_keys[(face.edge_keys.index(nextEdgeKey) + 1) % 3]
     return nextFaceAndEdge
 
 
 def saveTriangleStrip(triConverter, faces, faceSTOffsets, mesh, terminateDL):
-    visitedFaces = []
-    unvisitedFaces = copy.copy(faces)
+    faceIndices = {face: i for i, face in enumerate(faces)}
+    visitedFaces = set()
     possibleFaces = []
+    neighborFace = None
     lastEdgeKey = None
     infoDict = triConverter.triConverterInfo.infoDict
-    neighborFace = getLowestUnvisitedNeighborCountFace(unvisitedFaces, infoDict)
+    neighborCounts = NeighborCountQueue(faces, infoDict.validNeighbors, visitedFaces)
 
     while len(visitedFaces) < len(faces):
         # print(str(len(visitedFaces)) + " " + str(len(bFaces)))
         if neighborFace is None:
+            # faces visited since they were queued are stale
+            while len(possibleFaces) > 0 and possibleFaces[-1] in visitedFaces:
+                possibleFaces.pop()
             if len(possibleFaces) > 0:
                 # print("get neighbor from queue")
-                neighborFace = possibleFaces[0]
+                neighborFace = possibleFaces[-1]
                 lastEdgeKey = None
                 possibleFaces = []
             else:
                 # print('get new neighbor')
-                neighborFace = getLowestUnvisitedNeighborCountFace(unvisitedFaces, infoDict)
+                neighborFace = neighborCounts.lowest()
                 lastEdgeKey = None
 
-        stOffset = None if faceSTOffsets is None else faceSTOffsets[faces.index(neighborFace)]
+        stOffset = None if faceSTOffsets is None else faceSTOffsets[faceIndices[neighborFace]]
         triConverter.addFace(neighborFace, stOffset)
         if neighborFace in visitedFaces:
             raise PluginError("Repeated face")
-        visitedFaces.append(neighborFace)
-        unvisitedFaces.remove(neighborFace)
-        if neighborFace in possibleFaces:
-            possibleFaces.remove(neighborFace)
+        visitedFaces.add(neighborFace)
         for otherFace in infoDict.validNeighbors[neighborFace]:
             infoDict.validNeighbors[otherFace].remove(neighborFace)
+            if otherFace in faceIndices and otherFace not in visitedFaces:
+                neighborCounts.update(faceIndices[otherFace])
 
         neighborFace, lastEdgeKey = getNextNeighborFace(
-            faces, neighborFace, lastEdgeKey, visitedFaces, possibleFaces, infoDict
+            faceIndices, neighborFace, lastEdgeKey, visitedFaces, possibleFaces, infoDict
         )
 
     triConverter.finish(terminateDL)
@@ -758,6 +924,17 @@ class F3DVert:
             and self.alpha == other.alpha
         )
 
+    def key(self) -> tuple:
+        """Hashable key that is equal for equal verts, used to index vertex buffers by value"""
+        return (
+            tuple(self.position),
+            tuple(self.uv),
+            self.stOffset,
+            None if self.rgb is None else tuple(self.rgb),
+            None if self.normal is None else tuple(self.normal),
+            self.alpha,
+        )
+
     def convertPosition(self, transformMatrix: Matrix) -> list[int]:
         return [int(round(floatValue)) for floatValue in (transformMatrix @ self.position)]
 
@@ -780,11 +957,13 @@ class F3DVert:
         ]
         return uv
 
-    def convertNormalRGB(self, transformMatrix: Matrix):
+    def convertNormalRGB(self, transformMatrix: Matrix, normalMatrix: Optional[Matrix] = None):
         packedNormal = 0
         if self.normal is not None:
             # normal transformed correctly.
-            normal = (transformMatrix.inverted().transposed() @ self.normal).normalized()
+            if normalMatrix is None:
+                normalMatrix = transformMatrix.inverted().transposed()
+            normal = (normalMatrix @ self.normal).normalized()
             if self.rgb is not None:
                 packedNormal = packNormal(normal)
 
@@ -800,15 +979,96 @@ class F3DVert:
 
         return colorOrNormal, packedNormal
 
-    def toVtx(self, mesh, texDimensions, transformMatrix, isPointSampled: bool, tex_scale=(1, 1)) -> Vtx:
+    def toVtx(
+        self,
+        mesh,
+        texDimensions,
+        transformMatrix,
+        isPointSampled: bool,
+        tex_scale=(1, 1),
+        normalMatrix: Optional[Matrix] = None,
+    ) -> Vtx:
         # Position (8 bytes)
         position = self.convertPosition(transformMatrix)
         uv = self.convertUV(texDimensions, isPointSampled, tex_scale)
-        colorOrNormal, packedNormal = self.convertNormalRGB(transformMatrix)
+        colorOrNormal, packedNormal = self.convertNormalRGB(transformMatrix, normalMatrix)
 
         return Vtx(position, uv, colorOrNormal, packedNormal)
 
 
+def quantizeF3DVerts(
+    f3dVerts: list[F3DVert], texDimensions, transformMatrix: Matrix, isPointSampled: bool, tex_scale=(1, 1)
+) -> Optional[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    F3DVert.toVtx for a whole load of vertices sharing a transform, as (positions, uvs, colorOrNormals, packedNormals)
+    rows for VtxList.extend_arrays. Returns None for values toVtx would raise on, so the caller can convert per vertex.
+    """
+    count = len(f3dVerts)
+    hasRGB = np.array([f3dVert.rgb is not None for f3dVert in f3dVerts], dtype=bool)
+    hasNormal = np.array([f3dVert.normal is not None for f3dVert in f3dVerts], dtype=bool)
+    if not (hasRGB | hasNormal).all():
+        return None
+
+    # mathutils works in single precision, so transform in float32 like convertPosition and convertNormalRGB
+    matrix = np.array(transformMatrix, dtype=np.float32)
+    positions = np.array([f3dVert.position for f3dVert in f3dVerts], dtype=np.float32).reshape((count, 3))
+    positions = (positions @ matrix[:3, :3].T + matrix[:3, 3]).astype(np.float64)
+
+    defaultOffset = (
+        (0, 0)
+        if (isPointSampled or tex_scale[0] == 0 or tex_scale[1] == 0)
+        else (0.5 / tex_scale[0], 0.5 / tex_scale[1])
+    )
+    pixelOffsets = np.array(
+        [f3dVert.stOffset if f3dVert.stOffset is not None else defaultOffset for f3dVert in f3dVerts], dtype=np.float64
+    )
+    uvs = np.array([f3dVert.uv for f3dVert in f3dVerts], dtype=np.float64)
+    uvs = (uvs * np.array(texDimensions[:2], dtype=np.float64) - pixelOffsets) * 2**5
+
+    # normals are transformed by the inverse transpose, a zero length normal becomes nan and is left to toVtx
+    normalMatrix = np.array(transformMatrix.inverted().transposed(), dtype=np.float32)[:3, :3]
+    normals = np.zeros((count, 3), dtype=np.float32)
+    if hasNormal.any():
+        transformed = np.array(
+            [f3dVert.normal for f3dVert in f3dVerts if f3dVert.normal is not None], dtype=np.float32
+        ).reshape((-1, 3))
+        transformed = transformed @ normalMatrix.T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normals[hasNormal] = transformed / np.linalg.norm(transformed, axis=1, keepdims=True)
+    normals = normals.astype(np.float64)
+    if not np.isfinite(normals).all():
+        return None
+
+    # the rows of colorOrNormal are either the rgb color, or the transformed normal when there is no color
+    rgbs = np.array([f3dVert.rgb if f3dVert.rgb is not None else (0, 0, 0) for f3dVert in f3dVerts], dtype=np.float64)
+    colorsOrNormals = np.where(hasRGB[:, None], rgbs.reshape((count, 3)), normals)
+    packedNormals = np.zeros(count, dtype=np.int64)
+    if (hasRGB & hasNormal).any():
+        packedNormals[hasRGB & hasNormal] = packNormals(normals[hasRGB & hasNormal])
+    alphas = np.array([f3dVert.alpha for f3dVert in f3dVerts], dtype=np.float64)
+
+    if not all(np.isfinite(values).all() for values in (positions, uvs, colorsOrNormals, alphas)):
+        return None
+    positions = np.round(positions.reshape((count, 3))).astype(np.int64)
+    uvs = np.round(uvs.reshape((count, 2))).astype(np.int64)
+    colorOrNormals = np.empty((count, 4), dtype=np.int64)
+    colorOrNormals[:, :3] = np.where(
+        hasRGB[:, None],
+        np.minimum(np.round(colorsOrNormals * 0xFF), 0xFF),
+        np.round(colorsOrNormals * 127),
+    )
+    colorOrNormals[:, 3] = np.minimum(np.round(alphas * 0xFF), 0xFF)
+
+    # toVtx raises for colors below 0, and for normals outside of a signed byte
+    signedNormals = colorOrNormals[~hasRGB, :3]
+    if (colorOrNormals[hasRGB] < 0).any() or (colorOrNormals[:, 3] < 0).any():
+        return None
+    if ((signedNormals < -128) | (signedNormals > 127)).any():
+        return None
+    colorOrNormals[~hasRGB, :3] = signedNormals & 0xFF
+    return positions, uvs, colorOrNormals, packedNormals
+
+
 # groupIndex is either a vertex group (writing), or name of c variable identifying a transform group, like a limb (parsing)
 class BufferVertex:
     def __init__(self, f3dVert: F3DVert, groupIndex: int | str, materialIndex: int):
@@ -825,6 +1085,9 @@ class BufferVertex:
             and self.materialIndex == other.materialIndex
         )
 
+    def key(self) -> tuple:
+        return (self.f3dVert.key(), self.groupIndex, self.materialIndex)
+
 
 class TriangleConverterInfo:
     def __init__(self, obj, armature, f3d, transformMatrix, infoDict):
@@ -912,6 +1175,13 @@ class TriangleConverter:
             self.vertBuffer: list[BufferVertex] = existingVertexData
         self.existingVertexMaterialRegions = existingVertexMaterialRegions
         self.bufferStart = len(self.vertBuffer)
+
+        # Vertex key indices, so buffer lookups don't have to compare every vert.
+        # The existing region never changes, the rest is kept in sync by setVertBuffer / extendVertBuffer.
+        self.existingVertIndices: dict[tuple, list[int]] = {}
+        for i, bufferVert in enumerate(self.vertBuffer):
+            self.existingVertIndices.setdefault(bufferVert.key(), []).append(i)
+        self.vertIndices: dict[tuple, int] = {}
         self.vertexBufferTriangles = []  # [(index0, index1, index2)]
 
         self.triGroup = triGroup
@@ -925,16 +1195,31 @@ class TriangleConverter:
         self.isPointSampled = isTexturePointSampled(material)
         self.tex_scale = material.f3d_mat.tex_scale
 
-    def vertInBuffer(self, bufferVert, material_index):
-        if self.existingVertexMaterialRegions is None:
-            return bufferVert in self.vertBuffer
-        else:
-            if material_index in self.existingVertexMaterialRegions:
-                matRegion = self.existingVertexMaterialRegions[material_index]
-                if bufferVert in self.vertBuffer[matRegion[0] : matRegion[1]]:
-                    return True
+    def vertInBuffer(self, bufferVert, material_index, key: tuple | None = None):
+        key = bufferVert.key() if key is None else key
+        if key in self.vertIndices:
+            return True
 
-            return bufferVert in self.vertBuffer[self.bufferStart :]
+        existingIndices = self.existingVertIndices.get(key)
+        if existingIndices is None:
+            return False
+        if self.existingVertexMaterialRegions is None:
+            return True
+        if material_index in self.existingVertexMaterialRegions:
+            matRegion = self.existingVertexMaterialRegions[material_index]
+            return any(matRegion[0] <= i < matRegion[1] for i in existingIndices)
+        return False
+
+    def setVertBuffer(self, bufferVerts: list[BufferVertex]):
+        """Replaces everything after the existing region of the vertex buffer"""
+        self.vertBuffer = self.vertBuffer[: self.bufferStart]
+        self.vertIndices = {}
+        self.extendVertBuffer(bufferVerts)
+
+    def extendVertBuffer(self, bufferVerts: list[BufferVertex]):
+        for bufferVert in bufferVerts:
+            self.vertIndices.setdefault(bufferVert.key(), len(self.vertBuffer))
+            self.vertBuffer.append(bufferVert)
 
     def getSortedBuffer(self) -> dict[int, list[BufferVertex]]:
         limbVerts: dict[int, list[BufferVertex]] = {}
@@ -953,6 +1238,32 @@ class TriangleConverter:
         )
         return bufferVert
 
+    def saveVertices(self, bufferVerts: list[BufferVertex], groupIndex: int):
+        """Converts one load of vertices, all in the same group, into the vertex list"""
+        transformMatrix = self.triConverterInfo.getTransformMatrix(groupIndex)
+        f3dVerts = [bufferVert.f3dVert for bufferVert in bufferVerts]
+        quantized = None
+        if all(type(f3dVert).toVtx is F3DVert.toVtx for f3dVert in f3dVerts):
+            quantized = quantizeF3DVerts(
+                f3dVerts, self.texDimensions, transformMatrix, self.isPointSampled, self.tex_scale
+            )
+        if quantized is not None:
+            self.vtxList.extend_arrays(*quantized)
+            return
+
+        normalMatrix = transformMatrix.inverted().transposed()
+        for f3dVert in f3dVerts:
+            self.vtxList.vertices.append(
+                f3dVert.toVtx(
+                    self.triConverterInfo.mesh,
+                    self.texDimensions,
+                    transformMatrix,
+                    self.isPointSampled,
+                    tex_scale=self.tex_scale,
+                    normalMatrix=normalMatrix,
+                )
+            )
+
     def processGeometry(self):
         # Sort verts by limb index, then load current limb verts
         bufferStart = self.bufferStart
@@ -961,28 +1272,18 @@ class TriangleConverter:
 
         if self.currentGroupIndex in limbVerts:
             currentLimbVerts = limbVerts[self.currentGroupIndex]
-            self.vertBuffer = self.vertBuffer[: self.bufferStart] + currentLimbVerts
+            self.setVertBuffer(currentLimbVerts)
             self.triList.commands.append(
-                SPVertex(self.vtxList, len(self.vtxList.vertices), len(currentLimbVerts), self.bufferStart)
+                SPVertex(self.vtxList, self.vtxList.vertex_count(), len(currentLimbVerts), self.bufferStart)
             )
             bufferEnd += len(currentLimbVerts)
             del limbVerts[self.currentGroupIndex]
 
-            # Save vertices
-            for bufferVert in self.vertBuffer[bufferStart:bufferEnd]:
-                self.vtxList.vertices.append(
-                    bufferVert.f3dVert.toVtx(
-                        self.triConverterInfo.mesh,
-                        self.texDimensions,
-                        self.triConverterInfo.getTransformMatrix(bufferVert.groupIndex),
-                        self.isPointSampled,
-                        tex_scale=self.tex_scale,
-                    )
-                )
+            self.saveVertices(self.vertBuffer[bufferStart:bufferEnd], self.currentGroupIndex)
 
             bufferStart = bufferEnd
         else:
-            self.vertBuffer = self.vertBuffer[: self.bufferStart]
+            self.setVertBuffer([])
 
         # Load other limb verts
         for groupIndex, bufferVerts in limbVerts.items():
@@ -992,23 +1293,13 @@ class TriangleConverter:
                 )
                 self.currentGroupIndex = groupIndex
             self.triList.commands.append(
-                SPVertex(self.vtxList, len(self.vtxList.vertices), len(bufferVerts), bufferStart)
+                SPVertex(self.vtxList, self.vtxList.vertex_count(), len(bufferVerts), bufferStart)
             )
 
-            self.vertBuffer += bufferVerts
+            self.extendVertBuffer(bufferVerts)
             bufferEnd += len(bufferVerts)
 
-            # Save vertices
-            for bufferVert in self.vertBuffer[bufferStart:bufferEnd]:
-                self.vtxList.vertices.append(
-                    bufferVert.f3dVert.toVtx(
-                        self.triConverterInfo.mesh,
-                        self.texDimensions,
-                        self.triConverterInfo.getTransformMatrix(bufferVert.groupIndex),
-                        self.isPointSampled,
-                        tex_scale=self.tex_scale,
-                    )
-                )
+            self.saveVertices(self.vertBuffer[bufferStart:bufferEnd], groupIndex)
 
             bufferStart = bufferEnd
 
@@ -1134,21 +1425,22 @@ class TriangleConverter:
 
             bufferVert = self.getBufferVert(loop, face, vertexGroup)
             bufferVert.f3dVert.stOffset = stOffset
+            key = bufferVert.key()
             triIndices.append(bufferVert)
-            if not self.vertInBuffer(bufferVert, face.material_index):
+            if not self.vertInBuffer(bufferVert, face.material_index, key):
                 addedVerts.append(bufferVert)
 
-            if bufferVert not in self.vertBuffer[: self.bufferStart]:
+            if key not in self.existingVertIndices:
                 allVerts.append(bufferVert)
 
         # We care only about load size, since loading is what takes up time.
         # Even if vert_buffer is larger, its still another load to fill it.
         if len(self.vertBuffer) + len(addedVerts) > self.triConverterInfo.f3d.vert_load_size:
             self.processGeometry()
-            self.vertBuffer = self.vertBuffer[: self.bufferStart] + allVerts
+            self.setVertBuffer(allVerts)
             self.vertexBufferTriangles = [triIndices]
         else:
-            self.vertBuffer.extend(addedVerts)
+            self.extendVertBuffer(addedVerts)
             self.vertexBufferTriangles.append(triIndices)
 
     def finish(self, terminateDL):
@@ -1161,9 +1453,6 @@ class TriangleConverter:
             self.triList.commands.append(SPEndDisplayList())
 
 
-VT = TypeVar("VT", bound="F3DVert")
-
-
 def getF3DVert(
     loop: bpy.types.MeshLoop,
     face,
@@ -1277,11 +1566,15 @@ def getLoopColor(loop: bpy.types.MeshLoop, mesh: bpy.types.Mesh) -> Vector:
 
 
 def createTriangleCommands(triangles, vertexBuffer, useSP2Triangle):
-    triangles = copy.deepcopy(triangles)
     commands = []
 
+    # first index of each vert in the buffer, same as vertexBuffer.index(v)
+    bufferIndices = {}
+    for i, bufferVert in enumerate(vertexBuffer):
+        bufferIndices.setdefault(bufferVert.key(), i)
+
     def getIndices(tri):
-        return [vertexBuffer.index(v) for v in tri]
+        return [bufferIndices[v.key()] for v in tri]
 
     t = 0
     while t < len(triangles):
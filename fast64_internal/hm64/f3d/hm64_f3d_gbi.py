@@ -2044,30 +2044,30 @@ class GfxFormatter:
 
         data = CScrollData()
         data.functionCalls.append(funcName)
-        data.header += f"extern {func};\n"
-        data.source += f"{func} {{\n"
+        data.append_header(f"extern {func};\n")
+        data.append_source(f"{func} {{\n")
 
-        variables = ""
-        code = ""
+        variables = []
+        code = []
         dataIndex = 0
 
         # Since some commands are actually multiple commands in one, we have to use the command size and divide by GFX_SIZE.
         for command in gfxList.commands:
             gfxVariables, gfxCode = self.processGfxScrollCommand(dataIndex // GFX_SIZE, command, gfxList.name)
-            variables += gfxVariables
-            code += gfxCode
+            variables.append(gfxVariables)
+            code.append(gfxCode)
             dataIndex += command.size(f3d)
-        gfxScrollCode = variables + code
+        gfxScrollCode = "".join(variables) + "".join(code)
 
         if gfxScrollCode == "":
             return CScrollData()
         else:
             if self.seg2virtFuncName is not None:
-                data.source += f"\tGfx *mat = {self.seg2virtFuncName}({gfxList.name});\n"
+                data.append_source(f"\tGfx *mat = {self.seg2virtFuncName}({gfxList.name});\n")
             else:
-                data.source += f"\tGfx *mat = {gfxList.name};\n"
-            data.source += gfxScrollCode
-            data.source += f"\n}};\n\n"
+                data.append_source(f"\tGfx *mat = {gfxList.name};\n")
+            data.append_source(gfxScrollCode)
+            data.append_source(f"\n}};\n\n")
             return data
 
     def processGfxScrollCommand(self, commandIndex: int, command: "GbiMacro", gfxListName: str) -> Tuple[str, str]:
@@ -2155,8 +2155,8 @@ class VtxList:
         data.header = f"extern Vtx {self.name}[{len(self.vertices)}];\n"
         data.source = f"Vtx {self.name}[{len(self.vertices)}] = {{\n"
         for vert in self.vertices:
-            data.source += f"\t{vert.to_c()},\n"
-        data.source += "};\n\n"
+            data.append_source(f"\t{vert.to_c()},\n")
+        data.append_source("};\n\n")
         return data
 
     def toO2R(self, folderPath: str):
@@ -2749,11 +2749,11 @@ class FModel:
         staticData.append(self.to_c_lights())
 
         texData = self.to_c_textures(texCSeparate, savePNG, texDir, gfxFormatter.texArrayBitSize)
-        staticData.header += texData.header
+        staticData.append_header(texData.header)
         if texCSeparate:
-            texC.source += texData.source
+            texC.append_source(texData.source)
         else:
-            staticData.source += texData.source
+            staticData.append_source(texData.source)
 
         dynamicData.append(self.to_c_materials(gfxFormatter))
 
@@ -2786,12 +2786,12 @@ class FModel:
             data.append(gfxScrollData)
 
         data.topLevelScrollFunc = f"scroll_{funcName}"
-        data.source += f"void {data.topLevelScrollFunc}() {{\n"
+        data.append_source(f"void {data.topLevelScrollFunc}() {{\n")
         for scrollFunc in data.functionCalls:
-            data.source += f"\t{scrollFunc}();\n"
-        data.source += f"}};\n"
+            data.append_source(f"\t{scrollFunc}();\n")
+        data.append_source(f"}};\n")
 
-        data.header += f"extern void {data.topLevelScrollFunc}();\n"
+        data.append_header(f"extern void {data.topLevelScrollFunc}();\n")
         return data
 
     def to_c_vertex_scroll(self, gfxFormatter: GfxFormatter) -> CScrollData:
@@ -2820,7 +2820,7 @@ class FModel:
 
     def save_textures(self, exportPath):
         # TODO: Saving texture should come from FImage
-        texturesSaved = 0
+        images = []
         for imageKey, fImage in self.textures.items():
             if isinstance(imageKey, FPaletteKey):
                 continue
@@ -2828,23 +2828,8 @@ class FModel:
 
             # remove '.inc.c'
             imageFileName = fImage.filename[:-6] + ".png"
-
-            image = imageKey.image
-            isPacked = image.packed_file is not None
-            if not isPacked:
-                image.pack()
-            oldpath = image.filepath
-            try:
-                image.filepath = bpy.path.abspath(os.path.join(exportPath, imageFileName))
-                image.save()
-                texturesSaved += 1
-                if not isPacked:
-                    image.unpack()
-            except Exception as e:
-                image.filepath = oldpath
-                raise Exception(str(e))
-            image.filepath = oldpath
-        return texturesSaved
+            images.append((imageKey.image, bpy.path.abspath(os.path.join(exportPath, imageFileName))))
+        return saveImagesAsPNG(images)
 
     def freePalettes(self):
         pass
@@ -3325,10 +3310,10 @@ class Lights:
         data = CData()
         data.header = f"extern Lights{str(len(self.l))} {self.name};\n"
         data.source = f"Lights{str(len(self.l))} {self.name} = gdSPDefLights{str(len(self.l))}(\n"
-        data.source += "\t" + self.a.to_c()
+        data.append_source("\t" + self.a.to_c())
         for light in self.l:
-            data.source += ",\n\t" + light.to_c()
-        data.source += ");\n\n"
+            data.append_source(",\n\t" + light.to_c())
+        data.append_source(");\n\n")
         return data
 
 
@@ -3404,9 +3389,9 @@ class FImage:
         # This is to force 8 byte alignment
         if bitsPerValue != 64:
             code.source = f"Gfx {self.aligner_name}[] = {{gsSPEndDisplayList()}};\n"
-        code.source += f"u{str(bitsPerValue)} {self.name}[] = {{\n\t"
-        code.source += texData
-        code.source += "\n};\n\n"
+        code.append_source(f"u{str(bitsPerValue)} {self.name}[] = {{\n\t")
+        code.append_source(texData)
+        code.append_source("\n};\n\n")
         return code
 
     def to_c_data(self, bitsPerValue):
@@ -21,6 +21,9 @@ from ..f3d.f3d_material_hm64 import is_hm64_feature_set
 from ..f3d.f3d_texture_writer_hm64 import resolveAddressingSize, syncMaterialReferenceSizes
 from ..f3d.hm64_bleed import get_geo_cmds
 from ...f3d.f3d_writer import (
+    NeighborCountQueue,
+    fillMeshInfo,
+    getNextNeighborFace,
     exportF3DtoC as shared_exportF3DtoC,
     getWriteMethodFromEnum as shared_getWriteMethodFromEnum,
     removeDL as shared_removeDL,
@@ -75,7 +78,6 @@ class MeshInfo:
     def __init__(self):
         self.vert = {}  # all faces connected to a vert
         self.edge = {}  # all faces connected to an edge
-        self.f3dVert = {}  # f3d vertex of a given loop
         self.edgeValid = {}  # bool given two faces
         self.validNeighbors = {}  # all neighbors of a face with a valid connecting edge
         self.texDimensions = {}  # texture dimensions for each material
@@ -154,12 +156,6 @@ def getInfoDict_impl(obj: bpy.types.Object, groupInfo=None):
     infoDict = MeshInfo()
     infoDict.vertexGroupInfo = groupInfo
 
-    vertDict = infoDict.vert
-    edgeDict = infoDict.edge
-    f3dVertDict = infoDict.f3dVert
-    edgeValidDict = infoDict.edgeValid
-    validNeighborDict = infoDict.validNeighbors
-
     uv_data: bpy.types.bpy_prop_collection | list[bpy.types.MeshUVLoop] = None
     if len(obj.data.uv_layers) == 0:
         uv_data = obj.data.uv_layers.new().data
@@ -170,44 +166,7 @@ def getInfoDict_impl(obj: bpy.types.Object, groupInfo=None):
                 uv_data = uv_layer.data
         if uv_data is None:
             raise PluginError("Object '" + get_original_name(obj) + "' does not have a UV layer named 'UVMap.'")
-    for face in mesh.loop_triangles:
-        validNeighborDict[face] = []
-        material = obj.material_slots[face.material_index].material
-        if material is None:
-            raise PluginError(
-                f"There are some faces on your mesh object {get_original_name(obj)}"
-                " that are assigned to an empty material slot."
-            )
-        for vertIndex in face.vertices:
-            if vertIndex not in vertDict:
-                vertDict[vertIndex] = []
-            if face not in vertDict[vertIndex]:
-                vertDict[vertIndex].append(face)
-        for edgeKey in face.edge_keys:
-            if edgeKey not in edgeDict:
-                edgeDict[edgeKey] = []
-            if face not in edgeDict[edgeKey]:
-                edgeDict[edgeKey].append(face)
-
-        for loopIndex in face.loops:
-            convertInfo = LoopConvertInfo(uv_data, obj, obj.material_slots[face.material_index].material)
-            f3dVertDict[loopIndex] = getF3DVert(mesh.loops[loopIndex], face, convertInfo, mesh)
-    for face in mesh.loop_triangles:
-        for edgeKey in face.edge_keys:
-            for otherFace in edgeDict[edgeKey]:
-                if otherFace == face:
-                    continue
-                if (otherFace, face) not in edgeValidDict and (face, otherFace) not in edgeValidDict:
-                    edgeValid = (
-                        f3dVertDict[getLoopFromVert(edgeKey[0], face)]
-                        == f3dVertDict[getLoopFromVert(edgeKey[0], otherFace)]
-                        and f3dVertDict[getLoopFromVert(edgeKey[1], face)]
-                        == f3dVertDict[getLoopFromVert(edgeKey[1], otherFace)]
-                    )
-                    edgeValidDict[(otherFace, face)] = edgeValid
-                    if edgeValid:
-                        validNeighborDict[face].append(otherFace)
-                        validNeighborDict[otherFace].append(face)
+    fillMeshInfo(infoDict, obj, uv_data)
     return infoDict
 
 
@@ -641,79 +600,44 @@ def edgeValid(edgeValidDict, face, otherFace):
         return edgeValidDict[(otherFace, face)]
 
 
-def getLowestUnvisitedNeighborCountFace(unvisitedFaces, infoDict):
-    lowestNeighborFace = unvisitedFaces[0]
-    lowestNeighborCount = len(infoDict.validNeighbors[lowestNeighborFace])
-    for face in unvisitedFaces:
-        neighborCount = len(infoDict.validNeighbors[face])
-        if neighborCount < lowestNeighborCount:
-            lowestNeighborFace = face
-            lowestNeighborCount = neighborCount
-    return lowestNeighborFace
-
-
-def getNextNeighborFace(faces, face, lastEdgeKey, visitedFaces, possibleFaces, infoDict):
-    if lastEdgeKey is not None:
-        handledEdgeKeys = [lastEdgeKey]
-        nextEdgeKey = face.edge_keys[(face.edge_keys.index(lastEdgeKey) + 1) % 3]
-    else:
-        handledEdgeKeys = []
-        nextEdgeKey = face.edge_keys[0]
-
-    nextFaceAndEdge = (None, None)
-    while nextEdgeKey not in handledEdgeKeys:
-        for linkedFace in infoDict.edge[nextEdgeKey]:
-            if linkedFace == face or linkedFace not in faces:
-                continue
-            elif edgeValid(infoDict.edgeValid, linkedFace, face) and linkedFace not in visitedFaces:
-                if nextFaceAndEdge[0] is None:
-                    # print(nextLoop.face)
-                    nextFaceAndEdge = (linkedFace, nextEdgeKey)
-                else:
-                    # Move face to front of queue
-                    if linkedFace in possibleFaces:
-                        possibleFaces.remove(linkedFace)
-                    possibleFaces.insert(0, linkedFace)
-        handledEdgeKeys.append(nextEdgeKey)
-        nextEdgeKey = face.edge_keys[(face.edge_keys.index(nextEdgeKey) + 1) % 3]
-    return nextFaceAndEdge
-
-
 def saveTriangleStrip(triConverter, faces, faceSTOffsets, mesh, terminateDL):
-    visitedFaces = []
-    unvisitedFaces = copy.copy(faces)
+    faceIndices = {face: i for i, face in enumerate(faces)}
+    visitedFaces = set()
     possibleFaces = []
+    neighborFace = None
     lastEdgeKey = None
     infoDict = triConverter.triConverterInfo.infoDict
-    neighborFace = getLowestUnvisitedNeighborCountFace(unvisitedFaces, infoDict)
+    neighborCounts = NeighborCountQueue(faces, infoDict.validNeighbors, visitedFaces)
 
     while len(visitedFaces) < len(faces):
         # print(str(len(visitedFaces)) + " " + str(len(bFaces)))
         if neighborFace is None:
+            # faces visited since they were queued are stale
+            while len(possibleFaces) > 0 and possibleFaces[-1] in visitedFaces:
+                possibleFaces.pop()
             if len(possibleFaces) > 0:
                 # print("get neighbor from queue")
-                neighborFace = possibleFaces[0]
+                neighborFace = possibleFaces[-1]
                 lastEdgeKey = None
                 possibleFaces = []
             else:
                 # print('get new neighbor')
-                neighborFace = getLowestUnvisitedNeighborCountFace(unvisitedFaces, infoDict)
+                neighborFace = neighborCounts.lowest()
                 lastEdgeKey = None
 
-        stOffset = None if faceSTOffsets is None else faceSTOffsets[faces.index(neighborFace)]
+        stOffset = None if faceSTOffsets is None else faceSTOffsets[faceIndices[neighborFace]]
         triConverter.addFace(neighborFace, stOffset)
         if neighborFace in visitedFaces:
             raise PluginError("Repeated face")
-        visitedFaces.append(neighborFace)
-        unvisitedFaces.remove(neighborFace)
-        if neighborFace in possibleFaces:
-            possibleFaces.remove(neighborFace)
+        visitedFaces.add(neighborFace)
         for otherFace in infoDict.validNeighbors[neighborFace]:
             if neighborFace in infoDict.validNeighbors[otherFace]:
                 infoDict.validNeighbors[otherFace].remove(neighborFace)
+                if otherFace in faceIndices and otherFace not in visitedFaces:
+                    neighborCounts.update(faceIndices[otherFace])
 
         neighborFace, lastEdgeKey = getNextNeighborFace(
-            faces, neighborFace, lastEdgeKey, visitedFaces, possibleFaces, infoDict
+            faceIndices, neighborFace, lastEdgeKey, visitedFaces, possibleFaces, infoDict
         )
 
     triConverter.finish(terminateDL)
@@ -817,6 +741,17 @@ class F3DVert:
             and self.alpha == other.alpha
         )
 
+    def key(self) -> tuple:
+        """Hashable key that is equal for equal verts, used to index vertex buffers by value"""
+        return (
+            tuple(self.position),
+            tuple(self.uv),
+            self.stOffset,
+            None if self.rgb is None else tuple(self.rgb),
+            None if self.normal is None else tuple(self.normal),
+            self.alpha,
+        )
+
     def toVtx(self, mesh, texDimensions, transformMatrix, isPointSampled: bool, tex_scale=(1, 1)) -> Vtx:
         # Position (8 bytes)
         position = [int(round(floatValue)) for floatValue in (transformMatrix @ self.position)]
@@ -874,6 +809,9 @@ class BufferVertex:
             and self.materialIndex == other.materialIndex
         )
 
+    def key(self) -> tuple:
+        return (self.f3dVert.key(), self.groupIndex, self.materialIndex)
+
 
 class TriangleConverterInfo:
     def __init__(self, obj, armature, f3d, transformMatrix, infoDict):
@@ -932,6 +870,13 @@ class TriangleConverter:
             self.vertBuffer: list[BufferVertex] = existingVertexData
         self.existingVertexMaterialRegions = existingVertexMaterialRegions
         self.bufferStart = len(self.vertBuffer)
+
+        # Vertex key indices, so buffer lookups don't have to compare every vert.
+        # The existing region never changes, the rest is kept in sync by setVertBuffer / extendVertBuffer.
+        self.existingVertIndices: dict[tuple, list[int]] = {}
+        for i, bufferVert in enumerate(self.vertBuffer):
+            self.existingVertIndices.setdefault(bufferVert.key(), []).append(i)
+        self.vertIndices: dict[tuple, int] = {}
         self.vertexBufferTriangles = []  # [(index0, index1, index2)]
 
         self.triGroup = triGroup
@@ -945,16 +890,31 @@ class TriangleConverter:
         self.isPointSampled = isTexturePointSampled(material)
         self.tex_scale = material.f3d_mat.tex_scale
 
-    def vertInBuffer(self, bufferVert, material_index):
-        if self.existingVertexMaterialRegions is None:
-            return bufferVert in self.vertBuffer
-        else:
-            if material_index in self.existingVertexMaterialRegions:
-                matRegion = self.existingVertexMaterialRegions[material_index]
-                if bufferVert in self.vertBuffer[matRegion[0] : matRegion[1]]:
-                    return True
+    def vertInBuffer(self, bufferVert, material_index, key: tuple | None = None):
+        key = bufferVert.key() if key is None else key
+        if key in self.vertIndices:
+            return True
 
-            return bufferVert in self.vertBuffer[self.bufferStart :]
+        existingIndices = self.existingVertIndices.get(key)
+        if existingIndices is None:
+            return False
+        if self.existingVertexMaterialRegions is None:
+            return True
+        if material_index in self.existingVertexMaterialRegions:
+            matRegion = self.existingVertexMaterialRegions[material_index]
+            return any(matRegion[0] <= i < matRegion[1] for i in existingIndices)
+        return False
+
+    def setVertBuffer(self, bufferVerts: list[BufferVertex]):
+        """Replaces everything after the existing region of the vertex buffer"""
+        self.vertBuffer = self.vertBuffer[: self.bufferStart]
+        self.vertIndices = {}
+        self.extendVertBuffer(bufferVerts)
+
+    def extendVertBuffer(self, bufferVerts: list[BufferVertex]):
+        for bufferVert in bufferVerts:
+            self.vertIndices.setdefault(bufferVert.key(), len(self.vertBuffer))
+            self.vertBuffer.append(bufferVert)
 
     def getSortedBuffer(self) -> dict[int, list[BufferVertex]]:
         limbVerts: dict[int, list[BufferVertex]] = {}
@@ -978,7 +938,7 @@ class TriangleConverter:
 
         if self.currentGroupIndex in limbVerts:
             currentLimbVerts = limbVerts[self.currentGroupIndex]
-            self.vertBuffer = self.vertBuffer[: self.bufferStart] + currentLimbVerts
+            self.setVertBuffer(currentLimbVerts)
             self.triList.commands.append(
                 SPVertex(self.vtxList, len(self.vtxList.vertices), len(currentLimbVerts), self.bufferStart)
             )
@@ -999,7 +959,7 @@ class TriangleConverter:
 
             bufferStart = bufferEnd
         else:
-            self.vertBuffer = self.vertBuffer[: self.bufferStart]
+            self.setVertBuffer([])
 
         # Load other limb verts
         for groupIndex, bufferVerts in limbVerts.items():
@@ -1012,7 +972,7 @@ class TriangleConverter:
                 SPVertex(self.vtxList, len(self.vtxList.vertices), len(bufferVerts), bufferStart)
             )
 
-            self.vertBuffer += bufferVerts
+            self.extendVertBuffer(bufferVerts)
             bufferEnd += len(bufferVerts)
 
             # Save vertices
@@ -1181,21 +1141,22 @@ class TriangleConverter:
                 )
             bufferVert = self.getBufferVert(loop, face, vertexGroup)
             bufferVert.f3dVert.stOffset = stOffset
+            key = bufferVert.key()
             triIndices.append(bufferVert)
-            if not self.vertInBuffer(bufferVert, face.material_index):
+            if not self.vertInBuffer(bufferVert, face.material_index, key):
                 addedVerts.append(bufferVert)
 
-            if bufferVert not in self.vertBuffer[: self.bufferStart]:
+            if key not in self.existingVertIndices:
                 allVerts.append(bufferVert)
 
         # We care only about load size, since loading is what takes up time.
         # Even if vert_buffer is larger, its still another load to fill it.
         if len(self.vertBuffer) + len(addedVerts) > self.triConverterInfo.f3d.vert_load_size:
             self.processGeometry()
-            self.vertBuffer = self.vertBuffer[: self.bufferStart] + allVerts
+            self.setVertBuffer(allVerts)
             self.vertexBufferTriangles = [triIndices]
         else:
-            self.vertBuffer.extend(addedVerts)
+            self.extendVertBuffer(addedVerts)
             self.vertexBufferTriangles.append(triIndices)
 
     def finish(self, terminateDL):
@@ -1268,11 +1229,15 @@ def getLoopColor(loop: bpy.types.MeshLoop, mesh: bpy.types.Mesh) -> Vector:
 
 
 def createTriangleCommands(triangles, vertexBuffer, useSP2Triangle):
-    triangles = copy.deepcopy(triangles)
     commands = []
 
+    # first index of each vert in the buffer, same as vertexBuffer.index(v)
+    bufferIndices = {}
+    for i, bufferVert in enumerate(vertexBuffer):
+        bufferIndices.setdefault(bufferVert.key(), i)
+
     def getIndices(tri):
-        return [vertexBuffer.index(v) for v in tri]
+        return [bufferIndices[v.key()] for v in tri]
 
     t = 0
     while t < len(triangles):
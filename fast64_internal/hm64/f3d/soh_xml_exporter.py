@@ -5,6 +5,7 @@ All methods are removed at unregistration time.
 
 import os
 import bpy
+import functools
 from html import escape
 from pathlib import Path
 from struct import pack
@@ -115,7 +116,7 @@ from ...f3d.f3d_gbi import (
     SPTextureRectangle,
     SPScisTextureRectangle,
 )
-from ...utility import PluginError
+from ...utility import PluginError, writeFilesInParallel
 from ..utility import writeXMLData, resolve_internal_export_path
 from ...z64.exporter.skeleton.classes import (
     FlexSkeleton,
@@ -125,7 +126,7 @@ from ...z64.exporter.skeleton.classes import (
     LODLimb,
     SkinLimb,
 )
-from .f3d_gbi_hm64 import format_asset_path, get_image_from_image_key
+from .f3d_gbi_hm64 import format_asset_path
 
 _REGISTERED = False
 
@@ -310,23 +311,23 @@ def _Vtx_to_soh_xml(self):
 
 # VtxList.to_soh_xml
 def _VtxList_to_soh_xml(self):
-    data = '<Vertex Version="0">\n'
+    data = ['<Vertex Version="0">\n']
     for vert in self.vertices:
         vert_to_soh_xml = getattr(vert, "to_soh_xml", None)
-        data += "\t" + (vert_to_soh_xml() if callable(vert_to_soh_xml) else _Vtx_to_soh_xml(vert)) + "\n"
-    data += "</Vertex>\n"
-    return data
+        data.append("\t" + (vert_to_soh_xml() if callable(vert_to_soh_xml) else _Vtx_to_soh_xml(vert)) + "\n")
+    data.append("</Vertex>\n")
+    return "".join(data)
 
 
 # GfxList.to_soh_xml
 def _GfxList_to_soh_xml(self, modelDirPath, objectPath):
-    data = '<DisplayList Version="0">\n'
+    data = ['<DisplayList Version="0">\n']
     for command in self.commands:
-        data += "\t" + _call_to_soh_xml(command, modelDirPath, objectPath) + "\n"
+        data.append("\t" + _call_to_soh_xml(command, modelDirPath, objectPath) + "\n")
 
-    data += "</DisplayList>\n\n"
+    data.append("</DisplayList>\n\n")
 
-    return data
+    return "".join(data)
 
 
 def _serialize_inline_gfx_list(gfx_list, objectPath):
@@ -479,9 +480,37 @@ def _FModel_to_soh_xml(self, modelDirPath, objectPath, include_cull_vertices=Tru
     return data
 
 
+def _soh_otex_data(fmt_code, width, height, flags, h_byte_scale, v_pixel_scale, data):
+    """OTEX resource file data, the header followed by the already converted texture data"""
+    return (
+        pack(
+            "<IIIQIQIQQQIIIIIffI",
+            0,
+            0x4F544558,
+            1,
+            0xDEADBEEFDEADBEEF,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            fmt_code,
+            width,
+            height,
+            flags,
+            h_byte_scale,
+            v_pixel_scale,
+            len(data),
+        )
+        + data
+    )
+
+
 # FModel.save_soh_textures
 def _FModel_save_soh_textures(self, exportPath):
-    texturesSaved = 0
+    files = []
 
     for key, texture in self.textures.items():
         if isinstance(key, FPaletteKey):
@@ -492,7 +521,6 @@ def _FModel_save_soh_textures(self, exportPath):
         if getattr(texture, "skip_export", False):
             continue
 
-        image = get_image_from_image_key(key)
         imageFileName = texture.name
         fmt_code = -1
 
@@ -524,79 +552,37 @@ def _FModel_save_soh_textures(self, exportPath):
                 f"Unsupported texture format {texture.fmt}/{texture.bitSize} when exporting SOH XML textures."
             )
 
-        bpy.path.abspath(image.filepath)
         internal_path = getattr(texture, "internal_path", "")
         targetPath = bpy.path.abspath(resolve_internal_export_path(exportPath, internal_path, imageFileName))
         targetDir = os.path.dirname(targetPath)
         if targetDir and not os.path.exists(targetDir):
             os.makedirs(targetDir, exist_ok=True)
 
-        isPacked = image.packed_file is not None
-        if not isPacked:
-            image.pack()
-        oldpath = image.filepath
-        try:
-            image.filepath = targetPath
-            # Resource header carries the real HD size/scale/raw-tag; display list stays native.
-            width = getattr(texture, "hd_width", texture.width)
-            height = getattr(texture, "hd_height", texture.height)
-            h_byte_scale = getattr(texture, "hd_byte_scale", 1.0)
-            v_pixel_scale = getattr(texture, "hd_pixel_scale", 1.0)
-            TEX_FLAG_LOAD_AS_RAW = 1
-            is_hd = h_byte_scale != 1.0 or v_pixel_scale != 1.0
-            if is_hd:
-                fmt_code = 1  # raw HD payload is always 4-byte RGBA32 texels
-            flags = TEX_FLAG_LOAD_AS_RAW if is_hd else 0
-            with open(targetPath, "wb") as file:
-                file.write(
-                    pack(
-                        "<IIIQIQIQQQIIIIIffI",
-                        0,
-                        0x4F544558,
-                        1,
-                        0xDEADBEEFDEADBEEF,
-                        0,
-                        0,
-                        0,
-                        0,
-                        0,
-                        0,
-                        0,
-                        fmt_code,
-                        width,
-                        height,
-                        flags,
-                        h_byte_scale,
-                        v_pixel_scale,
-                        len(texture.data),
-                    )
-                    + texture.data
-                )
-            texturesSaved += 1
-            if not isPacked:
-                old_dir = ""
-                unpack_path = oldpath or targetPath
-                if oldpath:
-                    old_dir = os.path.dirname(bpy.path.abspath(oldpath))
-                else:
-                    old_dir = os.path.dirname(bpy.path.abspath(targetPath))
-                if old_dir and not os.path.exists(old_dir):
-                    os.makedirs(old_dir, exist_ok=True)
-                image.filepath = unpack_path
-                try:
-                    image.unpack()
-                except RuntimeError:
-                    pass
-        except Exception as exc:
-            image.filepath = oldpath
-            raise Exception(str(exc))
-        image.filepath = oldpath
-    return texturesSaved
+        # Resource header carries the real HD size/scale/raw-tag; display list stays native.
+        width = getattr(texture, "hd_width", texture.width)
+        height = getattr(texture, "hd_height", texture.height)
+        h_byte_scale = getattr(texture, "hd_byte_scale", 1.0)
+        v_pixel_scale = getattr(texture, "hd_pixel_scale", 1.0)
+        TEX_FLAG_LOAD_AS_RAW = 1
+        is_hd = h_byte_scale != 1.0 or v_pixel_scale != 1.0
+        if is_hd:
+            fmt_code = 1  # raw HD payload is always 4-byte RGBA32 texels
+        flags = TEX_FLAG_LOAD_AS_RAW if is_hd else 0
+        files.append(
+            (
+                targetPath,
+                functools.partial(
+                    _soh_otex_data, fmt_code, width, height, flags, h_byte_scale, v_pixel_scale, texture.data
+                ),
+            )
+        )
+
+    return writeFilesInParallel(files)
 
 
 # FModel.save_soh_palettes
 def _FModel_save_soh_palettes(self, exportPath):
-    palettesSaved = 0
+    files = []
     for key, texture in self.textures.items():
         if not isinstance(key, FPaletteKey):
             continue
@@ -642,37 +628,14 @@ def _FModel_save_soh_palettes(self, exportPath):
         if targetDir and not os.path.exists(targetDir):
             os.makedirs(targetDir, exist_ok=True)
 
-        try:
-            with open(targetPath, "wb") as file:
-                file.write(
-                    pack(
-                        "<IIIQIQIQQQIIIIIffI",
-                        0,
-                        0x4F544558,
-                        1,
-                        0xDEADBEEFDEADBEEF,
-                        0,
-                        0,
-                        0,
-                        0,
-                        0,
-                        0,
-                        0,
-                        fmt_code,
-                        texture.width,
-                        texture.height,
-                        0,
-                        1.0,
-                        1.0,
-                        len(texture.data),
-                    )
-                    + texture.data
-                )
-            palettesSaved += 1
-        except Exception as exc:
-            raise Exception(str(exc))
-
-    return palettesSaved
+        files.append(
+            (
+                targetPath,
+                functools.partial(_soh_otex_data, fmt_code, texture.width, texture.height, 0, 1.0, 1.0, texture.data),
+            )
+        )
+
+    return writeFilesInParallel(files)
 
 
 # FMesh.get_soh_root_draw_lines
@@ -31,8 +31,6 @@ from ...f3d.f3d_gbi import (
 
 from ...utility import (
     transform_mtx_blender_to_n64,
-    cleanupDuplicatedObjects,
-    duplicateHierarchy,
     parentObject,
     PluginError,
     CData,
@@ -62,14 +60,11 @@ class MK64_BpyCourse:
         also generates lists for items, pathing and collision (in future)
         """
         fModel = MK64_fModel(self.root, mat_write_method)
-        # create duplicate objects to export from
         transform = Matrix.Diagonal(Vector((scale, scale, scale))).to_4x4()
-        # create duplicate objects to work on
-        self.temp_obj, self.all_objs = duplicateHierarchy(self.root, None, True, None)
         # fMeshes = exportF3DCommon(self.root, fModel, transform, True, "mk64", DLFormat.Static, 1)
-        print(self.all_objs)
 
         # retrieve data for items and pathing
+        # parent_transform is the scaled transform of obj relative to the course root
         def loop_children(obj, fModel, parent_transform):
             for child in obj.children:
                 if child.type == "MESH":
@@ -161,26 +156,24 @@ class MK64_BpyCourse:
         if points:
             fModel.path.append(MK64_Path(points, obj.hm64_mk64_path_type))
 
-    # look into speeding this up by calculating just the apprent
-    # transform using transformMatrix vs clearing parent and applying
-    # transform
     def export_f3d_from_obj(
         self, context: bpy.Types.Context, obj: bpy.types.Object, fModel: MK64_fModel, transformMatrix: Matrix
     ):
-        mk_props = context.scene.fast64.mk64
+        """
+        Exports a mesh using its apparent transform relative to the course root as the vertex transform,
+        so the scene is not modified
+        """
         if obj and obj.type == "MESH":
             # Export as geometry
+            # Treat transparent objects like a normal object which means the position is exported.
+            # This is required for z-sort so that they are rendered over-top of each other correctly.
+            # Normal geometry is placed at 0,0,0 and the vertices are used for positionnig instead.
+            if obj.hm64_mk64_draw_layer in {"DRAW_TRANSLUCENT", "DRAW_TRANSLUCENT_NO_ZBUFFER"}:
+                transformMatrix = transformMatrix.copy()
+                transformMatrix.translation = Vector((0.0, 0.0, 0.0))
+            # fMesh names come from original_name, which duplicateHierarchy used to set
+            obj.original_name = obj.name
             try:
-                with context.temp_override(active_object=obj, selected_objects=[obj]):
-                    bpy.ops.object.parent_clear(type="CLEAR_KEEP_TRANSFORM")
-                    # Treat transparent objects like a normal object which means the position is exported.
-                    # This is required for z-sort so that they are rendered over-top of each other correctly.
-                    # Normal geometry is placed at 0,0,0 and the vertices are used for positionnig instead.
-                    if obj.hm64_mk64_draw_layer in {"DRAW_TRANSLUCENT", "DRAW_TRANSLUCENT_NO_ZBUFFER"}:
-                        transformMatrix.translation = Vector((0.0, 0.0, 0.0))
-                        bpy.ops.object.transform_apply(location=False, rotation=True, scale=True, properties=False)
-                    else:
-                        bpy.ops.object.transform_apply(location=True, rotation=True, scale=True, properties=False)
                 infoDict = getInfoDict(obj)
                 triConverterInfo = TriangleConverterInfo(obj, None, fModel.f3d, transformMatrix, infoDict)
                 fMeshes = saveStaticModel(
@@ -194,18 +187,11 @@ class MK64_BpyCourse:
                     None,
                 )
             except Exception as e:
-                self.cleanup_course()
                 raise PluginError(str(e))
             return list(fMeshes.values())
         else:
             return 0
 
-    def cleanup_course(self):
-        cleanupDuplicatedObjects(self.all_objs)
-        self.root.select_set(True)
-        bpy.context.view_layer.objects.active = self.root
-        return
-
 
 class MK64_fModel(FModel):
     def __init__(self, rt: bpy.types.Object, mat_write_method, name="mk64"):
@@ -253,8 +239,8 @@ class MK64_fModel(FModel):
         data.source = f"const Gfx* d_{self.name}_dls[] = {{\n"
         # cleaner oneline for this?
         for index, fMesh in enumerate(self.meshes.values()):
-            data.source += f"{fMesh.draw.name}, " + ("\n\t" if index % 3 == 0 else "")
-        data.source += "};\n\n"
+            data.append_source(f"{fMesh.draw.name}, " + ("\n\t" if index % 3 == 0 else ""))
+        data.append_source("};\n\n")
         return data
 
     def to_c_track_actors(self):
@@ -336,16 +322,18 @@ class MK64_fModel(FModel):
         data.source = ""
 
         for i, path in enumerate(self.path):
-            data.header += f"extern TrackWaypoint d_{self.name}_path_{i}[];\n"
+            data.append_header(f"extern TrackWaypoint d_{self.name}_path_{i}[];\n")
 
             # Use integer formatting instead of float formatting
             waypoints = ",\n\t".join([f"{{ {x}, {y}, {z}, {pid} }}" for x, y, z, pid in path.points])
 
-            data.source += "\n".join(
-                (
-                    f"TrackWaypoint d_{self.name}_path_{i}[] = {{",
-                    f"\t{waypoints},",
-                    "};\n\n",
+            data.append_source(
+                "\n".join(
+                    (
+                        f"TrackWaypoint d_{self.name}_path_{i}[] = {{",
+                        f"\t{waypoints},",
+                        "};\n\n",
+                    )
                 )
             )
 
@@ -464,8 +452,6 @@ def export_course_c(obj: bpy.types.Object, context: bpy.types.Context, export_di
 
     bpy_course = MK64_BpyCourse(obj)
     mk64_fModel = bpy_course.make_mk64_course_from_bpy(context, scale, mat_write_method)
-    bpy_course.cleanup_course()
-
     if inline:
         bleed_gfx = BleedGraphics()
         bleed_gfx.bleed_fModel(mk64_fModel, mk64_fModel.meshes)
@@ -477,7 +463,7 @@ def export_course_c(obj: bpy.types.Object, context: bpy.types.Context, export_di
     dynamicData = export_data.dynamicData
 
     model_data = CData()
-    model_data.source += MODEL_HEADER
+    model_data.append_source(MODEL_HEADER)
     model_data.append(staticData)
     model_data.append(dynamicData)
 
@@ -498,8 +484,6 @@ def export_course_xml(
 
     mk64_fModel = bpy_course.make_mk64_course_from_bpy(context, scale, mat_write_method, logging_func)
 
-    bpy_course.cleanup_course()
-
     if inline:
         bleed_gfx = BleedGraphics()
         bleed_gfx.bleed_fModel(mk64_fModel, mk64_fModel.meshes)
@@ -51,15 +51,15 @@ class OOTSkeleton:
         limbList = self.createLimbList()
         isFlex = self.isFlexSkeleton()
 
-        data.source += "void* " + self.limbsName() + "[" + str(self.getNumLimbs()) + "] = {\n"
+        data.append_source("void* " + self.limbsName() + "[" + str(self.getNumLimbs()) + "] = {\n")
         for limb in limbList:
-            limbData.source += limb.toC(self.hasLOD)
-            data.source += "\t&" + limb.name() + ",\n"
-        limbData.source += "\n"
-        data.source += "};\n\n"
+            limbData.append_source(limb.toC(self.hasLOD))
+            data.append_source("\t&" + limb.name() + ",\n")
+        limbData.append_source("\n")
+        data.append_source("};\n\n")
 
         if isFlex:
-            data.source += (
+            data.append_source(
                 "FlexSkeletonHeader "
                 + self.name
                 + " = { "
@@ -72,7 +72,7 @@ class OOTSkeleton:
             )
             data.header = "extern FlexSkeletonHeader " + self.name + ";\n"
         else:
-            data.source += (
+            data.append_source(
                 "SkeletonHeader " + self.name + " = { " + self.limbsName() + ", " + str(self.getNumLimbs()) + " };\n\n"
             )
             data.header = "extern SkeletonHeader " + self.name + ";\n"
@@ -80,11 +80,11 @@ class OOTSkeleton:
         for limb in limbList:
             name = (self.name + "_" + toAlnum(limb.boneName)).upper()
             if limb.index == 0:
-                data.header += "#define " + name + "_POS_LIMB 0\n"
-                data.header += "#define " + name + "_ROT_LIMB 1\n"
+                data.append_header("#define " + name + "_POS_LIMB 0\n")
+                data.append_header("#define " + name + "_ROT_LIMB 1\n")
             else:
-                data.header += "#define " + name + "_LIMB " + str(limb.index + 1) + "\n"
-        data.header += "#define " + self.name.upper() + "_NUM_LIMBS " + str(len(limbList) + 1) + "\n"
+                data.append_header("#define " + name + "_LIMB " + str(limb.index + 1) + "\n")
+        data.append_header("#define " + self.name.upper() + "_NUM_LIMBS " + str(len(limbList) + 1) + "\n")
 
         limbData.append(data)
 
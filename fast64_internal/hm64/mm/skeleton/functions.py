@@ -308,15 +308,15 @@ def ootConvertArmatureToC(
     data.header = f"#ifndef {header_filename.upper()}_H\n" + f"#define {header_filename.upper()}_H\n\n"
 
     if bpy.context.scene.fast64.oot.is_globalh_present():
-        data.header += '#include "ultra64.h"\n' + '#include "global.h"\n'
+        data.append_header('#include "ultra64.h"\n' + '#include "global.h"\n')
     else:
-        data.header += '#include "ultra64.h"\n' + '#include "array_count.h"\n' + '#include "z64animation.h"\n'
+        data.append_header('#include "ultra64.h"\n' + '#include "array_count.h"\n' + '#include "z64animation.h"\n')
 
     data.source = f'#include "{header_filename}.h"\n\n'
     if not isCustomExport:
-        data.header += f'#include "{folderName}.h"\n\n'
+        data.append_header(f'#include "{folderName}.h"\n\n')
     else:
-        data.header += "\n"
+        data.append_header("\n")
 
     path = ootGetPath(exportPath, isCustomExport, "assets/objects/", folderName, True, True)
     includeDir = settings.customAssetIncludeDir if settings.isCustom else f"assets/objects/{folderName}"
@@ -332,7 +332,7 @@ def ootConvertArmatureToC(
         textureArrayData = hm64_z64_f3d_writer.writeTextureArraysNew(fModel, flipbookArrayIndex2D)
         data.append(textureArrayData)
 
-    data.header += "\n#endif\n"
+    data.append_header("\n#endif\n")
     writeCData(data, os.path.join(path, filename + ".h"), os.path.join(path, filename + ".c"))
 
     if not isCustomExport:
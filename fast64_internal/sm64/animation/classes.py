@@ -919,6 +919,57 @@ class SM64_AnimTable:
             )
 
 
+class SM64_ValuePacker:
+    """
+    Builds a value table, placing each pair's values at an existing run of the same values when there is one,
+    or overlapping the end of the table with as many of its first values as possible.
+    """
+
+    def __init__(self):
+        self.data = bytearray()  # native int16 bytes, searched with bytearray.find
+        self.added_frames = 0
+
+    @property
+    def size(self):
+        return len(self.data) // 2
+
+    @property
+    def values(self):
+        return np.frombuffer(self.data, np.int16).copy()
+
+    def find(self, values: bytes) -> int | None:
+        position = self.data.find(values)
+        while position != -1 and position % 2 != 0:  # only aligned matches are whole values
+            position = self.data.find(values, position + 1)
+        return None if position == -1 else position // 2
+
+    def get_overlap(self, values: np.ndarray) -> int:
+        """Largest amount of values that the table ends with, other than all of them"""
+        if self.size == 0:
+            return 0
+        last_value = np.frombuffer(self.data[-2:], np.int16)[0]
+        for end in np.flatnonzero(values[: min(len(values) - 1, self.size)] == last_value)[::-1]:
+            if self.data.endswith(values[: end + 1].tobytes()):
+                return int(end) + 1
+        return 0
+
+    def add(self, values: np.ndarray) -> int | None:
+        """Returns the offset of the values, or None if they do not fit in a 16 bit table"""
+        values = np.asarray(values, np.int16)
+        self.added_frames += len(values)
+        offset = self.find(values.tobytes())
+        if offset is not None:
+            return offset
+        offset = self.size - self.get_overlap(values)
+        if offset + len(values) > MAX_U16:
+            return None
+        self.data.extend(values[self.size - offset :].tobytes())
+        return offset
+
+    def truncate(self, size: int):
+        del self.data[size * 2 :]
+
+
 def create_tables(anims_data: list[SM64_AnimData], values_name="", start_address=-1):
     """
     Can generate multiple indices table with only one value table (or multiple if needed),
@@ -927,28 +978,17 @@ def create_tables(anims_data: list[SM64_AnimData], values_name="", start_address
     Returns: indice_tables, value_tables (in that order)
     """
 
-    def add_data(values_table: IntArray, size: int, anim_data: SM64_AnimData, values_address: int):
-        data = values_table.data
-        for pair in anim_data.pairs:
+    def add_data(packer: SM64_ValuePacker, anim_data: SM64_AnimData, values_address: int):
+        # Bigger pairs first, so smaller pairs can reuse their values.
+        for pair in sorted(anim_data.pairs, key=lambda pair: len(pair.values), reverse=True):
             pair_values = pair.values
             if len(pair_values) >= MAX_U16:
                 raise PluginError(
                     f"Pair frame count ({len(pair_values)}) is higher than the 16 bit max ({MAX_U16}). Too many frames."
                 )
-
-            # It's never worth it to find an existing offset for values bigger than 1 frame.
-            # From my (@Lilaa3) testing, the only improvement in Mario resulted in just 286 bytes saved.
-            offset = None
-            if len(pair_values) == 1:
-                indices = np.isin(data[:size], pair_values[0]).nonzero()[0]
-                offset = indices[0] if indices.size > 0 else None
-
-            if offset is None:  # no existing offset found
-                offset = size
-                size = offset + len(pair_values)
-                if size > MAX_U16:  # exceeded limit, but we may be able to recover with a new table
-                    return -1, None
-                data[offset:size] = pair_values
+            offset = packer.add(pair_values)
+            if offset is None:  # exceeded limit, but we may be able to recover with a new table
+                return None
             pair.offset = offset
 
         # build indice table
@@ -962,7 +1002,7 @@ def create_tables(anims_data: list[SM64_AnimData], values_name="", start_address
             anim_data.values_reference = value_table.name
         else:
             anim_data.values_reference = values_address
-        return size, indice_table
+        return indice_table
 
     indice_tables: list[IntArray] = []
     value_tables: list[IntArray] = []
@@ -976,31 +1016,35 @@ def create_tables(anims_data: list[SM64_AnimData], values_name="", start_address
     values_address = indices_address
 
     print("Generating compressed value table and offsets.")
-    # opt: this is the max size possible, prevents tons of allocations and only about 65 kb
-    value_table = IntArray(np.empty(MAX_U16, np.int16), values_name, 8)
-    size = 0
+    value_table = IntArray(np.empty(0, np.int16), values_name, 8)
+    packer = SM64_ValuePacker()
     value_tables.append(value_table)
+    saved_frames = 0
     i = 0  # we can´t use enumarate, as we may repeat
     while i < len(anims_data):
         anim_data = anims_data[i]
 
-        size_before_add = size
-        size, indice_table = add_data(value_table, size, anim_data, values_address)
-        if size != -1:  # sucefully added the data to the value table
-            assert indice_table is not None
+        size_before_add, added_frames_before_add = packer.size, packer.added_frames
+        indice_table = add_data(packer, anim_data, values_address)
+        if indice_table is not None:  # sucefully added the data to the value table
             indice_tables.append(indice_table)
             i += 1  # do the next animation
         else:  # Could not add to the value table
             if size_before_add == 0:  # If the table was empty, it is simply invalid
                 raise PluginError(f"Index table cannot fit into value table of 16 bit max size ({MAX_U16}).")
             else:  # try again with a fresh value table
-                value_table.data.resize(size_before_add, refcheck=False)
+                packer.truncate(size_before_add)
+                packer.added_frames = added_frames_before_add
+                value_table.data = packer.values
+                saved_frames += packer.added_frames - packer.size
                 if start_address != -1:
                     values_address += size_before_add * 2
-                value_table = IntArray(np.empty(MAX_U16, np.int16), f"{values_name}_{len(value_tables)}", 9)
+                value_table = IntArray(np.empty(0, np.int16), f"{values_name}_{len(value_tables)}", 9)
+                packer = SM64_ValuePacker()
                 value_tables.append(value_table)
-                size = 0  # reset size
                 # don't increment i, redo
-    value_table.data.resize(size, refcheck=False)
+    value_table.data = packer.values
+    saved_frames += packer.added_frames - packer.size
+    print(f"Value table compression saved {saved_frames * 2} bytes.")
 
     return indice_tables, value_tables
@@ -7,7 +7,6 @@ import numpy as np
 import bpy
 from bpy.types import Object, Action, PoseBone, Context
 from bpy.path import abspath
-from mathutils import Euler, Quaternion
 
 from ...utility import (
     PluginError,
@@ -22,7 +21,16 @@ from ...utility import (
     toAlnum,
     directory_path_checks,
 )
-from ...utility_anim import get_fcurves, stashActionInArmature, get_slots
+from ...utility_anim import (
+    get_fcurves,
+    stashActionInArmature,
+    get_slots,
+    sample_fcurve,
+    eulers_to_matrices,
+    quaternions_to_matrices,
+    axis_angles_to_quaternions,
+    matrices_to_eulers,
+)
 
 from ..sm64_constants import BEHAVIOR_COMMANDS, BEHAVIOR_EXITS, defaultExtendSegment4, level_pointers
 from ..sm64_utility import (
@@ -103,8 +111,7 @@ def get_entire_fcurve_data(
     for fcurve in fcurves:
         if fcurve.data_path == data_path:
             array_index = fcurve.array_index
-            for frame in range(max_frame):
-                values[array_index, frame] = fcurve.evaluate(frame)
+            values[array_index, :max_frame] = sample_fcurve(fcurve, range(max_frame))
             populated[array_index] = True
 
     for i, is_populated in enumerate(populated):
@@ -115,10 +122,6 @@ def get_entire_fcurve_data(
 
 
 def read_quick(actions, max_frames, anim_owners, trans_values, rot_values):
-    def to_xyz(row):
-        euler = Euler(row, mode)
-        return [euler.x, euler.y, euler.z]
-
     for action, max_frame, action_trans, action_rot in zip(actions, max_frames, trans_values, rot_values):
         quats = np.empty((4, max_frame), dtype=np.float32)
 
@@ -133,18 +136,18 @@ def read_quick(actions, max_frames, anim_owners, trans_values, rot_values):
             index = bone_index * 3
             if mode == "QUATERNION":
                 get_entire_fcurve_data(action, anim_owner, prop, max_frame, quats)
-                action_rot[index : index + 3] = np.apply_along_axis(
-                    lambda row: Quaternion(row).to_euler(), 1, quats.T
-                ).T
+                action_rot[index : index + 3] = matrices_to_eulers(quaternions_to_matrices(quats.T)).T
             elif mode == "AXIS_ANGLE":
                 get_entire_fcurve_data(action, anim_owner, prop, max_frame, quats)
-                action_rot[index : index + 3] = np.apply_along_axis(
-                    lambda row: list(Quaternion(row[1:], row[0]).to_euler()), 1, quats.T
+                action_rot[index : index + 3] = matrices_to_eulers(
+                    quaternions_to_matrices(axis_angles_to_quaternions(quats.T))
                 ).T
             else:
                 get_entire_fcurve_data(action, anim_owner, prop, max_frame, action_rot[index : index + 3])
                 if mode != "XYZ":
-                    action_rot[index : index + 3] = np.apply_along_axis(to_xyz, -1, action_rot[index : index + 3].T).T
+                    action_rot[index : index + 3] = matrices_to_eulers(
+                        eulers_to_matrices(action_rot[index : index + 3].T, mode)
+                    ).T
 
 
 def read_full(actions, max_frames, anim_owners, trans_values, rot_values, obj, is_owner_obj):
@@ -12,7 +12,7 @@ from bpy.types import Object, Action, Context, PoseBone
 from mathutils import Quaternion
 
 from ...f3d.f3d_parser import math_eval
-from ...utility import PluginError, decodeSegmentedAddr, filepath_checks, path_checks, intToHex
+from ...utility import PluginError, RomView, decodeSegmentedAddr, filepath_checks, path_checks, intToHex
 from ...utility_anim import create_basic_action, get_fcurves, create_new_fcurve
 
 from ..sm64_constants import AnimInfo, level_pointers
@@ -651,7 +651,7 @@ def import_animations(context: Context):
     if import_props.import_type == "Binary":
         import_rom_checks(rom_path)
         address = import_props.address
-        with rom_path.open("rb") as rom_file:
+        with RomView(rom_path) as rom_file:
             if import_props.binary_import_type == "DMA":
                 segment_data = None
             else:
@@ -669,7 +669,7 @@ def import_animations(context: Context):
         with insertable_path.open("rb") as insertable_file:
             if import_props.read_from_rom:
                 import_rom_checks(rom_path)
-                with rom_path.open("rb") as rom_file:
+                with RomView(rom_path) as rom_file:
                     segment_data = parseLevelAtPointer(rom_file, level_pointers[import_props.level]).segmentData
                     import_insertable_binary_animations(
                         RomReader(rom_file, insertable_file=insertable_file, segment_data=segment_data),
@@ -7,7 +7,7 @@ import struct
 import os
 import numpy as np
 
-from ..utility import intToHex, decodeSegmentedAddr, PluginError, toAlnum
+from ..utility import intToHex, decodeSegmentedAddr, PluginError, RomView, toAlnum
 from .sm64_constants import insertableBinaryTypes, SegmentData
 from .sm64_utility import export_rom_checks, temp_file_path
 
@@ -101,6 +101,8 @@ class RomReader:
 
         if self.insertable:
             data = self.insertable.data[address : address + size]
+        elif isinstance(self.rom_file, RomView) and size >= 0:
+            data = self.rom_file.read_at(address, size)
         else:
             self.rom_file.seek(address)
             data = self.rom_file.read(size)
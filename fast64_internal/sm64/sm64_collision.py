@@ -1,5 +1,6 @@
 from pathlib import Path
 import bpy, shutil, os, math, mathutils
+import numpy as np
 from bpy.utils import register_class, unregister_class
 from io import BytesIO
 from .sm64_constants import insertableBinaryTypes, defaultExtendSegment4
@@ -28,6 +29,8 @@ from ..utility import (
     bytesToHex,
     applyRotation,
     selectSingleObject,
+    getTransformedMeshTriangles,
+    getDegenerateTriangles,
 )
 
 
@@ -123,24 +126,24 @@ class Collision:
         data = CData()
         data.header = "extern const Collision " + self.name + "[];\n"
         data.source = "const Collision " + self.name + "[] = {\n"
-        data.source += "\tCOL_INIT(),\n"
-        data.source += "\tCOL_VERTEX_INIT(" + str(len(self.vertices)) + "),\n"
+        data.append_source("\tCOL_INIT(),\n")
+        data.append_source("\tCOL_VERTEX_INIT(" + str(len(self.vertices)) + "),\n")
         for vertex in self.vertices:
-            data.source += "\t" + vertex.to_c()
+            data.append_source("\t" + vertex.to_c())
         for collisionType, triangles in self.triangles.items():
-            data.source += "\tCOL_TRI_INIT(" + collisionType + ", " + str(len(triangles)) + "),\n"
+            data.append_source("\tCOL_TRI_INIT(" + collisionType + ", " + str(len(triangles)) + "),\n")
             for triangle in triangles:
-                data.source += "\t" + triangle.to_c()
-        data.source += "\tCOL_TRI_STOP(),\n"
+                data.append_source("\t" + triangle.to_c())
+        data.append_source("\tCOL_TRI_STOP(),\n")
         if len(self.specials) > 0:
-            data.source += "\tCOL_SPECIAL_INIT(" + str(len(self.specials)) + "),\n"
+            data.append_source("\tCOL_SPECIAL_INIT(" + str(len(self.specials)) + "),\n")
             for special in self.specials:
-                data.source += "\t" + special.to_c(1) + ",\n"
+                data.append_source("\t" + special.to_c(1) + ",\n")
         if len(self.water_boxes) > 0:
-            data.source += "\tCOL_WATER_BOX_INIT(" + str(len(self.water_boxes)) + "),\n"
+            data.append_source("\tCOL_WATER_BOX_INIT(" + str(len(self.water_boxes)) + "),\n")
             for waterBox in self.water_boxes:
-                data.source += "\t" + waterBox.to_c(1) + ",\n"
-        data.source += "\tCOL_END()\n" + "};\n"
+                data.append_source("\t" + waterBox.to_c(1) + ",\n")
+        data.append_source("\tCOL_END()\n" + "};\n")
         return data
 
     def rooms_name(self):
@@ -156,12 +159,12 @@ class Collision:
             triangles,
         ) in self.triangles.items():
             for triangle in triangles:
-                data.source += str(triangle.room) + ", "
+                data.append_source(str(triangle.room) + ", ")
                 newlineCount += 1
                 if newlineCount >= 8:
                     newlineCount = 0
-                    data.source += "\n\t"
-        data.source += "\n};\n"
+                    data.append_source("\n\t")
+        data.append_source("\n};\n")
         return data
 
     def to_binary(self):
@@ -379,17 +382,16 @@ def exportCollisionCommon(obj, transformMatrix, includeSpecials, includeChildren
         raise Exception(str(e))
 
     collision = Collision(toAlnum(name) + "_collision")
+    vertexIndices: dict[tuple[int, int, int], int] = {}  # position : index in collision.vertices
     for collisionType, faces in collisionDict.items():
         collision.triangles[collisionType] = []
         for faceVerts, specialParam, room in faces:
             indices = []
             for roundedPosition in faceVerts:
-                index = collisionVertIndex(roundedPosition, collision.vertices)
-                if index is None:
+                if roundedPosition not in vertexIndices:
+                    vertexIndices[roundedPosition] = len(collision.vertices)
                     collision.vertices.append(CollisionVertex(roundedPosition))
-                    indices.append(len(collision.vertices) - 1)
-                else:
-                    indices.append(index)
+                indices.append(vertexIndices[roundedPosition])
             collision.triangles[collisionType].append(CollisionTriangle(indices, specialParam, room))
     if includeSpecials:
         area = SM64_Area(areaIndex, "", "", "", None, None, [], name, None)
@@ -406,30 +408,32 @@ def addCollisionTriangles(obj, collisionDict, includeChildren, transformMatrix,
     if obj.type == "MESH" and not obj.ignore_collision:
         if len(obj.data.materials) == 0:
             raise PluginError(obj.name + " must have a material associated with it.")
-        obj.data.calc_loop_triangles()
-        for face in obj.data.loop_triangles:
-            material = obj.material_slots[face.material_index].material
-            colType = material.collision_type if material.collision_all_options else material.collision_type_simple
-            if colType == "Custom":
-                colType = material.collision_custom
-            specialParam = material.collision_param if material.use_collision_param else None
-
-            (x1, y1, z1) = roundPosition(transformMatrix @ obj.data.vertices[face.vertices[0]].co)
-            (x2, y2, z2) = roundPosition(transformMatrix @ obj.data.vertices[face.vertices[1]].co)
-            (x3, y3, z3) = roundPosition(transformMatrix @ obj.data.vertices[face.vertices[2]].co)
-
-            nx = (y2 - y1) * (z3 - z2) - (z2 - z1) * (y3 - y2)
-            ny = (z2 - z1) * (x3 - x2) - (x2 - x1) * (z3 - z2)
-            nz = (x2 - x1) * (y3 - y2) - (y2 - y1) * (x3 - x2)
-            magSqr = nx * nx + ny * ny + nz * nz
-
-            if magSqr <= 0:
+        positions, triangles = getTransformedMeshTriangles(obj.data, transformMatrix)
+        corners = np.rint(positions).astype(np.int64)[triangles]
+        degenerate = getDegenerateTriangles(corners)
+        materialIndices = np.empty(len(triangles), dtype=np.int32)
+        obj.data.loop_triangles.foreach_get("material_index", materialIndices)
+
+        materialInfo = {}  # material index : (collision type, special param)
+        for materialIndex, isDegenerate, faceVerts in zip(
+            materialIndices.tolist(), degenerate.tolist(), corners.tolist()
+        ):
+            if materialIndex not in materialInfo:
+                material = obj.material_slots[materialIndex].material
+                colType = material.collision_type if material.collision_all_options else material.collision_type_simple
+                if colType == "Custom":
+                    colType = material.collision_custom
+                specialParam = material.collision_param if material.use_collision_param else None
+                materialInfo[materialIndex] = (colType, specialParam)
+            colType, specialParam = materialInfo[materialIndex]
+
+            if isDegenerate:
                 print("Ignore denormalized triangle.")
                 continue
 
             if colType not in collisionDict:
                 collisionDict[colType] = []
-            collisionDict[colType].append((((x1, y1, z1), (x2, y2, z2), (x3, y3, z3)), specialParam, obj.room_num))
+            collisionDict[colType].append((tuple(tuple(vert) for vert in faceVerts), specialParam, obj.room_num))
 
     if includeChildren:
         for child in obj.children:
@@ -438,18 +442,6 @@ def addCollisionTriangles(obj, collisionDict, includeChildren, transformMatrix,
             )
 
 
-def roundPosition(position):
-    return (int(round(position[0])), int(round(position[1])), int(round(position[2])))
-
-
-def collisionVertIndex(vert, vertArray):
-    for i in range(len(vertArray)):
-        colVert = vertArray[i]
-        if colVert.position == vert:
-            return i
-    return None
-
-
 class SM64_ExportCollision(bpy.types.Operator):
     # set bl_ properties
     bl_idname = "object.sm64_export_collision"
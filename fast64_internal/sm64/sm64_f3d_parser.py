@@ -18,6 +18,7 @@ from ..utility import (
     decodeSegmentedAddr,
     applyRotation,
     prop_split,
+    RomView,
 )
 
 
@@ -39,7 +40,7 @@ class SM64_ImportDL(Operator):
             return {"CANCELLED"}
         try:
             import_rom_checks(abspath(context.scene.fast64.sm64.import_rom))
-            romfileSrc = open(abspath(context.scene.fast64.sm64.import_rom), "rb")
+            romfileSrc = RomView(abspath(context.scene.fast64.sm64.import_rom))
             levelParsed = parse_level_binary(romfileSrc, context.scene.levelDLImport)
             segmentData = levelParsed.segmentData
             start = (
@@ -149,22 +149,24 @@ class SM64GfxFormatter(GfxFormatter):
         if fScrollData is None:
             return data
 
-        data.source = vertexScrollTemplate(
-            fScrollData,
-            vtxListName,
-            vtxCount,
-            "absi",
-            "signum_positive",
-            "coss",
-            "random_float",
-            "random_sign",
-            "segmented_to_virtual",
+        data.append_source(
+            vertexScrollTemplate(
+                fScrollData,
+                vtxListName,
+                vtxCount,
+                "absi",
+                "signum_positive",
+                "coss",
+                "random_float",
+                "random_sign",
+                "segmented_to_virtual",
+            )
         )
 
         scrollDataFields = fScrollData.fields[0]
         if not ((scrollDataFields[0].animType == "None") and (scrollDataFields[1].animType == "None")):
             funcName = f"scroll_{vtxListName}"
-            data.header = f"extern void {funcName}();\n"
+            data.append_header(f"extern void {funcName}();\n")
             data.functionCalls.append(funcName)
         return data
 
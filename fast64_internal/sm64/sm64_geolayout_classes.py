@@ -261,9 +261,9 @@ class Geolayout:
         data.header = "extern const GeoLayout " + self.name + "[];\n"
         data.source = "const GeoLayout " + self.name + "[] = {\n"
         for node in self.nodes:
-            data.source += node.to_c(1)
-        data.source += "\t" + endCmd + "(),\n"
-        data.source += "};\n"
+            data.append_source(node.to_c(1))
+        data.append_source("\t" + endCmd + "(),\n")
+        data.append_source("};\n")
         return data
 
     def toTextDump(self, segmentData):
@@ -491,8 +491,7 @@ class GeoLayoutBleed(BleedGraphics):
                     cmd_list, reset_cmd_dict, fModel.matWriteMethod, fModel.getRenderMode(draw_layer)
                 ):
                     cmds_resets[i] = None
-            while None in cmds_resets:
-                cmds_resets.remove(None)
+            cmds_resets[:] = [cmd_resets for cmd_resets in cmds_resets if cmd_resets is not None]
             if not cmds_resets:
                 last_materials.pop(draw_layer, 0)
             return last_materials
@@ -535,6 +534,7 @@ class GeoLayoutBleed(BleedGraphics):
                     fModel.getAllMaterials().items(),
                     fModel.matWriteMethod,
                     default_render_mode,
+                    base_node.drawLayer,
                 )
                 last_materials[base_node.drawLayer] = [last_mat, [(cmd_list, reset_cmd_dict)]]
                 # if the mesh has culling, we must revert to avoid bleed issues
@@ -564,14 +564,15 @@ class GeoLayoutBleed(BleedGraphics):
                     last_mat, cmds_resets = cur_last_materials.get(draw_layer, (None, []))
                     for i in range(len(cmds_resets)):
                         last_materials[draw_layer][1][i] = None
-                    while None in last_materials[draw_layer][1]:
-                        last_materials[draw_layer][1].remove(None)
+                    layer_resets = last_materials[draw_layer][1]
+                    layer_resets[:] = [cmd_resets for cmd_resets in layer_resets if cmd_resets is not None]
             return last_materials
 
         for node in geo_layout_graph.startGeolayout.nodes:
             last_materials = walk(node, last_materials)
         reset_all_layers(last_materials)
         self.clear_gfx_lists(fModel)
+        self.report_tmem_stats()
 
 
 # We add Function commands to nonDeformTransformData because any skinned
@@ -25,6 +25,7 @@ from ..utility import (
     geoNodeRotateOrder,
     selectSingleObject,
     deselectAllObjects,
+    RomView,
 )
 
 from .sm64_geolayout_utility import (
@@ -1526,7 +1527,7 @@ class SM64_ImportGeolayout(bpy.types.Operator):
         try:
             import_rom_checks(bpy.path.abspath(context.scene.fast64.sm64.import_rom))
 
-            romfileSrc = open(bpy.path.abspath(context.scene.fast64.sm64.import_rom), "rb")
+            romfileSrc = RomView(bpy.path.abspath(context.scene.fast64.sm64.import_rom))
 
             armatureObj = None
 
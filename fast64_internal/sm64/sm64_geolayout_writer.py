@@ -476,6 +476,7 @@ def convertArmatureToGeolayout(armatureObj, obj, convertTransformMatrix, camera,
         raise PluginError("No mesh parented to armature.")
 
     infoDict = getInfoDict(obj)
+    vertexBones = getVertexBones(obj, armatureObj)
 
     # Find start bone, which is not root. Root is the start for animation.
     startBoneNames = findStartBones(armatureObj)
@@ -516,6 +517,7 @@ def convertArmatureToGeolayout(armatureObj, obj, convertTransformMatrix, camera,
             meshGeolayout,
             geolayoutGraph,
             infoDict,
+            vertexBones,
             convertTextureData,
         )
 
@@ -756,7 +758,7 @@ def saveGeolayoutC(
     modifyTexScrollFiles(exportDir, geoDirPath, scrollData)
 
     if DLFormat == DLFormat.Static:
-        staticData.source += "\n" + dynamicData.source
+        staticData.append_source("\n" + dynamicData.source)
         staticData.header = geoData.header + staticData.header + dynamicData.header
     else:
         geoData.source = writeMaterialFiles(
@@ -1608,6 +1610,7 @@ def processBone(
     geolayout,
     geolayoutGraph,
     infoDict,
+    vertexBones,
     convertTextureData,
 ):
     bone = armatureObj.data.bones[boneName]
@@ -1779,6 +1782,7 @@ def processBone(
             materialOverrides,
             namePrefix,
             infoDict,
+            vertexBones,
             convertTextureData,
             triConverterInfo,
             "sm64",
@@ -1882,6 +1886,7 @@ def processBone(
                     geolayout,
                     geolayoutGraph,
                     infoDict,
+                    vertexBones,
                     convertTextureData,
                 )
                 # transformNode.children.append(childNode)
@@ -1918,6 +1923,7 @@ def processBone(
                     geolayout,
                     geolayoutGraph,
                     infoDict,
+                    vertexBones,
                     convertTextureData,
                 )
                 # transformNode.children.append(childNode)
@@ -1993,6 +1999,7 @@ def processBone(
                         )
                     optionObj = optionObjs[0]
                     optionInfoDict = getInfoDict(optionObj)
+                    optionVertexBones = getVertexBones(optionObj, optionArmature)
                     processBone(
                         fModel,
                         name,
@@ -2009,6 +2016,7 @@ def processBone(
                         optionGeolayout,
                         geolayoutGraph,
                         optionInfoDict,
+                        optionVertexBones,
                         convertTextureData,
                     )
             else:
@@ -2074,12 +2082,12 @@ def processSwitchBoneMatOverrides(materialOverrides, switchBone):
             materialOverrides.append((None, (), int(switchOption.drawLayer), "All"))
 
 
-def getGroupIndex(vert, armatureObj, obj):
+def getGroupIndex(vert, armatureObj, obj, groupNames: dict[int, str]):
     actualGroups = []
     belowLimitGroups = []
     nonBoneGroups = []
     for group in vert.groups:
-        groupName = getGroupNameFromIndex(obj, group.group)
+        groupName = groupNames.get(group.group)
         if groupName is not None:
             if groupName in armatureObj.data.bones:
                 if group.weight > 0.4:
@@ -2110,9 +2118,9 @@ def getGroupIndex(vert, armatureObj, obj):
                 highlightWeightErrors(obj, [vert], "VERT")
                 raise VertexWeightError(
                     "A vertex was found that was significantly weighted to multiple groups. Make sure each vertex only belongs to one group whose weight is greater than 0.5. ("
-                    + getGroupNameFromIndex(obj, group.group)
+                    + groupNames[group.group]
                     + ", "
-                    + getGroupNameFromIndex(obj, significantWeightGroup.group)
+                    + groupNames[significantWeightGroup.group]
                     + ")"
                 )
         if group.weight > vertGroup.weight:
@@ -2122,6 +2130,15 @@ def getGroupIndex(vert, armatureObj, obj):
     return vertGroup.group
 
 
+def getVertexBones(obj, armatureObj) -> dict[int, int]:
+    """
+    Assigns every vertex to the bone group it is weighted to, checking the weights of the whole mesh once.
+    Kept out of the infoDict's vertexGroupInfo, which would make the triangle converter load per group matrices.
+    """
+    groupNames = {group.index: group.name for group in obj.vertex_groups}
+    return {vert.index: getGroupIndex(vert, armatureObj, obj, groupNames) for vert in obj.data.vertices}
+
+
 class SimpleSkinnedFace:
     def __init__(self, bFace, loopsInGroup, loopsNotInGroup):
         self.bFace = bFace
@@ -2294,6 +2311,7 @@ def saveModelGivenVertexGroup(
     materialOverrides,
     namePrefix,
     infoDict,
+    vertexBones,
     convertTextureData,
     triConverterInfo,
     drawLayerField,
@@ -2308,9 +2326,7 @@ def saveModelGivenVertexGroup(
 
     mesh = obj.data
     currentGroupIndex = getGroupIndexFromname(obj, vertexGroup)
-    vertIndices = [
-        vert.index for vert in obj.data.vertices if getGroupIndex(vert, armatureObj, obj) == currentGroupIndex
-    ]
+    vertIndices = [vertIndex for vertIndex, groupIndex in vertexBones.items() if groupIndex == currentGroupIndex]
     parentGroupIndex = getGroupIndexFromname(obj, parentGroup) if parentGroup is not None else -1
 
     if len(vertIndices) == 0:
@@ -2326,9 +2342,10 @@ def saveModelGivenVertexGroup(
 
     groupFaces = {}  # draw layer : {material_index : [faces]}
     skinnedFaces = {}  # draw layer : {material_index : [skinned faces]}
-    handledFaces = []
+    handledFaces = set()
     usedDrawLayers = set()
-    ancestorGroups = {}  # vertexGroup : ancestor list
+    # groups that are not the bone, its descendants or its ancestors up to the parent group
+    ancestorGroups = set(getAncestorGroups(parentGroup, vertexGroup, armatureObj, obj))
 
     for vertIndex in vertIndices:
         if vertIndex not in infoDict.vert:
@@ -2344,7 +2361,7 @@ def saveModelGivenVertexGroup(
             if face in handledFaces:
                 continue
             else:
-                handledFaces.append(face)
+                handledFaces.add(face)
 
             loopsInGroup = []
             loopsNotInGroup = []
@@ -2352,15 +2369,12 @@ def saveModelGivenVertexGroup(
 
             # loop is interpreted as face + loop index
             for i in range(3):
-                vertGroupIndex = getGroupIndex(mesh.vertices[face.vertices[i]], armatureObj, obj)
-                if vertGroupIndex not in ancestorGroups:
-                    ancestorGroups[vertGroupIndex] = getAncestorGroups(parentGroup, vertexGroup, armatureObj, obj)
-
+                vertGroupIndex = vertexBones[face.vertices[i]]
                 if vertGroupIndex == currentGroupIndex:
                     loopsInGroup.append((face, mesh.loops[face.loops[i]]))
                 elif vertGroupIndex == parentGroupIndex:
                     loopsNotInGroup.append((face, mesh.loops[face.loops[i]]))
-                elif vertGroupIndex not in ancestorGroups[vertGroupIndex]:
+                elif vertGroupIndex not in ancestorGroups:
                     # Only want to handle skinned faces connected to parent
                     isChildSkinnedFace = True
                     break
@@ -2684,14 +2698,17 @@ def splitSkinnedFacesIntoTwoGroups(skinnedFaces, fModel, obj, uv_data, drawLayer
 
     # For selecting on error
     notInGroupBlenderVerts = []
+    notInGroupVertIndices = set()
     loopDict = {}
     for material_index, skinnedFaceArray in sorted(skinnedFaces.items()):
         # These MUST be arrays (not dicts) as order is important
         inGroupVerts = []
         inGroupVertArray.append([material_index, inGroupVerts])
+        inGroupKeys = set()
 
         notInGroupVerts = []
         notInGroupVertArray.append([material_index, notInGroupVerts])
+        notInGroupKeys = set()
 
         material = obj.material_slots[material_index].material
         fMaterial, texDimensions = saveOrGetF3DMaterial(material, fModel, obj, drawLayer, convertTextureData)
@@ -2701,16 +2718,18 @@ def splitSkinnedFacesIntoTwoGroups(skinnedFaces, fModel, obj, uv_data, drawLayer
             for face, loop in skinnedFace.loopsInGroup:
                 f3dVert = getF3DVert(loop, face, convertInfo, obj.data)
                 bufferVert = BufferVertex(f3dVert, None, material_index)
-                if bufferVert not in inGroupVerts:
+                if bufferVert.key() not in inGroupKeys:
+                    inGroupKeys.add(bufferVert.key())
                     inGroupVerts.append(bufferVert)
                 loopDict[loop] = f3dVert
             for face, loop in skinnedFace.loopsNotInGroup:
-                vert = obj.data.vertices[loop.vertex_index]
-                if vert not in notInGroupBlenderVerts:
-                    notInGroupBlenderVerts.append(vert)
+                if loop.vertex_index not in notInGroupVertIndices:
+                    notInGroupVertIndices.add(loop.vertex_index)
+                    notInGroupBlenderVerts.append(obj.data.vertices[loop.vertex_index])
                 f3dVert = getF3DVert(loop, face, convertInfo, obj.data)
                 bufferVert = BufferVertex(f3dVert, None, material_index)
-                if bufferVert not in notInGroupVerts:
+                if bufferVert.key() not in notInGroupKeys:
+                    notInGroupKeys.add(bufferVert.key())
                     notInGroupVerts.append(bufferVert)
                 loopDict[loop] = f3dVert
 
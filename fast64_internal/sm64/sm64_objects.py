@@ -563,10 +563,10 @@ class SM64_Area:
     def to_c_macros(self):
         data = CData()
         data.header = "extern const MacroObject " + self.macros_name() + "[];\n"
-        data.source += "const MacroObject " + self.macros_name() + "[] = {\n"
+        data.append_source("const MacroObject " + self.macros_name() + "[] = {\n")
         for macro in self.macros:
-            data.source += "\t" + macro.to_c(1) + ",\n"
-        data.source += "\tMACRO_OBJECT_END(),\n};\n\n"
+            data.append_source("\t" + macro.to_c(1) + ",\n")
+        data.append_source("\tMACRO_OBJECT_END(),\n};\n\n")
 
         return data
 
@@ -21,10 +21,10 @@ class SM64Spline:
         data = CData()
         if self.splineType == "Trajectory":
             data.header = "extern const Trajectory " + self.name + "[];\n"
-            data.source += "const Trajectory " + self.name + "[] = {\n"
+            data.append_source("const Trajectory " + self.name + "[] = {\n")
             for index in range(len(self.points)):
                 point = self.points[index]
-                data.source += (
+                data.append_source(
                     "\tTRAJECTORY_POS( "
                     + str(index)
                     + ", "
@@ -35,18 +35,18 @@ class SM64Spline:
                     + str(int(round(point[2])))
                     + "),\n"
                 )
-            data.source += "\tTRAJECTORY_END(),\n};\n"
+            data.append_source("\tTRAJECTORY_END(),\n};\n")
             return data
         elif self.splineType == "Cutscene":
             data.header = "extern struct CutsceneSplinePoint " + self.name + "[];\n"
-            data.source += "struct CutsceneSplinePoint " + self.name + "[] = {\n"
+            data.append_source("struct CutsceneSplinePoint " + self.name + "[] = {\n")
             for index in range(len(self.points)):
                 point = self.points[index]
                 if index == len(self.points) - 1:
                     splineIndex = -1  # last keyframe
                 else:
                     splineIndex = index
-                data.source += (
+                data.append_source(
                     "\t{ "
                     + str(splineIndex)
                     + ", "
@@ -59,18 +59,18 @@ class SM64Spline:
                     + str(int(round(point[2])))
                     + " }},\n"
                 )
-            data.source += "};\n"
+            data.append_source("};\n")
             return data
         elif self.splineType == "Vector":
             data.header = "extern const Vec4s " + self.name + "[];\n"
-            data.source += "const Vec4s " + self.name + "[] = {\n"
+            data.append_source("const Vec4s " + self.name + "[] = {\n")
             for index in range(len(self.points)):
                 point = self.points[index]
                 if index >= len(self.points) - 3:
                     speed = 0  # last 3 points of spline
                 else:
                     speed = self.speeds[index]
-                data.source += (
+                data.append_source(
                     "\t{ "
                     + str(int(round(speed)))
                     + ", "
@@ -81,7 +81,7 @@ class SM64Spline:
                     + str(int(round(point[2])))
                     + " },\n"
                 )
-            data.source += "};\n"
+            data.append_source("};\n")
             return data
         else:
             raise PluginError("Invalid SM64 spline type: " + self.splineType)
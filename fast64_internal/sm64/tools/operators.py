@@ -8,7 +8,7 @@ from bpy.path import abspath
 from ...operators import OperatorBase, AddWaterBox
 from ...utility import PluginError, decodeSegmentedAddr, encodeSegmentedAddr, selectSingleObject
 from ...f3d.f3d_material import getDefaultMaterialPreset, createF3DMat, add_f3d_mat_to_obj
-from ...utility import parentObject, intToHex, bytesToHex
+from ...utility import parentObject, intToHex, bytesToHex, RomView
 
 from ..sm64_constants import levelIDNames, enumLevelNames
 from ..sm64_utility import import_rom_checks, int_from_str
@@ -40,7 +40,7 @@ class SM64_AddrConv(OperatorBase):
         addr = int_from_str(self.addr)
         import_rom_path = abspath(self.rom)
         import_rom_checks(import_rom_path)
-        with open(import_rom_path, "rb") as romfile:
+        with RomView(import_rom_path) as romfile:
             level_parsed = parse_level_binary(romfile, self.level)
             segment_data = level_parsed.segmentData
         if self.option == "TO_VIR":
@@ -1,7 +1,9 @@
 from pathlib import Path
-import bpy, random, string, os, math, traceback, re, os, mathutils, ast, operator, inspect
+import bpy, random, string, os, math, traceback, re, os, mathutils, ast, operator, inspect, struct, zlib, functools, mmap
+from concurrent.futures import ThreadPoolExecutor
 from math import pi, ceil, degrees, radians, copysign
 from mathutils import *
+import numpy as np
 
 from typing import Callable, Iterable, Any, Optional, Tuple, TypeVar, Union
 from bpy.types import UILayout, Scene, World, Object
@@ -406,35 +408,157 @@ def propertyGroupEquals(oldProp, newProp):
 
 
 def writeCData(data, headerPath, sourcePath):
-    sourceFile = open(sourcePath, "w", newline="\n", encoding="utf-8")
-    sourceFile.write(data.source)
-    sourceFile.close()
+    with open(sourcePath, "w", newline="\n", encoding="utf-8") as sourceFile:
+        data.write_to(sourceFile)
 
-    headerFile = open(headerPath, "w", newline="\n", encoding="utf-8")
-    headerFile.write(data.header)
-    headerFile.close()
+    with open(headerPath, "w", newline="\n", encoding="utf-8") as headerFile:
+        data.write_to(headerFile, header=True)
 
 
 def writeCDataSourceOnly(data, sourcePath):
-    sourceFile = open(sourcePath, "w", newline="\n", encoding="utf-8")
-    sourceFile.write(data.source)
-    sourceFile.close()
+    with open(sourcePath, "w", newline="\n", encoding="utf-8") as sourceFile:
+        data.write_to(sourceFile)
 
 
 def writeCDataHeaderOnly(data, headerPath):
-    headerFile = open(headerPath, "w", newline="\n", encoding="utf-8")
-    headerFile.write(data.header)
-    headerFile.close()
+    with open(headerPath, "w", newline="\n", encoding="utf-8") as headerFile:
+        data.write_to(headerFile, header=True)
+
+
+def writeFilesInParallel(files: Iterable[tuple[str, Callable[[], bytes]]]) -> int:
+    """
+    Encodes and writes every (path, encode) on a thread pool, returns the number of files written.
+    encode must not access blender data, which is not thread safe.
+    """
+
+    def writeFile(path: str, encode: Callable[[], bytes]):
+        data = encode()
+        with open(path, "wb") as file:
+            file.write(data)
+
+    # when several files go to the same path, the last one is written like it would be when writing in order
+    files = list(files)
+    lastFiles = {os.path.normcase(os.path.abspath(path)): (path, encode) for path, encode in files}
+    with ThreadPoolExecutor() as pool:
+        futures = [pool.submit(writeFile, path, encode) for path, encode in lastFiles.values()]
+    for future in futures:
+        future.result()
+    return len(files)
+
+
+def getImagePixelsU8(image: bpy.types.Image) -> np.ndarray:
+    """The image's pixels as 8 bit values, in a (height, width, channels) array with the top row first"""
+    pixels = np.empty(len(image.pixels), dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    pixels = np.clip(np.round(pixels * 0xFF), 0, 0xFF).astype(np.uint8)
+    return pixels.reshape((image.size[1], image.size[0], image.channels))[::-1]
+
+
+def encodePNG(pixels: np.ndarray) -> bytes:
+    """PNG file data for 8 bit (height, width, channels) pixels, top row first"""
+    height, width, channels = pixels.shape
+    colorType = {1: 0, 2: 4, 3: 2, 4: 6}[channels]  # gray, gray alpha, rgb, rgba
+
+    # every row uses the "up" filter, the difference with the row above
+    rows = np.empty((height, 1 + width * channels), dtype=np.uint8)
+    rows[:, 0] = 2
+    rows[:, 1:] = pixels.reshape((height, width * channels))
+    rows[1:, 1:] -= pixels.reshape((height, width * channels))[:-1]
+
+    def chunk(tag: bytes, data: bytes):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, colorType, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(rows.tobytes(), 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+def saveImageCopy(image: bpy.types.Image, path: str):
+    """Saves the image through blender to path, restoring the datablock's own filepath and packing afterwards"""
+    isPacked = image.packed_file is not None
+    if not isPacked:
+        image.pack()
+    oldpath = image.filepath
+    try:
+        image.filepath = path
+        image.save()
+        if not isPacked:
+            image.unpack()
+    except Exception as e:
+        image.filepath = oldpath
+        raise Exception(str(e))
+    image.filepath = oldpath
+
+
+def saveImagesAsPNG(images: Iterable[tuple[bpy.types.Image, str]]) -> int:
+    """
+    Saves every (image, path) as a png, returns the number of images saved.
+    8 bit images are encoded straight from their pixels on a thread pool, without touching the image datablocks.
+    """
+    files = []
+    savedCount = 0
+    for image, path in images:
+        if image.is_float or image.channels not in {1, 2, 3, 4}:
+            # float buffers go through blender's own color management when saved
+            saveImageCopy(image, path)
+            savedCount += 1
+        else:
+            files.append((path, functools.partial(encodePNG, getImagePixelsU8(image))))
+    return savedCount + writeFilesInParallel(files)
 
 
 class CData:
+    """
+    Source and header text, kept as lists of chunks so appending stays cheap for large exports.
+    The chunks are only joined when source or header is read.
+    """
+
     def __init__(self):
-        self.source = ""
-        self.header = ""
+        self._source: list[str] = []
+        self._header: list[str] = []
+
+    @staticmethod
+    def _joined(chunks: list[str]) -> str:
+        if len(chunks) > 1:
+            chunks[:] = ["".join(chunks)]
+        return chunks[0] if chunks else ""
+
+    @property
+    def source(self) -> str:
+        return CData._joined(self._source)
+
+    @source.setter
+    def source(self, value: str):
+        self._source = [value] if value else []
+
+    @property
+    def header(self) -> str:
+        return CData._joined(self._header)
+
+    @header.setter
+    def header(self, value: str):
+        self._header = [value] if value else []
+
+    def append_source(self, text: str):
+        self._source.append(text)
+
+    def append_header(self, text: str):
+        self._header.append(text)
 
     def append(self, other):
-        self.source += other.source
-        self.header += other.header
+        if isinstance(other, CData):
+            self._source.extend(other._source)
+            self._header.extend(other._header)
+        else:
+            self._source.append(other.source)
+            self._header.append(other.header)
+
+    def write_to(self, fileobj, header: bool = False):
+        """Writes the source (or header) chunks to an open file without joining them first"""
+        fileobj.writelines(self._header if header else self._source)
 
 
 class CScrollData(CData):
@@ -636,6 +760,97 @@ def colorToLuminance(color: mathutils.Color | list[float] | Vector):
     return RGB_TO_LUM_COEF.dot(color[:3])
 
 
+def mapUniqueRows(rows: np.ndarray, func: Callable[[list[float]], list[float]], dtype=np.float32) -> np.ndarray:
+    """Calls func once per distinct row instead of once per row"""
+    uniqueRows, inverse = np.unique(rows, axis=0, return_inverse=True)
+    mapped = np.array([func(row) for row in uniqueRows.tolist()], dtype=dtype)
+    return mapped[inverse.reshape(-1)]
+
+
+def getTransformedMeshTriangles(mesh: bpy.types.Mesh, transformMatrix: Matrix) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the positions of the mesh's vertices transformed by transformMatrix (one row per vertex)
+    and the vertex indices of its loop triangles (one row per triangle).
+    """
+    mesh.calc_loop_triangles()
+    # transformed with mathutils once per vertex, so the values are the same as transforming each triangle corner
+    positions = np.array([transformMatrix @ vert.co for vert in mesh.vertices], dtype=np.float64).reshape(-1, 3)
+    triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", triangles)
+    return positions, triangles.reshape(-1, 3)
+
+
+def getDegenerateTriangles(corners: np.ndarray) -> np.ndarray:
+    """Takes integer corner positions of shape (triangles, 3, 3), returns a mask of the triangles with no area"""
+    return ~np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 1]).any(axis=1)
+
+
+def mergeByDistance(positions: np.ndarray, distance: float = 0.0001) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Merges positions closer than the given distance, without edit mode.
+    Positions are visited in order, each one is merged into the first kept position within the distance, or kept.
+    Returns the index of the first position merged into each kept position,
+    and for every position the index of the kept position it was merged into.
+    """
+    # equal positions are merged up front, so the distance is only checked once per distinct position
+    distinct, distinctFirst, distinctRemap = np.unique(positions, axis=0, return_index=True, return_inverse=True)
+    distinctKept = np.empty(len(distinct), dtype=np.int32)
+    # a position within the distance is always in the same grid cell or one of the 26 around it
+    cells = np.floor(distinct / distance).astype(np.int64).tolist()
+    points = distinct.tolist()
+    grid: dict[tuple[int, int, int], list[int]] = {}
+    neighbors = [(x, y, z) for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1)]
+    maxDistanceSquared = distance * distance
+    keptCount = 0
+    for index in np.argsort(distinctFirst, kind="stable").tolist():
+        (x, y, z), point = cells[index], points[index]
+        kept = None
+        for dx, dy, dz in neighbors:
+            for other in grid.get((x + dx, y + dy, z + dz), ()):
+                otherPoint = points[other]
+                distanceSquared = (
+                    (point[0] - otherPoint[0]) ** 2 + (point[1] - otherPoint[1]) ** 2 + (point[2] - otherPoint[2]) ** 2
+                )
+                if distanceSquared <= maxDistanceSquared and (kept is None or distinctKept[other] < kept):
+                    kept = distinctKept[other]
+        if kept is None:
+            kept = keptCount
+            keptCount += 1
+            grid.setdefault((x, y, z), []).append(index)
+        distinctKept[index] = kept
+    remap = distinctKept[distinctRemap.reshape(-1)]
+    # kept positions are numbered in order of first use, so these are already in order
+    firstIndices = np.unique(remap, return_index=True)[1]
+    return firstIndices, remap
+
+
+def createTriangleMesh(
+    mesh: bpy.types.Mesh,
+    positions: np.ndarray,
+    triangles: np.ndarray,
+    materialIndices: Optional[np.ndarray] = None,
+    smooth: bool = False,
+):
+    """
+    Fills an empty mesh with triangles (one row of vertex indices per triangle) using foreach_set,
+    the same as from_pydata but without converting to python lists.
+    """
+    loopCount = triangles.size
+    mesh.vertices.add(len(positions))
+    mesh.loops.add(loopCount)
+    mesh.polygons.add(len(triangles))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(positions, dtype=np.float32).reshape(-1))
+    mesh.loops.foreach_set("vertex_index", np.ascontiguousarray(triangles, dtype=np.int32).reshape(-1))
+    mesh.polygons.foreach_set("loop_start", np.arange(0, loopCount, 3, dtype=np.int32))
+    if bpy.app.version < (4, 0, 0):
+        mesh.polygons.foreach_set("loop_total", np.full(len(triangles), 3, dtype=np.int32))
+    if materialIndices is not None:
+        mesh.polygons.foreach_set("material_index", np.asarray(materialIndices, dtype=np.int32))
+    if smooth:
+        mesh.polygons.foreach_set("use_smooth", np.ones(len(triangles), dtype=bool))
+    mesh.update(calc_edges=True)
+
+
 def getIA16Tuple(color):
     intensity = colorToLuminance(color[0:3])
     alpha = color[3]
@@ -873,18 +1088,11 @@ def copy_object_and_apply(obj: bpy.types.Object, apply_scale=False, apply_modifi
         obj.original_name = obj.name
 
     obj_copy = obj.copy()
-    obj_copy.data = obj_copy.data.copy()
-
     if apply_modifiers:
-        # In order to correctly apply modifiers, we have to go through blender and add the object to the collection, then apply modifiers
-        prev_active = bpy.context.view_layer.objects.active
-        bpy.context.collection.objects.link(obj_copy)
-        obj_copy.select_set(True)
-        bpy.context.view_layer.objects.active = obj_copy
-        for modifier in obj_copy.modifiers:
-            attemptModifierApply(modifier)
-
-        bpy.context.view_layer.objects.active = prev_active
+        obj_copy.data = getTempObjectData(obj, bpy.context.evaluated_depsgraph_get())
+        obj_copy.modifiers.clear()
+    else:
+        obj_copy.data = obj_copy.data.copy()
 
     obj_copy.parent = None
     # reset transformations
@@ -899,6 +1107,7 @@ def copy_object_and_apply(obj: bpy.types.Object, apply_scale=False, apply_modifi
     obj_copy.data.transform(mtx)
     # Flag used for finding these temp objects
     obj_copy["temp_export"] = True
+    temp_export_objects[obj.get("instanced_mesh_name")] = obj_copy
 
     # Override for F3D culling bounds (used in addCullCommand)
     bounds_mtx = transform_mtx_blender_to_n64()
@@ -944,7 +1153,14 @@ def store_original_meshes(add_warning: Callable[[str], None]):
     bpy.context.view_layer.objects.active = active_obj
 
 
+# instanced mesh name : temp object made by copy_object_and_apply, cleared by cleanupTempMeshes
+temp_export_objects: dict[str, bpy.types.Object] = {}
+
+
 def get_obj_temp_mesh(obj):
+    temp_obj = temp_export_objects.get(obj.get("instanced_mesh_name"))
+    if temp_obj is not None:
+        return temp_obj
     for o in bpy.data.objects:
         if o.get("temp_export") and o.get("instanced_mesh_name") == obj.get("instanced_mesh_name"):
             return o
@@ -965,36 +1181,99 @@ def apply_objects_modifiers_and_transformations(allObjs: Iterable[bpy.types.Obje
         bpy.ops.object.transform_apply(location=False, rotation=True, scale=True, properties=False)
 
 
-def duplicateHierarchy(obj, ignoreAttr, includeEmpties, areaIndex):
-    # Duplicate objects to apply scale / modifiers / linked data
-    deselectAllObjects()
-    selectMeshChildrenOnly(obj, None, includeEmpties, areaIndex)
-    obj.select_set(True)
-    bpy.context.view_layer.objects.active = obj
-    bpy.ops.object.duplicate()
-    try:
-        tempObj = bpy.context.view_layer.objects.active
-        allObjs = bpy.context.selected_objects
+def getTempObjectData(obj: bpy.types.Object, depsgraph: bpy.types.Depsgraph):
+    """A new datablock with the object's modifiers applied, or a copy of its data if there are none to apply"""
+    if obj.type == "MESH" and len(obj.modifiers) > 0:
+        return bpy.data.meshes.new_from_object(
+            obj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph
+        )
+    return obj.data.copy() if obj.data is not None else None
 
-        bpy.ops.object.make_single_user(obdata=True)
 
-        apply_objects_modifiers_and_transformations(allObjs)
+def getWorldMatrix(obj: bpy.types.Object, worldMatrices: dict[bpy.types.Object, Matrix]) -> Matrix:
+    if obj.parent is None:
+        parentMatrix = Matrix.Identity(4)
+    elif obj.parent in worldMatrices:
+        parentMatrix = worldMatrices[obj.parent]
+    else:
+        parentMatrix = obj.parent.matrix_world
+    return parentMatrix @ obj.matrix_parent_inverse @ obj.matrix_basis
 
-        for selectedObj in allObjs:
-            if ignoreAttr is not None and getattr(selectedObj, ignoreAttr):
-                for child in selectedObj.children:
-                    selectSingleObject(child)
-                    bpy.ops.object.parent_clear(type="CLEAR_KEEP_TRANSFORM")
-                    selectedObj.parent.select_set(True)
-                    bpy.context.view_layer.objects.active = selectedObj.parent
-                    bpy.ops.object.parent_set(keep_transform=True)
-                selectedObj.parent = None
-        return tempObj, allObjs
+
+def duplicateHierarchyData(
+    obj: bpy.types.Object, ignoreAttr, includeEmpties, areaIndex
+) -> tuple[bpy.types.Object, dict[bpy.types.Object, bpy.types.Object]]:
+    """
+    Copies the objects duplicateHierarchy exports with modifiers, rotation and scale applied, using only data API calls.
+    Returns the copy of obj and a map of original to temp objects, in parent before child order.
+    """
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    originals = getMeshChildrenOnly(obj, None, includeEmpties, areaIndex)
+    if obj not in originals:
+        originals.insert(0, obj)
+
+    tempObjs: dict[bpy.types.Object, bpy.types.Object] = {}
+    try:
+        for original in originals:
+            tempObj = original.copy()
+            tempObjs[original] = tempObj
+            tempObj.data = getTempObjectData(original, depsgraph)
+            if original.type == "MESH":
+                tempObj.modifiers.clear()
+            for collection in original.users_collection:
+                collection.objects.link(tempObj)
+        children: dict[bpy.types.Object, list[bpy.types.Object]] = {tempObj: [] for tempObj in tempObjs.values()}
+        for original, tempObj in tempObjs.items():
+            if original.parent in tempObjs:
+                tempObj.parent = tempObjs[original.parent]
+                children[tempObj.parent].append(tempObj)
+
+        # apply rotation and scale like transform_apply, parents first so children are corrected before their own apply
+        worldMatrices: dict[bpy.types.Object, Matrix] = {}
+        for tempObj in tempObjs.values():
+            worldMatrices[tempObj] = getWorldMatrix(tempObj, worldMatrices)
+        appliedMatrices: dict[bpy.types.Object, Matrix] = {}
+        for tempObj in tempObjs.values():
+            # keep in place relative to the applied parent, which leaves only translation in matrix_local
+            if tempObj.parent in appliedMatrices:
+                tempObj.matrix_parent_inverse = appliedMatrices[tempObj.parent].inverted_safe()
+                tempObj.matrix_basis = worldMatrices[tempObj]
+            basis = tempObj.matrix_basis.copy()
+            rotationScale = basis.to_3x3().to_4x4()
+            if tempObj.type == "EMPTY":
+                tempObj.empty_display_size *= max(abs(value) for value in tempObj.scale)
+            elif hasattr(tempObj.data, "transform"):
+                tempObj.data.transform(rotationScale)
+            tempObj.matrix_basis = Matrix.Translation(basis.translation)
+            appliedMatrices[tempObj] = getWorldMatrix(tempObj, appliedMatrices)
+
+        if ignoreAttr is not None:
+            for tempObj in tempObjs.values():
+                if not getattr(tempObj, ignoreAttr):
+                    continue
+                # move children to the parent, keeping their transform
+                parent = tempObj.parent
+                for child in children[tempObj]:
+                    child.parent = parent
+                    if parent is not None:
+                        parentMatrix = appliedMatrices[parent] if parent in appliedMatrices else parent.matrix_world
+                        child.matrix_parent_inverse = parentMatrix.inverted_safe()
+                        children.setdefault(parent, []).append(child)
+                    else:
+                        child.matrix_parent_inverse = Matrix.Identity(4)
+                    child.matrix_basis = appliedMatrices[child]
+                children[tempObj] = []
+                tempObj.parent = None
     except Exception as e:
-        cleanupDuplicatedObjects(allObjs)
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
+        cleanupDuplicatedObjects(list(tempObjs.values()))
         raise Exception(str(e))
+    return tempObjs[obj], tempObjs
+
+
+def duplicateHierarchy(obj, ignoreAttr, includeEmpties, areaIndex):
+    # Duplicate objects to apply scale / modifiers / linked data
+    tempObj, tempObjs = duplicateHierarchyData(obj, ignoreAttr, includeEmpties, areaIndex)
+    return tempObj, list(tempObjs.values())
 
 
 enumSM64PreInlineGeoLayoutObjects = {"Geo ASM", "Geo Branch", "Geo Displaylist"}
@@ -1028,21 +1307,29 @@ def checkSM64EmptyUsesGeoLayout(obj):
     return obj.sm64_obj_type in enumSM64EmptyWithGeolayout or checkIsSM64InlineGeoLayout(obj)
 
 
-def selectMeshChildrenOnly(obj, ignoreAttr, includeEmpties, areaIndex):
+def getMeshChildrenOnly(obj, ignoreAttr, includeEmpties, areaIndex, objs=None) -> list[bpy.types.Object]:
+    """The objects selectMeshChildrenOnly selects, in parent before child order"""
+    objs = [] if objs is None else objs
     checkArea = areaIndex is not None and obj.type == "EMPTY"
     if checkArea and obj.sm64_obj_type == "Area Root" and obj.areaIndex != areaIndex:
-        return
+        return objs
     ignoreObj = ignoreAttr is not None and getattr(obj, ignoreAttr)
     isMesh = obj.type == "MESH"
     isEmpty = obj.type == "EMPTY" and includeEmpties and checkSM64EmptyUsesGeoLayout(obj)
     if (isMesh or isEmpty) and not ignoreObj:
-        obj.select_set(True)
         obj.original_name = obj.name
+        objs.append(obj)
     for child in obj.children:
         if checkArea and obj.sm64_obj_type == "Level Root":
             if not (child.type == "EMPTY" and child.sm64_obj_type == "Area Root"):
                 continue
-        selectMeshChildrenOnly(child, ignoreAttr, includeEmpties, areaIndex)
+        getMeshChildrenOnly(child, ignoreAttr, includeEmpties, areaIndex, objs)
+    return objs
+
+
+def selectMeshChildrenOnly(obj, ignoreAttr, includeEmpties, areaIndex):
+    for childObj in getMeshChildrenOnly(obj, ignoreAttr, includeEmpties, areaIndex):
+        childObj.select_set(True)
 
 
 def cleanupDuplicatedObjects(selected_objects):
@@ -1058,6 +1345,7 @@ def cleanupDuplicatedObjects(selected_objects):
 
 def cleanupTempMeshes():
     """Delete meshes that have been duplicated for instancing"""
+    temp_export_objects.clear()
     remove_data = []
     for obj in bpy.data.objects:
         if obj.get("temp_export"):
@@ -1457,6 +1745,41 @@ def intToBytes(value, byteSize):
     return bytes.fromhex(intToHex(value, byteSize)[2:])
 
 
+class RomView:
+    """
+    Read only, memory mapped ROM file. Has the file interface the binary importers use (seek, read, tell),
+    without a system call per read.
+    """
+
+    def __init__(self, path: str | Path):
+        self.file = open(path, "rb")
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self.file.close()
+            raise
+        self.seek = self.data.seek
+        self.read = self.data.read
+        self.tell = self.data.tell
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self.data)
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def read_at(self, address: int, size: int) -> bytes:
+        """Reads without moving the read position"""
+        return self.data[address : address + size]
+
+
 # byte input
 # returns an integer, usually used for file seeking positions
 def decodeSegmentedAddr(address, segmentData):
@@ -1464,7 +1787,7 @@ def decodeSegmentedAddr(address, segmentData):
     if address[0] not in segmentData:
         raise PluginError("Segment " + str(address[0]) + " not found in segment list.")
     segmentStart = segmentData[address[0]][0]
-    return segmentStart + bytesToInt(address[1:4])
+    return segmentStart + int.from_bytes(address[1:4], "big")
 
 
 # int input
@@ -1478,8 +1801,9 @@ def encodeSegmentedAddr(address, segmentData):
 
 
 def getSegment(address, segmentData):
-    for segment, interval in segmentData.items():
-        if address in range(*interval):
+    # segments can overlap, the first one in segmentData containing the address is used
+    for segment, (start, end) in segmentData.items():
+        if start <= address < end:
             return segment
 
     raise PluginError("Address " + hex(address) + " is not found in any of the provided segments.")
@@ -1694,6 +2018,35 @@ def packNormal(normal: Vector) -> int:
     return packedNormal
 
 
+def packNormals(normals: np.ndarray) -> np.ndarray:
+    """packNormal for an (N, 3) array of normalized normals"""
+    if bpy.context.scene.packed_normals_algorithm == "565":
+
+        def convertComponents(v: np.ndarray, range: int):
+            v = np.clip(np.round(v * float(range)).astype(np.int64), -range, range - 1)
+            return np.where(v >= 0, v, v + 2 * range)
+
+        x = convertComponents(normals[:, 0], 16) << 11
+        y = convertComponents(normals[:, 1], 32) << 5
+        z = convertComponents(normals[:, 2], 16)
+        return x | y | z
+    elif bpy.context.scene.packed_normals_algorithm == "Octahedral":
+        # Convert standard normals to constant-L1 normals
+        l1norm = np.abs(normals).sum(axis=1, keepdims=True)
+        xo, yo, zo = np.round(normals * 127.0 / l1norm).astype(np.int64).T
+        yRemainder = 127 - np.abs(xo)
+        yo = np.where(np.abs(xo) + np.abs(yo) > 127, np.where(yo < 0, -yRemainder, yRemainder), yo)
+        zRemainder = 127 - np.abs(xo) - np.abs(yo)
+        zo = np.where(zo < 0, -zRemainder, zRemainder)
+        # Pack normals
+        x, y = np.abs(xo), np.abs(yo)
+        x, y = np.where(zo < 0, 0x7F - x, x), np.where(zo < 0, 0x7F - y, y)
+        x, y = x | (xo & 0x80), y | (yo & 0x80)
+        return x << 8 | y
+    else:
+        raise PluginError("Invalid packed normals algorithm")
+
+
 def getRgbNormalSettings(f3d_mat: "F3DMaterialProperty") -> Tuple[bool, bool, bool]:
     rdp_settings = f3d_mat.rdp_settings
     has_packed_normals = bpy.context.scene.f3d_type == "F3DEX3" and rdp_settings.g_packed_normals
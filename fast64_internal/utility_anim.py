@@ -1,4 +1,5 @@
 import bpy, math, mathutils
+import numpy as np
 from bpy.types import Object, Action, AnimData, FCurve
 from bpy.utils import register_class, unregister_class
 from bpy.props import StringProperty
@@ -334,6 +335,154 @@ def create_new_fcurve(
 classes = (ArmatureApplyWithMeshOperator, CreateAnimData, AddBasicAction, StashAction, AddSubAction)
 
 
+def get_axis_rotations(axis: str, angles: np.ndarray) -> np.ndarray:
+    """Rotation matrices of shape (frames, 3, 3) around a single axis"""
+    c, s = np.cos(angles), np.sin(angles)
+    i, j = {"X": (1, 2), "Y": (2, 0), "Z": (0, 1)}[axis]
+    matrices = np.zeros((len(angles), 3, 3))
+    matrices[:, 3 - i - j, 3 - i - j] = 1
+    matrices[:, i, i] = c
+    matrices[:, i, j] = -s
+    matrices[:, j, i] = s
+    matrices[:, j, j] = c
+    return matrices
+
+
+def eulers_to_matrices(eulers: np.ndarray, order: str = "XYZ") -> np.ndarray:
+    """Rotation matrices of shape (frames, 3, 3) from euler angles of shape (frames, 3), like Euler.to_matrix()"""
+    matrices = np.broadcast_to(np.identity(3), (len(eulers), 3, 3))
+    # the first axis of the order is applied first
+    for axis in order:
+        matrices = get_axis_rotations(axis, eulers[:, "XYZ".index(axis)]) @ matrices
+    return matrices
+
+
+def quaternions_to_matrices(quaternions: np.ndarray) -> np.ndarray:
+    """Rotation matrices of shape (frames, 3, 3) from (w, x, y, z) quaternions, which are normalized first"""
+    length = np.linalg.norm(quaternions, axis=1, keepdims=True)
+    quaternions = np.where(length > 0, quaternions / np.where(length > 0, length, 1), [1, 0, 0, 0])
+    w, x, y, z = quaternions.T
+    return np.stack(
+        (
+            np.stack((1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)), axis=1),
+            np.stack((2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)), axis=1),
+            np.stack((2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)), axis=1),
+        ),
+        axis=1,
+    )
+
+
+def axis_angles_to_quaternions(axis_angles: np.ndarray) -> np.ndarray:
+    """(w, x, y, z) quaternions from (angle, x, y, z) axis angles, like Quaternion(axis, angle)"""
+    length = np.linalg.norm(axis_angles[:, 1:], axis=1, keepdims=True)
+    axes = np.where(length > 0, axis_angles[:, 1:] / np.where(length > 0, length, 1), 0)
+    half_angles = np.where(length[:, 0] > 0, axis_angles[:, 0], 0)[:, None] / 2
+    return np.hstack((np.cos(half_angles), axes * np.sin(half_angles)))
+
+
+def matrices_to_eulers(matrices: np.ndarray) -> np.ndarray:
+    """
+    XYZ euler angles of shape (frames, 3) from normalized rotation matrices,
+    picking the smaller of the two solutions like Matrix.to_euler() does.
+    """
+    cy = np.hypot(matrices[:, 0, 0], matrices[:, 1, 0])
+    eulers = np.stack(
+        (
+            np.arctan2(matrices[:, 2, 1], matrices[:, 2, 2]),
+            np.arctan2(-matrices[:, 2, 0], cy),
+            np.arctan2(matrices[:, 1, 0], matrices[:, 0, 0]),
+        ),
+        axis=1,
+    )
+    other_eulers = np.stack(
+        (
+            np.arctan2(-matrices[:, 2, 1], -matrices[:, 2, 2]),
+            np.arctan2(-matrices[:, 2, 0], -cy),
+            np.arctan2(-matrices[:, 1, 0], -matrices[:, 0, 0]),
+        ),
+        axis=1,
+    )
+    gimbal_lock = cy <= 16 * np.finfo(np.float32).eps
+    eulers[gimbal_lock] = np.stack(
+        (
+            np.arctan2(-matrices[gimbal_lock, 1, 2], matrices[gimbal_lock, 1, 1]),
+            np.arctan2(-matrices[gimbal_lock, 2, 0], cy[gimbal_lock]),
+            np.zeros(np.count_nonzero(gimbal_lock)),
+        ),
+        axis=1,
+    )
+    other_eulers[gimbal_lock] = eulers[gimbal_lock]
+    use_other = np.abs(eulers).sum(axis=1) > np.abs(other_eulers).sum(axis=1)
+    return np.where(use_other[:, None], other_eulers, eulers)
+
+
+def get_bezier_points(p0: np.ndarray, p1: np.ndarray, p2: np.ndarray, p3: np.ndarray, t: np.ndarray) -> np.ndarray:
+    return (1 - t) ** 3 * p0 + 3 * (1 - t) ** 2 * t * p1 + 3 * (1 - t) * t**2 * p2 + t**3 * p3
+
+
+def sample_fcurve(fcurve: FCurve, frames) -> np.ndarray:
+    """
+    Values of an F-curve at every frame. Constant, linear and bezier keyframes are interpolated for all frames at once,
+    anything else (modifiers, easing, linear extrapolation) falls back to FCurve.evaluate.
+    """
+    frames = np.asarray(frames, dtype=np.float64)
+    points = fcurve.keyframe_points
+    interpolations = [point.interpolation for point in points]
+    if (
+        len(points) == 0
+        or len(fcurve.modifiers) > 0
+        or fcurve.extrapolation != "CONSTANT"
+        or not set(interpolations[:-1]) <= {"CONSTANT", "LINEAR", "BEZIER"}
+    ):
+        return np.array([fcurve.evaluate(frame) for frame in frames], dtype=np.float64)
+
+    def get_points(prop: str):
+        data = np.empty(len(points) * 2, dtype=np.float32)
+        points.foreach_get(prop, data)
+        return data.reshape(-1, 2).astype(np.float64)
+
+    co, handle_left, handle_right = get_points("co"), get_points("handle_left"), get_points("handle_right")
+    # handles on the wrong side of their keyframe make the curve go back in time, leave those to blender
+    if np.any(handle_right[:, 0] < co[:, 0]) or np.any(handle_left[:, 0] > co[:, 0]):
+        return np.array([fcurve.evaluate(frame) for frame in frames], dtype=np.float64)
+
+    # constant extrapolation outside of the keyframes
+    segments = np.searchsorted(co[:, 0], frames, side="right") - 1
+    values = np.where(segments < 0, co[0, 1], co[-1, 1])
+    inside = (segments >= 0) & (segments < len(points) - 1)
+    segments, segment_frames = segments[inside], frames[inside]
+    start, end = co[segments], co[segments + 1]
+    kinds = np.array([interpolations[segment] for segment in segments])
+
+    inside_values = start[:, 1].copy()  # constant
+    linear = kinds == "LINEAR"
+    factors = (segment_frames[linear] - start[linear, 0]) / (end[linear, 0] - start[linear, 0])
+    inside_values[linear] = start[linear, 1] + (end[linear, 1] - start[linear, 1]) * factors
+
+    bezier = kinds == "BEZIER"
+    if np.any(bezier):
+        p0, p3, bezier_frames = start[bezier], end[bezier], segment_frames[bezier]
+        h1, h2 = p0 - handle_right[segments[bezier]], p3 - handle_left[segments[bezier] + 1]
+        # same as BKE_fcurve_correct_bezpart, shortens handles that are longer than the segment
+        handle_lengths = np.abs(h1[:, 0]) + np.abs(h2[:, 0])
+        factors = np.where(
+            handle_lengths > p3[:, 0] - p0[:, 0],
+            (p3[:, 0] - p0[:, 0]) / np.where(handle_lengths > 0, handle_lengths, 1),
+            1,
+        )[:, None]
+        p1, p2 = p0 - factors * h1, p3 - factors * h2
+        # the frame always increases along a corrected segment, so the curve position can be found by bisection
+        low, high = np.zeros(len(p0)), np.ones(len(p0))
+        for _ in range(48):
+            middle = (low + high) / 2
+            is_before = get_bezier_points(p0[:, 0], p1[:, 0], p2[:, 0], p3[:, 0], middle) < bezier_frames
+            low, high = np.where(is_before, middle, low), np.where(is_before, high, middle)
+        inside_values[bezier] = get_bezier_points(p0[:, 1], p1[:, 1], p2[:, 1], p3[:, 1], (low + high) / 2)
+
+    values[inside] = inside_values
+    return values
+
+
 def utility_anim_register():
     for cls in classes:
         register_class(cls)
@@ -1,10 +1,10 @@
 from bpy.types import Operator
 from bpy.utils import register_class, unregister_class
 from bpy.ops import object
-from mathutils import Matrix
+from mathutils import Matrix, Vector
 
 from ...utility import PluginError, ExportUtils, raisePluginError
-from ..utility import getOOTScale
+from ..utility import getOOTScale, getSceneObj
 from ..exporter.collision import CollisionHeader
 from .properties import OOTCollisionExportSettings
 
@@ -40,7 +40,49 @@ class OOT_ExportCollision(Operator):
                 return {"CANCELLED"}  # must return a set
 
 
-oot_col_classes = (OOT_ExportCollision,)
+class OOT_AnalyzeCollision(Operator):
+    bl_idname = "object.oot_analyze_collision"
+    bl_label = "Analyze BgCheck Memory"
+    bl_description = (
+        "Estimate the static collision memory the game needs for the selected scene or collision object. "
+        "The full report is printed to the console"
+    )
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        with ExportUtils() as export_utils:
+            try:
+                if context.mode != "OBJECT":
+                    object.mode_set(mode="OBJECT")
+                if len(context.selected_objects) == 0:
+                    raise PluginError("No object selected.")
+                obj = context.active_object
+
+                sceneObj = getSceneObj(obj)
+                if sceneObj is not None:
+                    scaleValue = context.scene.ootBlenderScale
+                    transform = Matrix.Diagonal(Vector((scaleValue, scaleValue, scaleValue))).to_4x4()
+                    header = sceneObj.ootSceneHeader
+                    cameraMode = header.cameraModeCustom if header.cameraMode == "Custom" else header.cameraMode
+                    report = CollisionHeader.analyze(sceneObj, transform, True, cameraMode)
+                elif obj.type == "MESH":
+                    transform = Matrix.Scale(getOOTScale(obj.ootActorScale), 4)
+                    settings: OOTCollisionExportSettings = context.scene.fast64.oot.collisionExportSettings
+                    report = CollisionHeader.analyze(obj, transform, settings.includeChildren)
+                else:
+                    raise PluginError("No scene or mesh object selected.")
+
+                print("\n".join(report.getLines()))
+                self.report({"INFO"} if report.fits else {"WARNING"}, report.getSummary())
+                return {"FINISHED"}
+            except Exception as e:
+                if context.mode != "OBJECT":
+                    object.mode_set(mode="OBJECT")
+                raisePluginError(self, e)
+                return {"CANCELLED"}  # must return a set
+
+
+oot_col_classes = (OOT_ExportCollision, OOT_AnalyzeCollision)
 
 
 def collision_ops_register():
@@ -2,7 +2,7 @@ from bpy.types import Panel, Camera
 from bpy.utils import register_class, unregister_class
 from ...panels import OOT_Panel
 from .properties import OOTCollisionExportSettings, OOTCameraPositionProperty, OOTMaterialCollisionProperty
-from .operators import OOT_ExportCollision
+from .operators import OOT_ExportCollision, OOT_AnalyzeCollision
 
 
 class OOT_CameraPosPanel(Panel):
@@ -53,6 +53,7 @@ class OOT_ExportCollisionPanel(OOT_Panel):
     def draw(self, context):
         col = self.layout.column()
         col.operator(OOT_ExportCollision.bl_idname)
+        col.operator(OOT_AnalyzeCollision.bl_idname)
 
         exportSettings: OOTCollisionExportSettings = context.scene.fast64.oot.collisionExportSettings
         exportSettings.draw_props(col)
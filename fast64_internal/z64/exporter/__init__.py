@@ -88,7 +88,7 @@ class SceneExport:
         return newScene
 
     @staticmethod
-    def export(originalSceneObj: Object, transform: Matrix, exportInfo: ExportInfo):
+    def export(originalSceneObj: Object, transform: Matrix, exportInfo: ExportInfo) -> Scene:
         """Main function"""
         # circular import fixes
         from .decomp_edit.config import Config
@@ -135,3 +135,5 @@ class SceneExport:
                 f"ENTR_{sceneName.upper()}_{hackerootBootOption.spawnIndex}",
                 hackerootBootOption,
             )
+
+        return scene
@@ -29,44 +29,46 @@ class OOTAnimation:
         data.header = f"#ifndef {self.filename.upper()}_H\n" + f"#define {self.filename.upper()}_H\n\n"
 
         if bpy.context.scene.fast64.oot.is_globalh_present():
-            data.header += '#include "ultra64.h"\n' + '#include "global.h"\n\n'
+            data.append_header('#include "ultra64.h"\n' + '#include "global.h"\n\n')
         elif bpy.context.scene.fast64.oot.is_z64sceneh_present():
-            data.header += '#include "ultra64.h"\n' + '#include "array_count.h"\n' + '#include "z64animation.h"\n\n'
+            data.append_header(
+                '#include "ultra64.h"\n' + '#include "array_count.h"\n' + '#include "z64animation.h"\n\n'
+            )
         else:
-            data.header += '#include "ultra64.h"\n' + '#include "array_count.h"\n' + '#include "animation.h"\n\n'
+            data.append_header('#include "ultra64.h"\n' + '#include "array_count.h"\n' + '#include "animation.h"\n\n')
         data.source = f'#include "{self.filename}.h"\n\n'
 
         # values
-        data.source += "s16 " + self.valuesName() + "[" + str(len(self.values)) + "] = {\n"
+        data.append_source("s16 " + self.valuesName() + "[" + str(len(self.values)) + "] = {\n")
         counter = 0
         for value in self.values:
             if counter == 0:
-                data.source += "\t"
-            data.source += format(convertToUnsignedShort(value), "#06x") + ", "
+                data.append_source("\t")
+            data.append_source(format(convertToUnsignedShort(value), "#06x") + ", ")
             counter += 1
             if counter >= 16:  # round number for finding/counting data
                 counter = 0
-                data.source += "\n"
-        data.source += "};\n\n"
+                data.append_source("\n")
+        data.append_source("};\n\n")
 
         # indices (index -1 => translation)
-        data.source += "JointIndex " + self.indicesName() + "[" + str(len(self.indices)) + "] = {\n"
+        data.append_source("JointIndex " + self.indicesName() + "[" + str(len(self.indices)) + "] = {\n")
         for index in range(-1, len(self.indices) - 1):
-            data.source += "\t{ "
+            data.append_source("\t{ ")
             for field in range(3):
-                data.source += (
+                data.append_source(
                     format(
                         convertToUnsignedShort(self.indices[index][field]),
                         "#06x",
                     )
                     + ", "
                 )
-            data.source += "},\n"
-        data.source += "};\n\n"
+            data.append_source("},\n")
+        data.append_source("};\n\n")
 
         # header
-        data.header += "extern AnimationHeader " + self.name + ";\n"
-        data.source += (
+        data.append_header("extern AnimationHeader " + self.name + ";\n")
+        data.append_source(
             "AnimationHeader "
             + self.name
             + " = { { "
@@ -80,7 +82,7 @@ class OOTAnimation:
             + " };\n\n"
         )
 
-        data.header += "\n#endif\n"
+        data.append_header("\n#endif\n")
         return data
 
 
@@ -102,16 +104,18 @@ class OOTLinkAnimation:
         animHeaderData.header = f"#ifndef {self.headerName.upper()}_H\n" + f"#define {self.headerName.upper()}_H\n\n"
 
         if bpy.context.scene.fast64.oot.is_globalh_present():
-            data.header += '#include "ultra64.h"\n' + '#include "global.h"\n\n'
-            animHeaderData.header += '#include "ultra64.h"\n' + '#include "global.h"\n\n'
+            data.append_header('#include "ultra64.h"\n' + '#include "global.h"\n\n')
+            animHeaderData.append_header('#include "ultra64.h"\n' + '#include "global.h"\n\n')
         elif bpy.context.scene.fast64.oot.is_z64sceneh_present():
-            data.header += '#include "ultra64.h"\n' + '#include "array_count.h"\n' + '#include "z64animation.h"\n\n'
-            animHeaderData.header += (
+            data.append_header(
+                '#include "ultra64.h"\n' + '#include "array_count.h"\n' + '#include "z64animation.h"\n\n'
+            )
+            animHeaderData.append_header(
                 '#include "ultra64.h"\n' + '#include "array_count.h"\n' + '#include "z64animation.h"\n\n'
             )
         else:
-            data.header += '#include "ultra64.h"\n' + '#include "array_count.h"\n' + '#include "animation.h"\n\n'
-            animHeaderData.header += (
+            data.append_header('#include "ultra64.h"\n' + '#include "array_count.h"\n' + '#include "animation.h"\n\n')
+            animHeaderData.append_header(
                 '#include "ultra64.h"\n' + '#include "array_count.h"\n' + '#include "animation.h"\n\n'
             )
 
@@ -120,30 +124,30 @@ class OOTLinkAnimation:
 
         # TODO: handle custom import?
         if isCustomExport:
-            animHeaderData.source += f'#include "{self.dataName()}.h"\n\n'
+            animHeaderData.append_source(f'#include "{self.dataName()}.h"\n\n')
         else:
-            animHeaderData.source += f'#include "assets/misc/link_animetion/{self.dataName()}.h"\n\n'
+            animHeaderData.append_source(f'#include "assets/misc/link_animetion/{self.dataName()}.h"\n\n')
 
         # data
-        data.header += f"extern s16 {self.dataName()}[];\n"
-        data.source += f"s16 {self.dataName()}[] = {{\n"
+        data.append_header(f"extern s16 {self.dataName()}[];\n")
+        data.append_source(f"s16 {self.dataName()}[] = {{\n")
         counter = 0
         for value in self.data:
             if counter == 0:
-                data.source += "\t"
-            data.source += format(convertToUnsignedShort(value), "#06x") + ", "
+                data.append_source("\t")
+            data.append_source(format(convertToUnsignedShort(value), "#06x") + ", ")
             counter += 1
             if counter >= 8:  # round number for finding/counting data
                 counter = 0
-                data.source += "\n"
-        data.source += "\n};\n\n"
+                data.append_source("\n")
+        data.append_source("\n};\n\n")
 
         # header
-        animHeaderData.header += f"extern LinkAnimationHeader {self.headerName};\n"
-        animHeaderData.source += (
+        animHeaderData.append_header(f"extern LinkAnimationHeader {self.headerName};\n")
+        animHeaderData.append_source(
             f"LinkAnimationHeader {self.headerName} = {{\n\t{{ {str(self.frameCount)} }}, {self.dataName()} \n}};\n\n"
         )
 
-        data.header += "\n#endif\n"
-        animHeaderData.header += "\n#endif\n"
+        data.append_header("\n#endif\n")
+        animHeaderData.append_header("\n#endif\n")
         return data, animHeaderData
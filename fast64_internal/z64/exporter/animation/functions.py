@@ -1,6 +1,7 @@
 import math
 import mathutils
 import bpy
+import numpy as np
 from ....utility import PluginError, toAlnum
 from ..skeleton import ootConvertArmatureToSkeletonWithoutMesh
 from .classes import OOTAnimation, OOTLinkAnimation
@@ -12,6 +13,12 @@ from ....utility_anim import (
     squashFramesIfAllSame,
     getFrameInterval,
     stashActionInArmature,
+    get_fcurves,
+    sample_fcurve,
+    eulers_to_matrices,
+    quaternions_to_matrices,
+    axis_angles_to_quaternions,
+    matrices_to_eulers,
 )
 
 from ...utility import (
@@ -85,6 +92,140 @@ def ootGetAnimBoneRot(bone, poseBone, convertTransformMatrix, isRoot):
     return finalRotation
 
 
+def ootEulersToFrameValues(eulers: np.ndarray) -> list[list[int]]:
+    """Same conversion as saveQuaternionFrame, for each axis of every frame"""
+    values = (np.degrees(eulers) % 360) / 360
+    return [[min(int(round(value * (2**16 - 1))), 2**16 - 1) for value in axisValues] for axisValues in values.T]
+
+
+class OOTFCurveSampler:
+    """
+    Evaluates the pose of an armature from the F-curves of its active action for a range of frames,
+    without calling frame_set for every frame. Only valid when canSample() is True.
+    """
+
+    def __init__(self, armatureObj: bpy.types.Object, frames: range):
+        self.armatureObj = armatureObj
+        self.frames = np.array(frames, dtype=np.float64)
+        self.basisMatrices: dict[str, np.ndarray] = {}  # bone name : basis matrix of every frame
+        self.poseMatrices: dict[str, np.ndarray] = {}  # bone name : pose matrix of every frame
+        animData = armatureObj.animation_data
+        self.fcurves = {
+            (fcurve.data_path, fcurve.array_index): fcurve
+            for fcurve in get_fcurves(animData.action, getattr(animData, "action_slot", None))
+            if not fcurve.mute and (fcurve.group is None or not fcurve.group.mute)
+        }
+
+    @staticmethod
+    def canSample(armatureObj: bpy.types.Object, hasTextureAnim: bool) -> bool:
+        """False if anything besides the active action's F-curves affects the pose, like constraints or drivers"""
+        animData = armatureObj.animation_data
+        if animData is None or animData.action is None or armatureObj.data.pose_position != "POSE":
+            return False
+        if bpy.app.version >= (5, 0, 0) and animData.action_slot is None:
+            return False
+        if len(animData.drivers) > 0 or animData.use_tweak_mode:
+            return False
+        if animData.action_influence < 1 or animData.action_blend_type != "REPLACE":
+            return False
+        if animData.use_nla and any(not track.mute for track in animData.nla_tracks):
+            return False
+        dataPaths = {
+            fcurve.data_path for fcurve in get_fcurves(animData.action, getattr(animData, "action_slot", None))
+        }
+        if hasTextureAnim and any(dataPath.startswith("ootLinkTextureAnim") for dataPath in dataPaths):
+            return False
+        for poseBone in armatureObj.pose.bones:
+            bone = poseBone.bone
+            if len(poseBone.constraints) > 0:
+                return False
+            if not bone.use_inherit_rotation or bone.inherit_scale != "FULL" or not bone.use_local_location:
+                return False
+            # the location of connected bones is ignored when posing
+            if bone.use_connect and (any(poseBone.location) or poseBone.path_from_id("location") in dataPaths):
+                return False
+        return True
+
+    def sample(self, poseBone: bpy.types.PoseBone, prop: str) -> np.ndarray:
+        """Values of a pose bone property of shape (frames, channels), channels without F-curves keep their value"""
+        dataPath = poseBone.path_from_id(prop)
+        values = np.array([list(getattr(poseBone, prop))] * len(self.frames), dtype=np.float64)
+        for i in range(values.shape[1]):
+            fcurve = self.fcurves.get((dataPath, i))
+            if fcurve is not None:
+                values[:, i] = sample_fcurve(fcurve, self.frames)
+        return values
+
+    def getBasisMatrices(self, boneName: str) -> np.ndarray:
+        """poseBone.matrix_basis of every frame, shape (frames, 4, 4)"""
+        if boneName not in self.basisMatrices:
+            poseBone = self.armatureObj.pose.bones[boneName]
+            mode = poseBone.rotation_mode
+            if mode == "QUATERNION":
+                rotations = quaternions_to_matrices(self.sample(poseBone, "rotation_quaternion"))
+            elif mode == "AXIS_ANGLE":
+                rotations = quaternions_to_matrices(
+                    axis_angles_to_quaternions(self.sample(poseBone, "rotation_axis_angle"))
+                )
+            else:
+                rotations = eulers_to_matrices(self.sample(poseBone, "rotation_euler"), mode)
+
+            matrices = np.zeros((len(self.frames), 4, 4))
+            matrices[:, :3, :3] = rotations * self.sample(poseBone, "scale")[:, None, :]
+            matrices[:, :3, 3] = self.sample(poseBone, "location")
+            matrices[:, 3, 3] = 1
+            self.basisMatrices[boneName] = matrices
+        return self.basisMatrices[boneName]
+
+    def getParentRelativeMatrices(self, boneName: str) -> np.ndarray:
+        """poseBone.parent.matrix.inverted() @ poseBone.matrix of every frame"""
+        bone = self.armatureObj.data.bones[boneName]
+        restMatrix = np.array(bone.matrix_local)
+        if bone.parent is not None:
+            restMatrix = np.linalg.inv(np.array(bone.parent.matrix_local)) @ restMatrix
+        return restMatrix @ self.getBasisMatrices(boneName)
+
+    def getPoseMatrices(self, boneName: str) -> np.ndarray:
+        """poseBone.matrix of every frame"""
+        if boneName not in self.poseMatrices:
+            bone = self.armatureObj.data.bones[boneName]
+            matrices = self.getParentRelativeMatrices(boneName)
+            if bone.parent is not None:
+                matrices = self.getPoseMatrices(bone.parent.name) @ matrices
+            self.poseMatrices[boneName] = matrices
+        return self.poseMatrices[boneName]
+
+    def getAnimBoneRotations(self, boneName: str, isRoot: bool) -> np.ndarray:
+        """ootGetAnimBoneRot of every frame as XYZ euler angles, shape (frames, 3)"""
+        bone = self.armatureObj.data.bones[boneName]
+        origTranslationMatrix = (
+            bone.parent.matrix_local.inverted() if bone.parent is not None else mathutils.Matrix.Identity(4)
+        ) @ bone.matrix_local
+        animMatrices = self.getParentRelativeMatrices(boneName)
+        animMatrices[:, :3, 3] -= np.array(origTranslationMatrix.decompose()[0])
+
+        finalTranslations = animMatrices[:, :3, 3]
+        finalScales = np.linalg.norm(animMatrices[:, :3, :3], axis=1)
+        finalScales[np.linalg.det(animMatrices[:, :3, :3]) < 0] *= -1
+        if np.any(finalScales >= 1.01) or np.any(finalScales <= 0.99):
+            raise RuntimeError("Animation contains bones with animated scale. OoT SkelAnime does not support this.")
+        if not isRoot and (np.any(finalTranslations >= 1.0) or np.any(finalTranslations <= -1.0)):
+            raise RuntimeError(
+                "Animation contains non-root bones with animated translation. OoT SkelAnime only supports animated translation on the root bone."
+            )
+
+        rotations = animMatrices[:, :3, :3] / finalScales[:, None, :]
+        if isRoot:
+            # 90 degree offset because of coordinate system difference.
+            rotations = np.array(mathutils.Matrix.Rotation(math.radians(-90.0), 3, "X")) @ rotations
+        return matrices_to_eulers(rotations)
+
+    def getRootTranslations(self, boneName: str, convertTransformMatrix: mathutils.Matrix) -> np.ndarray:
+        """Root translation of every frame converted to Y-up, shape (frames, 3)"""
+        matrices = np.array(convertTransformMatrix) @ self.getPoseMatrices(boneName)
+        return matrices[:, :3, 3] @ np.array(mathutils.Matrix.Rotation(math.radians(-90.0), 3, "X")).T
+
+
 def ootConvertNonLinkAnimationData(anim, armatureObj, convertTransformMatrix, *, frame_start, frame_count):
     checkForStartBone(armatureObj)
     bonesToProcess = [getStartBone(armatureObj)]
@@ -114,30 +255,41 @@ def ootConvertNonLinkAnimationData(anim, armatureObj, convertTransformMatrix, *,
         [ValueFrameData(i, 0, []), ValueFrameData(i, 1, []), ValueFrameData(i, 2, [])] for i in range(len(animBones))
     ]
 
-    currentFrame = bpy.context.scene.frame_current
-    for frame in range(frame_start, frame_start + frame_count):
-        bpy.context.scene.frame_set(frame)
-        rootBone = armatureObj.data.bones[animBones[0]]
-        rootPoseBone = armatureObj.pose.bones[animBones[0]]
+    if OOTFCurveSampler.canSample(armatureObj, False):
+        sampler = OOTFCurveSampler(armatureObj, range(frame_start, frame_start + frame_count))
+        translations = sampler.getRootTranslations(animBones[0], convertTransformMatrix)
+        for i in range(3):
+            translationData[i].frames = [min(int(round(value)), 2**16 - 1) for value in translations[:, i]]
+        for boneIndex, boneName in enumerate(animBones):
+            rotations = ootEulersToFrameValues(sampler.getAnimBoneRotations(boneName, boneIndex == 0))
+            for i in range(3):
+                rotationData[boneIndex][i].frames = rotations[i]
+    else:
+        currentFrame = bpy.context.scene.frame_current
+        for frame in range(frame_start, frame_start + frame_count):
+            bpy.context.scene.frame_set(frame)
+            rootBone = armatureObj.data.bones[animBones[0]]
+            rootPoseBone = armatureObj.pose.bones[animBones[0]]
+
+            # Convert Z-up to Y-up for root translation animation
+            translation = (
+                mathutils.Quaternion((1, 0, 0), math.radians(-90.0))
+                @ (convertTransformMatrix @ rootPoseBone.matrix).decompose()[0]
+            )
+            saveTranslationFrame(translationData, translation)
 
-        # Convert Z-up to Y-up for root translation animation
-        translation = (
-            mathutils.Quaternion((1, 0, 0), math.radians(-90.0))
-            @ (convertTransformMatrix @ rootPoseBone.matrix).decompose()[0]
-        )
-        saveTranslationFrame(translationData, translation)
+            for boneIndex in range(len(animBones)):
+                boneName = animBones[boneIndex]
+                currentBone = armatureObj.data.bones[boneName]
+                currentPoseBone = armatureObj.pose.bones[boneName]
 
-        for boneIndex in range(len(animBones)):
-            boneName = animBones[boneIndex]
-            currentBone = armatureObj.data.bones[boneName]
-            currentPoseBone = armatureObj.pose.bones[boneName]
+                saveQuaternionFrame(
+                    rotationData[boneIndex],
+                    ootGetAnimBoneRot(currentBone, currentPoseBone, convertTransformMatrix, boneIndex == 0),
+                )
 
-            saveQuaternionFrame(
-                rotationData[boneIndex],
-                ootGetAnimBoneRot(currentBone, currentPoseBone, convertTransformMatrix, boneIndex == 0),
-            )
+        bpy.context.scene.frame_set(currentFrame)
 
-    bpy.context.scene.frame_set(currentFrame)
     squashFramesIfAllSame(translationData)
     for frameData in rotationData:
         squashFramesIfAllSame(frameData)
@@ -176,6 +328,23 @@ def ootConvertLinkAnimationData(anim, armatureObj, convertTransformMatrix, *, fr
 
     frameData = []
 
+    if OOTFCurveSampler.canSample(armatureObj, True):
+        sampler = OOTFCurveSampler(armatureObj, range(frame_start, frame_start + frame_count))
+        translations = sampler.getRootTranslations(animBones[0], convertTransformMatrix)
+        boneRotations = [
+            ootEulersToFrameValues(sampler.getAnimBoneRotations(boneName, boneIndex == 0))
+            for boneIndex, boneName in enumerate(animBones)
+        ]
+        textureAnimValue = (armatureObj.ootLinkTextureAnim.eyes & 0xF) | (
+            (armatureObj.ootLinkTextureAnim.mouth & 0xF) << 4
+        )
+        for frame in range(frame_count):
+            frameData.extend(min(int(round(value)), 2**16 - 1) for value in translations[frame])
+            for rotations in boneRotations:
+                frameData.extend(rotations[i][frame] for i in range(3))
+            frameData.append(textureAnimValue)
+        return frameData
+
     currentFrame = bpy.context.scene.frame_current
     for frame in range(frame_start, frame_start + frame_count):
         bpy.context.scene.frame_set(frame)
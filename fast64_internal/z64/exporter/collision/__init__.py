@@ -1,6 +1,6 @@
 import bpy
 import ctypes
-import math
+import numpy as np
 
 from pathlib import Path
 from dataclasses import dataclass
@@ -17,55 +17,32 @@ from ....utility import (
     restoreHiddenState,
     cleanupDuplicatedObjects,
     indent,
+    getTransformedMeshTriangles,
+    getDegenerateTriangles,
 )
 
 from ...utility import (
     OOTObjectCategorizer,
     convertIntTo2sComplement,
     ootDuplicateHierarchy,
+    ootCleanupScene,
     ootGetPath,
     ootGetObjectPath,
 )
 
 from ...collision.properties import OOTCollisionExportSettings
-from ..utility import Utility
 from .polygons import CollisionPoly, CollisionPolygons
 from .surface import SurfaceType, SurfaceTypes
 from .camera import BgCamInformations
 from .waterbox import WaterBoxes
 from .vertex import CollisionVertex, CollisionVertices
+from .bgcheck import BgCheckProfile, BgCheckReport, BgCheckSimulator
 
 
 @dataclass
 class CollisionUtility:
     """This class hosts different functions used to convert mesh data"""
 
-    @staticmethod
-    def updateBounds(position: tuple[int, int, int], colBounds: list[tuple[int, int, int]]):
-        """This is used to update the scene's boundaries"""
-
-        if len(colBounds) == 0:
-            colBounds.append([position[0], position[1], position[2]])
-            colBounds.append([position[0], position[1], position[2]])
-            return
-
-        minBounds = colBounds[0]
-        maxBounds = colBounds[1]
-        for i in range(3):
-            if position[i] < minBounds[i]:
-                minBounds[i] = position[i]
-            if position[i] > maxBounds[i]:
-                maxBounds[i] = position[i]
-
-    @staticmethod
-    def getVertexIndex(vertexPos: tuple[int, int, int], vertexList: list[CollisionVertex]):
-        """Returns the index of a CollisionVertex based on position data, returns None if no match found"""
-
-        for i in range(len(vertexList)):
-            if vertexList[i].pos == vertexPos:
-                return i
-        return None
-
     @staticmethod
     def getMeshObjects(
         dataHolder: Object, curTransform: Matrix, transformFromMeshObj: dict[Object, Matrix], includeChildren: bool
@@ -103,62 +80,65 @@ class CollisionUtility:
         transformFromMeshObj = CollisionUtility.getMeshObjects(
             dataHolder, transform, transformFromMeshObj, includeChildren
         )
+        vertexIndices: dict[tuple[int, int, int], int] = {}  # position : index in vertexList
         for meshObj, transform in transformFromMeshObj.items():
             # Note: ``isinstance``only used to get the proper type hints
             if not meshObj.ignore_collision and isinstance(meshObj.data, Mesh):
                 if len(meshObj.data.materials) == 0:
                     raise PluginError(f"'{meshObj.name}' must have a material associated with it.")
 
-                meshObj.data.calc_loop_triangles()
-                for i, face in enumerate(meshObj.data.loop_triangles):
+                # get bounds and vertices data
+                positions, triangles = getTransformedMeshTriangles(meshObj.data, transform)
+                if len(triangles) == 0:
+                    continue
+                roundedPositions = np.rint(positions).astype(np.int64)
+                corners = roundedPositions[triangles]
+                usedPositions = roundedPositions[np.unique(triangles)]
+                minBounds, maxBounds = usedPositions.min(axis=0).tolist(), usedPositions.max(axis=0).tolist()
+                if len(colBounds) == 0:
+                    colBounds.extend((minBounds, maxBounds))
+                else:
+                    colBounds[0] = [min(a, b) for a, b in zip(colBounds[0], minBounds)]
+                    colBounds[1] = [max(a, b) for a, b in zip(colBounds[1], maxBounds)]
+
+                normalMatrix = transform.inverted().transposed()
+                normals = [(normalMatrix @ face.normal).normalized() for face in meshObj.data.loop_triangles]
+                normalArray = np.array(normals, dtype=np.float64).reshape(-1, 3)
+                planePoints = positions[triangles[:, 0]]
+                # same operation order as a per triangle dot product, so the rounding matches
+                dots = (
+                    normalArray[:, 0] * planePoints[:, 0]
+                    + normalArray[:, 1] * planePoints[:, 1]
+                    + normalArray[:, 2] * planePoints[:, 2]
+                )
+                distances = np.rint(-dots).astype(np.int64)
+
+                invalid = getDegenerateTriangles(corners)
+                # for walls only, see https://github.com/zeldaret/oot/blob/eb5dac74d6435baf85ced9158d3ff915ba8872ca/src/code/z_bgcheck.c#L751
+                isWall = (normalArray[:, 1] >= -0.8) & (normalArray[:, 1] <= 0.5)
+                normalXZ = np.sqrt(normalArray[:, 0] * normalArray[:, 0] + normalArray[:, 2] * normalArray[:, 2])
+                invalid |= isWall & (np.fabs(normalXZ) < 0.008)
+                if invalid.any():
+                    face = meshObj.data.loop_triangles[int(np.argmax(invalid))]
                     material = meshObj.material_slots[face.material_index].material
-                    colProp = material.ootCollisionProperty
-                    raise_error = False
-
-                    # get bounds and vertices data
-                    planePoint = transform @ meshObj.data.vertices[face.vertices[0]].co
-                    (x1, y1, z1) = Utility.roundPosition(planePoint)
-                    (x2, y2, z2) = Utility.roundPosition(transform @ meshObj.data.vertices[face.vertices[1]].co)
-                    (x3, y3, z3) = Utility.roundPosition(transform @ meshObj.data.vertices[face.vertices[2]].co)
-                    CollisionUtility.updateBounds((x1, y1, z1), colBounds)
-                    CollisionUtility.updateBounds((x2, y2, z2), colBounds)
-                    CollisionUtility.updateBounds((x3, y3, z3), colBounds)
-
-                    normal = (transform.inverted().transposed() @ face.normal).normalized()
-                    distance = round(
-                        -1 * (normal[0] * planePoint[0] + normal[1] * planePoint[1] + normal[2] * planePoint[2])
+                    raise PluginError(
+                        f"degenerate triangle detected on mesh object '{meshObj.name}' (material name is '{material.name}')"
                     )
-                    distance = convertIntTo2sComplement(distance, 2, True)
-
-                    def sq(val):
-                        return val * val
-
-                    nx = (y2 - y1) * (z3 - z2) - (z2 - z1) * (y3 - y2)
-                    ny = (z2 - z1) * (x3 - x2) - (x2 - x1) * (z3 - z2)
-                    nz = (x2 - x1) * (y3 - y2) - (y2 - y1) * (x3 - x2)
-                    magSqr = sq(nx) + sq(ny) + sq(nz)
-                    if magSqr <= 0:
-                        raise_error = True
 
-                    # for walls only, see https://github.com/zeldaret/oot/blob/eb5dac74d6435baf85ced9158d3ff915ba8872ca/src/code/z_bgcheck.c#L751
-                    if normal[1] >= -0.8 and normal[1] <= 0.5:
-                        normal_xz = math.sqrt(sq(normal[0]) + sq(normal[2]))
-                        if math.fabs(normal_xz) < 0.008:
-                            raise_error = True
-
-                    if raise_error:
-                        raise PluginError(
-                            f"degenerate triangle detected on mesh object '{meshObj.name}' (material name is '{material.name}')"
-                        )
+                for i, (face, normal, distance, faceVerts) in enumerate(
+                    zip(meshObj.data.loop_triangles, normals, distances.tolist(), corners.tolist())
+                ):
+                    material = meshObj.material_slots[face.material_index].material
+                    colProp = material.ootCollisionProperty
+                    distance = convertIntTo2sComplement(distance, 2, True)
 
                     indices: list[int] = []
-                    for pos in [(x1, y1, z1), (x2, y2, z2), (x3, y3, z3)]:
-                        vertexIndex = CollisionUtility.getVertexIndex(pos, vertexList)
-                        if vertexIndex is None:
+                    for pos in faceVerts:
+                        pos = tuple(pos)
+                        if pos not in vertexIndices:
+                            vertexIndices[pos] = len(vertexList)
                             vertexList.append(CollisionVertex(pos))
-                            indices.append(len(vertexList) - 1)
-                        else:
-                            indices.append(vertexIndex)
+                        indices.append(vertexIndices[pos])
                     assert len(indices) == 3
 
                     # We need to ensure two things about the order in which the vertex indices are:
@@ -304,6 +284,40 @@ class CollisionHeader:
 
         cleanupDuplicatedObjects([obj])
 
+    @staticmethod
+    def analyze(original_obj: Object, transform: Matrix, includeChildren: bool, cameraMode: str = "0x00"):
+        """Returns the BgCheck report of an object's collision, with a suggested subdivision amount"""
+        name = toAlnum(original_obj.name)
+
+        if bpy.context.scene.exportHiddenGeometry:
+            hiddenState = unhideAllAndGetHiddenState(bpy.context.scene)
+
+        obj, allObjs = ootDuplicateHierarchy(original_obj, None, True, OOTObjectCategorizer())
+
+        if bpy.context.scene.exportHiddenGeometry:
+            restoreHiddenState(hiddenState)
+
+        try:
+            col_header = CollisionHeader.new(
+                f"{name}_collisionHeader",
+                name,
+                obj,
+                transform,
+                bpy.context.scene.fast64.oot.useDecompFeatures,
+                includeChildren,
+            )
+            return col_header.getBgCheckReport(cameraMode, suggest=True)
+        finally:
+            ootCleanupScene(original_obj, allObjs)
+
+    def getBgCheckReport(self, cameraMode: str = "0x00", suggest: bool = False) -> BgCheckReport:
+        """Returns an estimate of the static collision memory the game needs to load this collision"""
+
+        simulator = BgCheckSimulator(
+            self.minBounds, self.maxBounds, self.vertices.vertexList, self.collisionPoly.polyList
+        )
+        return simulator.simulate(BgCheckProfile.new(cameraMode), suggest=suggest)
+
     def getCmd(self):
         """Returns the collision header scene command"""
 
@@ -351,10 +365,10 @@ class CollisionHeader:
         headerData.append(colData)
 
         # .h
-        headerData.header += f"extern {varName};\n"
+        headerData.append_header(f"extern {varName};\n")
 
         # .c
-        headerData.source += (
+        headerData.append_source(
             (varName + " = {\n")
             + ",\n".join(
                 indent + val
@@ -403,11 +417,11 @@ class CollisionHeader:
         filedata.source = f'#include "{filename}.h"\n'
 
         if not settings.customExport:
-            filedata.source += f'#include "{settings.folder}.h"\n\n'
+            filedata.append_source(f'#include "{settings.folder}.h"\n\n')
         else:
-            filedata.source += "\n"
+            filedata.append_source("\n")
 
         filedata.append(self.getC())
-        filedata.header += "\n#endif\n"
+        filedata.append_header("\n#endif\n")
 
         return filedata
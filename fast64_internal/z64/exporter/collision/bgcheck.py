@@ -0,0 +1,348 @@
+import numpy as np
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from ....utility import hexOrDecInt
+from .vertex import CollisionVertex
+from .polygons import CollisionPoly
+
+# values from OoT's z_bgcheck.c / z64bgcheck.h
+BGCHECK_SUBDIV_OVERLAP = 50
+BGCHECK_SUBDIV_MIN = 150
+SS_NULL = 0xFFFF
+
+SIZEOF_STATIC_LOOKUP = 0x6
+SIZEOF_SS_NODE = 0x4
+SIZEOF_COLLISION_POLY = 0x10
+SIZEOF_VEC3S = 0x6
+SIZEOF_COLLISION_CONTEXT = 0x1464
+
+# COLPOLY_SNORMAL(0.5f) and COLPOLY_SNORMAL(-0.8f), used by StaticLookup_AddPoly to pick the poly list
+FLOOR_MIN_NORMAL_Y = 16383
+CEILING_MAX_NORMAL_Y = -26213
+
+SUGGESTED_SUBDIV_XZ = (4, 8, 12, 16, 24, 32)
+SUGGESTED_SUBDIV_Y = (1, 2, 4, 8)
+
+
+@dataclass
+class BgCheckProfile:
+    """Allocation settings picked by ``BgCheck_Allocate`` for a scene"""
+
+    name: str
+    memSize: int
+    subdivAmount: tuple[int, int, int]
+    dynaPolyNodesMax: int
+    dynaPolyListMax: int
+    dynaVtxListMax: int
+    nodeListMax: Optional[int] = None  # set by custom subdivisions (``sSceneSubdivisionList``)
+
+    @staticmethod
+    def new(cameraMode: str, isSpotScene: bool = False):
+        """Returns the profile the game would use for a scene with this camera mode (``R_SCENE_CAM_TYPE``)"""
+
+        try:
+            camType = hexOrDecInt(cameraMode)
+        except ValueError:
+            camType = 0
+
+        if camType in {0x10, 0x20, 0x30, 0x40}:
+            return BgCheckProfile("Fixed Camera", 0x4E20, (2, 2, 2), 500, 256, 256)
+        if isSpotScene:
+            return BgCheckProfile("Spot", 0xF000, (16, 4, 16), 1000, 512, 512)
+        return BgCheckProfile("Default", 0x23000, (16, 4, 16), 1000, 544, 512)
+
+    def withSubdivisions(self, subdivAmount: tuple[int, int, int], nodeListMax: Optional[int] = None):
+        return BgCheckProfile(
+            self.name,
+            self.memSize,
+            subdivAmount,
+            self.dynaPolyNodesMax,
+            self.dynaPolyListMax,
+            self.dynaVtxListMax,
+            nodeListMax,
+        )
+
+
+@dataclass
+class BgCheckCell:
+    """Number of static lookup nodes used by one subdivision"""
+
+    index: tuple[int, int, int]
+    floor: int
+    wall: int
+    ceiling: int
+
+    @property
+    def total(self):
+        return self.floor + self.wall + self.ceiling
+
+
+@dataclass
+class BgCheckReport:
+    """Estimate of the static collision memory used by ``BgCheck_Allocate`` for a collision header"""
+
+    profile: BgCheckProfile
+    polyCount: int
+    minBounds: tuple[int, int, int]
+    maxBounds: tuple[float, float, float]
+    subdivLength: tuple[float, float, float]
+    floorNodes: int
+    wallNodes: int
+    ceilingNodes: int
+    worstCells: list[BgCheckCell]
+    suggestion: Optional["BgCheckReport"] = field(default=None, repr=False)
+
+    @property
+    def nodeCount(self):
+        return self.floorNodes + self.wallNodes + self.ceilingNodes
+
+    @property
+    def lookupTableSize(self):
+        subdivX, subdivY, subdivZ = self.profile.subdivAmount
+        return subdivX * subdivY * subdivZ * SIZEOF_STATIC_LOOKUP
+
+    @property
+    def fixedSize(self):
+        """Memory used before any static lookup node is allocated"""
+
+        return (
+            self.lookupTableSize
+            + self.polyCount  # polyCheckTbl
+            + self.profile.dynaPolyNodesMax * SIZEOF_SS_NODE
+            + self.profile.dynaPolyListMax * SIZEOF_COLLISION_POLY
+            + self.profile.dynaVtxListMax * SIZEOF_VEC3S
+            + SIZEOF_COLLISION_CONTEXT
+        )
+
+    @property
+    def nodeMax(self):
+        """Number of static lookup nodes the game allocates, node indices can't reach ``SS_NULL``"""
+
+        if self.profile.nodeListMax is not None:
+            return min(self.profile.nodeListMax, SS_NULL)
+        return min(max(self.profile.memSize - self.fixedSize, 0) // SIZEOF_SS_NODE, SS_NULL)
+
+    @property
+    def memoryUsed(self):
+        return self.fixedSize + self.nodeCount * SIZEOF_SS_NODE
+
+    @property
+    def fits(self):
+        return self.fixedSize <= self.profile.memSize and self.nodeCount <= self.nodeMax
+
+    def getSummary(self):
+        status = "OK" if self.fits else "OVERFLOW"
+        return (
+            f"BgCheck ({self.profile.name}): {self.nodeCount}/{self.nodeMax} lookup nodes, "
+            + f"{self.memoryUsed:#x}/{self.profile.memSize:#x} bytes, {status}"
+        )
+
+    def getLines(self):
+        """Returns the full report as a list of lines"""
+
+        lines = [
+            self.getSummary(),
+            f"  polygons: {self.polyCount}",
+            f"  bounds: {self.minBounds} to {tuple(int(val) for val in self.maxBounds)}",
+            f"  subdivisions: {self.profile.subdivAmount}, length {tuple(int(val) for val in self.subdivLength)}",
+            f"  lookup table: {self.lookupTableSize:#x} bytes",
+            f"  nodes: {self.floorNodes} floor, {self.wallNodes} wall, {self.ceilingNodes} ceiling",
+        ]
+
+        if self.fixedSize > self.profile.memSize:
+            lines.append(f"  the fixed allocations alone ({self.fixedSize:#x} bytes) don't fit, the game will hang")
+        elif self.nodeCount > self.nodeMax:
+            lines.append(
+                f"  {self.nodeCount - self.nodeMax} nodes over the limit, polygons will be missing from bgcheck"
+            )
+
+        if len(self.worstCells) > 0:
+            lines.append("  most used subdivisions (x, y, z): floor / wall / ceiling")
+            for cell in self.worstCells:
+                lines.append(f"    {cell.index}: {cell.floor} / {cell.wall} / {cell.ceiling}")
+
+        if self.suggestion is not None:
+            subdivX, subdivY, subdivZ = self.suggestion.profile.subdivAmount
+            worst = self.suggestion.worstCells[0].total if len(self.suggestion.worstCells) > 0 else 0
+            lines.append(
+                f"  suggested subdivisions: {{ {subdivX}, {subdivY}, {subdivZ} }}, "
+                + f"{self.suggestion.nodeCount} nodes, at most {worst} in a subdivision"
+            )
+
+        return lines
+
+
+class BgCheckSimulator:
+    """Reproduces how ``BgCheck_InitStaticLookup`` distributes the static collision polys in the subdivision grid"""
+
+    def __init__(
+        self,
+        minBounds: tuple[int, int, int],
+        maxBounds: tuple[int, int, int],
+        vertexList: list[CollisionVertex],
+        polyList: list[CollisionPoly],
+    ):
+        self.minBounds = minBounds
+        self.maxBounds = maxBounds
+        self.polyCount = len(polyList)
+
+        positions = np.array([vertex.pos for vertex in vertexList], dtype=np.float64).reshape(-1, 3)
+        indices = np.array([poly.indices for poly in polyList], dtype=np.int64).reshape(-1, 3)
+        # (polys, 3 vertices, xyz)
+        self.triangles = positions[indices]
+
+        # the exported normals are truncated to shorts by ``COLPOLY_SNORMAL``
+        normalY = np.array([int(poly.normal[1] * 0x7FFF) for poly in polyList], dtype=np.int64)
+        self.polyType = np.where(normalY > FLOOR_MIN_NORMAL_Y, 0, np.where(normalY < CEILING_MAX_NORMAL_Y, 2, 1))
+
+    def getSubdivisions(self, subdivAmount: tuple[int, int, int]):
+        """``BgCheck_CalcSubdivisionSize`` for every axis, returns the subdivision lengths and the grid's max bounds"""
+
+        lengths = []
+        maxBounds = []
+        for minBound, maxBound, amount in zip(self.minBounds, self.maxBounds, subdivAmount):
+            length = max(float(int((maxBound - minBound) / amount) + 1), BGCHECK_SUBDIV_MIN)
+            lengths.append(length)
+            maxBounds.append(length * amount + minBound)
+        return np.array(lengths), np.array(maxBounds)
+
+    def getPolySubdivisionBounds(self, subdivAmount: tuple[int, int, int], subdivLength: np.ndarray):
+        """``BgCheck_GetPolySubdivisionBounds`` for every poly, returns the first and last subdivision on each axis"""
+
+        amount = np.array(subdivAmount)
+        minBounds = np.array(self.minBounds, dtype=np.float64)
+        intLength = subdivLength.astype(np.int64)
+
+        dMin = self.triangles.min(axis=1) - minBounds
+        sMin = (dMin / subdivLength).astype(np.int64)
+        sMin -= ((dMin.astype(np.int64) % intLength) < BGCHECK_SUBDIV_OVERLAP) & (sMin > 0)
+
+        dMax = self.triangles.max(axis=1) - minBounds
+        sMax = (dMax / subdivLength).astype(np.int64)
+        sMax += ((intLength - BGCHECK_SUBDIV_OVERLAP) < (dMax.astype(np.int64) % intLength)) & (sMax < amount - 1)
+
+        return np.clip(sMin, 0, amount - 1), np.clip(sMax, 0, amount - 1)
+
+    def simulate(self, profile: BgCheckProfile, worstCellCount: int = 5, suggest: bool = False):
+        subdivAmount = profile.subdivAmount
+        subdivLength, maxBounds = self.getSubdivisions(subdivAmount)
+        cellCount = subdivAmount[0] * subdivAmount[1] * subdivAmount[2]
+        nodes = np.zeros((cellCount, 3), dtype=np.int64)
+
+        if self.polyCount > 0:
+            sMin, sMax = self.getPolySubdivisionBounds(subdivAmount, subdivLength)
+            polyIndices, cells = self.getCandidateCells(sMin, sMax)
+
+            # subdivisions are tested with an overlap on each side, see ``BgCheck_InitStaticLookup``
+            boxMin = cells * subdivLength + np.array(self.minBounds) - BGCHECK_SUBDIV_OVERLAP
+            halfSize = (subdivLength + 2 * BGCHECK_SUBDIV_OVERLAP) / 2
+            inside = triangleIntersectsBox(self.triangles[polyIndices], boxMin + halfSize, halfSize)
+
+            cellIndices = (cells[:, 2] * subdivAmount[1] + cells[:, 1]) * subdivAmount[0] + cells[:, 0]
+            np.add.at(nodes, (cellIndices[inside], self.polyType[polyIndices[inside]]), 1)
+
+        cellTotals = nodes.sum(axis=1)
+        worstCells = []
+        for cellIndex in np.argsort(-cellTotals, kind="stable")[:worstCellCount].tolist():
+            if cellTotals[cellIndex] == 0:
+                break
+            x = cellIndex % subdivAmount[0]
+            y = (cellIndex // subdivAmount[0]) % subdivAmount[1]
+            z = cellIndex // (subdivAmount[0] * subdivAmount[1])
+            worstCells.append(BgCheckCell((x, y, z), *nodes[cellIndex].tolist()))
+
+        floorNodes, wallNodes, ceilingNodes = nodes.sum(axis=0).tolist()
+        report = BgCheckReport(
+            profile,
+            self.polyCount,
+            tuple(self.minBounds),
+            tuple(maxBounds.tolist()),
+            tuple(subdivLength.tolist()),
+            floorNodes,
+            wallNodes,
+            ceilingNodes,
+            worstCells,
+        )
+        if suggest:
+            report.suggestion = self.suggestSubdivisions(profile)
+        return report
+
+    def getCandidateCells(self, sMin: np.ndarray, sMax: np.ndarray):
+        """Returns every (poly index, subdivision) pair in the subdivision bounds of each poly"""
+
+        spans = sMax - sMin + 1
+        counts = spans.prod(axis=1)
+        polyIndices = np.repeat(np.arange(self.polyCount), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        spans = spans[polyIndices]
+        cells = np.empty((len(polyIndices), 3), dtype=np.int64)
+        cells[:, 0] = offsets % spans[:, 0]
+        offsets //= spans[:, 0]
+        cells[:, 1] = offsets % spans[:, 1]
+        cells[:, 2] = offsets // spans[:, 1]
+        cells += sMin[polyIndices]
+        return polyIndices, cells
+
+    def suggestSubdivisions(self, profile: BgCheckProfile) -> Optional[BgCheckReport]:
+        """
+        Returns the subdivision amount with the smallest worst subdivision that still fits in memory,
+        this can be added to ``sSceneSubdivisionList`` (with the node count as ``nodeListMax``)
+        """
+
+        best = None
+        for subdivX in SUGGESTED_SUBDIV_XZ:
+            for subdivZ in SUGGESTED_SUBDIV_XZ:
+                for subdivY in SUGGESTED_SUBDIV_Y:
+                    report = self.simulate(profile.withSubdivisions((subdivX, subdivY, subdivZ)), 1)
+                    if not report.fits:
+                        continue
+                    worst = report.worstCells[0].total if len(report.worstCells) > 0 else 0
+                    if best is None or (worst, report.memoryUsed) < best[0]:
+                        best = ((worst, report.memoryUsed), report)
+        return best[1] if best is not None else None
+
+
+def triangleIntersectsBox(triangles: np.ndarray, boxCenter: np.ndarray, halfSize: np.ndarray):
+    """
+    Separating axis test between triangles of shape (n, 3, 3) and axis aligned boxes,
+    geometric equivalent of ``CollisionPoly_IsPolyInSubdivision``
+    """
+
+    verts = triangles - boxCenter[:, None, :]
+    halfSize = np.broadcast_to(halfSize, boxCenter.shape)
+
+    # most triangles have a vertex inside the subdivision, only the others need the full test
+    intersects = (np.abs(verts) <= halfSize[:, None, :]).all(axis=2).any(axis=1)
+    remaining = np.flatnonzero(~intersects)
+    v0, v1, v2 = verts[remaining, 0], verts[remaining, 1], verts[remaining, 2]
+    halfSize = halfSize[remaining]
+
+    def overlaps(p0, p1, p2, radius):
+        return (np.minimum(np.minimum(p0, p1), p2) <= radius) & (np.maximum(np.maximum(p0, p1), p2) >= -radius)
+
+    # box face normals
+    result = overlaps(v0[:, 0], v1[:, 0], v2[:, 0], halfSize[:, 0])
+    result &= overlaps(v0[:, 1], v1[:, 1], v2[:, 1], halfSize[:, 1])
+    result &= overlaps(v0[:, 2], v1[:, 2], v2[:, 2], halfSize[:, 2])
+
+    # triangle plane
+    edges = (v1 - v0, v2 - v1, v0 - v2)
+    normal = np.cross(edges[0], edges[1])
+    result &= np.abs((normal * v0).sum(axis=1)) <= (np.abs(normal) * halfSize).sum(axis=1)
+
+    # cross products of the box axes and the triangle edges
+    for edge in edges:
+        for axis in range(3):
+            a, b = (axis + 1) % 3, (axis + 2) % 3
+            # cross(axis, edge) only has components on the two other axes
+            p0 = v0[:, b] * edge[:, a] - v0[:, a] * edge[:, b]
+            p1 = v1[:, b] * edge[:, a] - v1[:, a] * edge[:, b]
+            p2 = v2[:, b] * edge[:, a] - v2[:, a] * edge[:, b]
+            radius = halfSize[:, a] * np.abs(edge[:, b]) + halfSize[:, b] * np.abs(edge[:, a])
+            result &= overlaps(p0, p1, p2, radius)
+
+    intersects[remaining] = result
+    return intersects
@@ -195,11 +195,11 @@ class BgCamInformations:
         posData.source = listName + " = {\n"
         for val in self.camFromIndex.values():
             if isinstance(val, CrawlspaceCamera):
-                posData.source += val.getDataEntryC() + "\n"
+                posData.append_source(val.getDataEntryC() + "\n")
             elif val.hasPosData:
-                posData.source += val.data.getEntryC() + "\n"
+                posData.append_source(val.data.getEntryC() + "\n")
         posData.source = posData.source[:-1]  # remove extra newline
-        posData.source += "};\n\n"
+        posData.append_source("};\n\n")
 
         return posData
 
@@ -174,7 +174,7 @@ class Cutscene:
         filedata.append(self.getC())
 
         if not skip_endif:
-            filedata.header += "\n#endif\n"
+            filedata.append_header("\n#endif\n")
 
         return filedata
 
@@ -184,12 +184,12 @@ class Room:
         roomHeaders.insert(0, (self.mainHeader, "Child Day (Default)"))
         for i, (curHeader, headerDesc) in enumerate(roomHeaders):
             if curHeader is not None:
-                roomC.source += "/**\n * " + f"Header {headerDesc}\n" + "*/\n"
-                roomC.source += curHeader.getHeaderDefines()
+                roomC.append_source("/**\n * " + f"Header {headerDesc}\n" + "*/\n")
+                roomC.append_source(curHeader.getHeaderDefines())
                 roomC.append(self.getCmdList(curHeader, i == 0 and self.hasAlternateHeaders))
 
                 if i == 0 and self.hasAlternateHeaders and altHeaderPtrList is not None:
-                    roomC.source += altHeaderPtrList
+                    roomC.append_source(altHeaderPtrList)
 
                 if len(curHeader.objects.objectList) > 0:
                     roomC.append(curHeader.objects.getC())
@@ -298,14 +298,14 @@ class Scene:
         headers.insert(0, (self.mainHeader, "Child Day (Default)"))
         for i, (curHeader, headerDesc) in enumerate(headers):
             if curHeader is not None:
-                sceneC.source += "/**\n * " + f"Header {headerDesc}\n" + "*/\n"
+                sceneC.append_source("/**\n * " + f"Header {headerDesc}\n" + "*/\n")
                 sceneC.append(self.getCmdList(curHeader, i == 0 and self.hasAlternateHeaders))
 
                 if i == 0:
                     if self.hasAlternateHeaders and altHeaderPtrs is not None:
                         altHeaderListName = f"SceneCmd* {self.altHeader.name}[]"
-                        sceneC.header += f"extern {altHeaderListName};\n"
-                        sceneC.source += altHeaderListName + " = {\n" + altHeaderPtrs + "\n};\n\n"
+                        sceneC.append_header(f"extern {altHeaderListName};\n")
+                        sceneC.append_source(altHeaderListName + " = {\n" + altHeaderPtrs + "\n};\n\n")
 
                     # Write the room segment list
                     sceneC.append(self.rooms.getC(self.mainHeader.infos.useDummyRoomList))
@@ -195,9 +195,9 @@ class AnimatedMatTexScrollParams:
         data.source = f"{params_name}" + " = {\n" + indent + self.texture_1
 
         if self.texture_2 is not None:
-            data.source += "\n" + indent + self.texture_2
+            data.append_source("\n" + indent + self.texture_2)
 
-        data.source += "\n};\n\n"
+        data.append_source("\n};\n\n")
 
         return data
 
@@ -516,11 +516,11 @@ class AnimatedMatSurfaceSwapParams:
 
         # .h
         if all_externs:
-            data.header += f"extern {params_name};\n"
+            data.append_header(f"extern {params_name};\n")
 
         # .c
         indices = (", ".join(f"{index}" for index in self.meshes) + ", ") if len(self.meshes) > 0 else ""
-        data.source += (
+        data.append_source(
             params_name
             + " = {\n"
             + f"{self.surface_type.getEntryC()}\n"
@@ -669,17 +669,17 @@ class AnimatedMaterial:
             if is_extended and len(self.event_map) > 0 and i in self.event_map:
                 _, _, event_data = self.event_map[i]
                 if all_externs:
-                    data.header += event_data.header
+                    data.append_header(event_data.header)
 
-                data.source += event_data.source
+                data.append_source(event_data.source)
 
         array_name = f"AnimatedMaterial {self.name}[]"
 
         # .h
-        data.header += f"extern {array_name};\n"
+        data.append_header(f"extern {array_name};\n")
 
         # .c
-        data.source += array_name + " = {\n" + indent
+        data.append_source(array_name + " = {\n" + indent)
 
         if len(self.entries) > 0:
             entries = []
@@ -707,11 +707,11 @@ class AnimatedMaterial:
             if len(self.entries) > 0 and self.entries[-1].segment_num > 0:
                 entries[-1] = f"LAST_{entries[-1]}"
 
-            data.source += f"\n{indent}".join("{ " + entry + " }," for entry in entries)
+            data.append_source(f"\n{indent}".join("{ " + entry + " }," for entry in entries))
         else:
-            data.source += "{ 0, 6, NULL, NULL }," if is_extended else "{ 0, 6, NULL },"
+            data.append_source("{ 0, 6, NULL, NULL }," if is_extended else "{ 0, 6, NULL },")
 
-        data.source += "\n};\n"
+        data.append_source("\n};\n")
         return data
 
 
@@ -762,32 +762,32 @@ class SceneAnimatedMaterial:
 
         # create C data
         data = CData()
-        data.header += f'#include "{settings.get_include_name()}"\n'
+        data.append_header(f'#include "{settings.get_include_name()}"\n')
 
         if is_hackeroot():
-            data.header += '#include "config.h"\n\n'
+            data.append_header('#include "config.h"\n\n')
 
             if bpy.context.scene.fast64.oot.hackeroot_settings.export_ifdefs:
-                data.header += "#if ENABLE_ANIMATED_MATERIALS\n\n"
+                data.append_header("#if ENABLE_ANIMATED_MATERIALS\n\n")
         else:
-            data.header += "\n"
+            data.append_header("\n")
 
         if not settings.is_custom_path:
-            data.source += f'#include "assets/objects/{settings.object_name}/{filename}.h"\n\n'
+            data.append_source(f'#include "assets/objects/{settings.object_name}/{filename}.h"\n\n')
 
             if is_hackeroot() and bpy.context.scene.fast64.oot.hackeroot_settings.export_ifdefs:
-                data.source += "#if ENABLE_ANIMATED_MATERIALS\n\n"
+                data.append_source("#if ENABLE_ANIMATED_MATERIALS\n\n")
 
-        data.header += SceneAnimatedMaterial.mat_seg_num_macro
+        data.append_header(SceneAnimatedMaterial.mat_seg_num_macro)
 
         for entry in entries:
             c_data = entry.to_c(False)
-            c_data.source += "\n"
+            c_data.append_source("\n")
             data.append(c_data)
 
         if is_hackeroot():
             if not settings.is_custom_path:
-                data.header += "\n"
+                data.append_header("\n")
         else:
             data.source = data.source[:-1]
 
@@ -795,10 +795,10 @@ class SceneAnimatedMaterial:
         if is_hackeroot() and bpy.context.scene.fast64.oot.hackeroot_settings.export_ifdefs:
             extra = "#endif\n"
 
-        data.source += extra
+        data.append_source(extra)
 
         if not settings.is_custom_path:
-            data.header += extra
+            data.append_header(extra)
 
         # write C data
         if settings.is_custom_path:
@@ -859,8 +859,8 @@ class SceneAnimatedMaterial:
 
         if self.animated_material is not None:
             if is_hackeroot() and bpy.context.scene.fast64.oot.hackeroot_settings.export_ifdefs:
-                data.source += "#if ENABLE_ANIMATED_MATERIALS\n"
-                data.header += "#if ENABLE_ANIMATED_MATERIALS\n"
+                data.append_source("#if ENABLE_ANIMATED_MATERIALS\n")
+                data.append_header("#if ENABLE_ANIMATED_MATERIALS\n")
 
             data.append(self.animated_material.to_c())
 
@@ -868,8 +868,8 @@ class SceneAnimatedMaterial:
             if is_hackeroot() and bpy.context.scene.fast64.oot.hackeroot_settings.export_ifdefs:
                 extra = "#endif\n"
 
-            data.source += extra + "\n"
-            data.header += ("\n" if not is_scene else "") + extra
+            data.append_source(extra + "\n")
+            data.append_header(("\n" if not is_scene else "") + extra)
 
         return data
 
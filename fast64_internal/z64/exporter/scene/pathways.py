@@ -85,10 +85,10 @@ class ScenePathways:
         pathListData.source = listName + " = {\n"
 
         for path in self.pathList:
-            pathListData.source += indent + "{ " + f"ARRAY_COUNTU({path.name}), {path.name}" + " },\n"
+            pathListData.append_source(indent + "{ " + f"ARRAY_COUNTU({path.name}), {path.name}" + " },\n")
             pathData.append(path.getC())
 
-        pathListData.source += "};\n\n"
+        pathListData.append_source("};\n\n")
         pathData.append(pathListData)
 
         return pathData
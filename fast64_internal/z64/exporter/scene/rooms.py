@@ -87,12 +87,14 @@ class RoomEntries:
             segNames.append((f"_{roomName}SegmentRomStart", f"_{roomName}SegmentRomEnd"))
 
         # .h
-        roomList.header += f"extern {listName};\n"
+        roomList.append_header(f"extern {listName};\n")
 
         if not useDummyRoomList:
             # Write externs for rom segments
-            roomList.header += "".join(
-                f"extern u8 {startName}[];\n" + f"extern u8 {stopName}[];\n" for startName, stopName in segNames
+            roomList.append_header(
+                "".join(
+                    f"extern u8 {startName}[];\n" + f"extern u8 {stopName}[];\n" for startName, stopName in segNames
+                )
             )
 
         # .c
@@ -103,12 +105,12 @@ class RoomEntries:
                 "// Dummy room list\n" + roomList.source + ((indent + "{ NULL, NULL },\n") * len(self.entries))
             )
         else:
-            roomList.source += (
+            roomList.append_source(
                 " },\n".join(
                     indent + "{ " + f"(uintptr_t){startName}, (uintptr_t){stopName}" for startName, stopName in segNames
                 )
                 + " },\n"
             )
 
-        roomList.source += "};\n\n"
+        roomList.append_source("};\n\n")
         return roomList
@@ -263,23 +263,23 @@ class OOTBaseSkeleton(ABC, Generic[OOTLimb]):
 
         limbList = self.createLimbList()
 
-        data.source += "void* " + self.limbsName() + "[" + str(self.getNumLimbs()) + "] = {\n"
+        data.append_source("void* " + self.limbsName() + "[" + str(self.getNumLimbs()) + "] = {\n")
         for limb in limbList:
-            limbData.source += limb.toC()
-            data.source += "\t&" + limb.name + ",\n"
-        limbData.source += "\n"
-        data.source += "};\n\n"
+            limbData.append_source(limb.toC())
+            data.append_source("\t&" + limb.name + ",\n")
+        limbData.append_source("\n")
+        data.append_source("};\n\n")
 
         data.append(self.headerData())
 
         for limb in limbList:
             name = f"{self.name}_{toAlnum(limb.boneName)}".upper()
             if limb.index == 0:
-                data.header += f"#define {name}_POS_LIMB 0\n"
-                data.header += f"#define {name}_ROT_LIMB 1\n"
+                data.append_header(f"#define {name}_POS_LIMB 0\n")
+                data.append_header(f"#define {name}_ROT_LIMB 1\n")
             else:
-                data.header += f"#define {name}_LIMB {limb.index + 1}\n"
-        data.header += f"#define {self.name.upper()}_NUM_LIMBS {len(limbList) + 1}\n"
+                data.append_header(f"#define {name}_LIMB {limb.index + 1}\n")
+        data.append_header(f"#define {self.name.upper()}_NUM_LIMBS {len(limbList) + 1}\n")
 
         limbData.append(data)
 
@@ -291,7 +291,7 @@ class StandardSkeleton(OOTBaseSkeleton[OOTLimb]):
     def headerData(self) -> CData:
         data = CData()
 
-        data.source += f"SkeletonHeader {self.name} = {{ {self.limbsName()}, {self.getNumLimbs()} }};\n\n"
+        data.append_source(f"SkeletonHeader {self.name} = {{ {self.limbsName()}, {self.getNumLimbs()} }};\n\n")
         data.header = f"extern SkeletonHeader {self.name};\n"
 
         return data
@@ -304,7 +304,7 @@ FlexLimb = TypeVar("FlexLimb", StandardLimb, LODLimb)
 class FlexSkeleton(OOTBaseSkeleton[FlexLimb]):
     def headerData(self) -> CData:
         data = CData()
-        data.source += (
+        data.append_source(
             f"FlexSkeletonHeader {self.name} = {{ {self.limbsName()}, {self.getNumLimbs()}, {self.getNumDLs()} }};\n\n"
         )
         data.header = f"extern FlexSkeletonHeader {self.name};\n"
@@ -304,20 +304,20 @@ def ootConvertArmatureToC(
     data.header = f"#ifndef {header_filename.upper()}_H\n" + f"#define {header_filename.upper()}_H\n\n"
 
     if bpy.context.scene.fast64.oot.is_globalh_present():
-        data.header += '#include "ultra64.h"\n' + '#include "global.h"\n'
+        data.append_header('#include "ultra64.h"\n' + '#include "global.h"\n')
     elif bpy.context.scene.fast64.oot.is_z64sceneh_present():
-        data.header += '#include "ultra64.h"\n' + '#include "array_count.h"\n' + '#include "z64animation.h"\n'
+        data.append_header('#include "ultra64.h"\n' + '#include "array_count.h"\n' + '#include "z64animation.h"\n')
     else:
-        data.header += '#include "ultra64.h"\n' + '#include "array_count.h"\n' + '#include "animation.h"\n'
+        data.append_header('#include "ultra64.h"\n' + '#include "array_count.h"\n' + '#include "animation.h"\n')
 
     if skeleton.limbType.typeName == "Skin":
-        data.header += '#include "skin.h"\n'
+        data.append_header('#include "skin.h"\n')
 
     data.source = f'#include "{header_filename}.h"\n\n'
     if not isCustomExport:
-        data.header += f'#include "{folderName}.h"\n\n'
+        data.append_header(f'#include "{folderName}.h"\n\n')
     else:
-        data.header += "\n"
+        data.append_header("\n")
 
     path = ootGetPath(exportPath, isCustomExport, "assets/objects/", folderName, True, True)
     includeDir = settings.customAssetIncludeDir if settings.isCustom else f"assets/objects/{folderName}"
@@ -333,7 +333,7 @@ def ootConvertArmatureToC(
         textureArrayData = writeTextureArraysNew(fModel, flipbookArrayIndex2D)
         data.append(textureArrayData)
 
-    data.header += "\n#endif\n"
+    data.append_header("\n#endif\n")
     writeCData(data, os.path.join(path, filename + ".h"), os.path.join(path, filename + ".c"))
 
     if not isCustomExport:
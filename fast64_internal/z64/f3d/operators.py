@@ -103,13 +103,13 @@ def ootConvertMeshToC(
     data.header = f"#ifndef {filename.upper()}_H\n" + f"#define {filename.upper()}_H\n\n" + '#include "ultra64.h"\n'
 
     if bpy.context.scene.fast64.oot.is_globalh_present():
-        data.header += '#include "global.h"\n'
+        data.append_header('#include "global.h"\n')
 
     data.source = f'#include "{filename}.h"\n\n'
     if not isCustomExport:
-        data.header += f'#include "{folderName}.h"\n\n'
+        data.append_header(f'#include "{folderName}.h"\n\n')
     else:
-        data.header += "\n"
+        data.append_header("\n")
 
     path = ootGetPath(exportPath, isCustomExport, "assets/objects/", folderName, False, True)
     includeDir = settings.customAssetIncludeDir if settings.isCustom else f"assets/objects/{folderName}"
@@ -124,7 +124,7 @@ def ootConvertMeshToC(
         textureArrayData = writeTextureArraysNew(fModel, flipbookArrayIndex2D)
         data.append(textureArrayData)
 
-    data.header += "\n#endif\n"
+    data.append_header("\n#endif\n")
     writeCData(data, os.path.join(path, filename + ".h"), os.path.join(path, filename + ".c"))
 
     if not isCustomExport:
@@ -233,9 +233,9 @@ def writeTextureArraysNew(fModel: OOTModel, arrayIndex: int):
     for flipbook in fModel.flipbooks:
         if flipbook.exportMode == "Array":
             if arrayIndex is not None:
-                textureArrayData.source += flipbook_2d_to_c(flipbook, True, arrayIndex + 1) + "\n"
+                textureArrayData.append_source(flipbook_2d_to_c(flipbook, True, arrayIndex + 1) + "\n")
             else:
-                textureArrayData.source += flipbook_to_c(flipbook, True) + "\n"
+                textureArrayData.append_source(flipbook_to_c(flipbook, True) + "\n")
     return textureArrayData
 
 
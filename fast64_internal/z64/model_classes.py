@@ -415,33 +415,33 @@ class SkinAnimData(FMesh):
         modifData = CData()
 
         modifName = f"{self.namePrefix}SkinLimbModif"
-        modifData.header += f"extern SkinLimbModif {modifName}[{self.limbModifCount}];\n"
-        modifData.source += f"SkinLimbModif {modifName}[{self.limbModifCount}] = {{\n"
+        modifData.append_header(f"extern SkinLimbModif {modifName}[{self.limbModifCount}];\n")
+        modifData.append_source(f"SkinLimbModif {modifName}[{self.limbModifCount}] = {{\n")
 
         for index, modif in enumerate(self.limbModifications):
             transformName = f"{self.namePrefix}SkinTransformation_{index:003}"
             vertexName = f"{self.namePrefix}SkinVertex_{index:003}"
-            modifData.source += f"\t{modif.to_c(vertexName, transformName)}"
+            modifData.append_source(f"\t{modif.to_c(vertexName, transformName)}")
 
-            transformData.header += "extern SkinTransformation " + f"{transformName}[{modif.transformCount}];\n"
-            transformData.source += "SkinTransformation " + f"{transformName}[{modif.transformCount}] = {{\n"
+            transformData.append_header("extern SkinTransformation " + f"{transformName}[{modif.transformCount}];\n")
+            transformData.append_source("SkinTransformation " + f"{transformName}[{modif.transformCount}] = {{\n")
             for transform in modif.limbTransformations:
-                transformData.source += f"\t{transform.to_c()},\n"
-            transformData.source += "};\n\n"
+                transformData.append_source(f"\t{transform.to_c()},\n")
+            transformData.append_source("};\n\n")
 
-            vertexData.header += f"extern SkinVertex {vertexName}[{modif.vtxCount}];\n"
-            vertexData.source += f"SkinVertex {vertexName}[{modif.vtxCount}] = {{\n"
+            vertexData.append_header(f"extern SkinVertex {vertexName}[{modif.vtxCount}];\n")
+            vertexData.append_source(f"SkinVertex {vertexName}[{modif.vtxCount}] = {{\n")
             for vertex in modif.skinVertices:
-                vertexData.source += f"\t{vertex.to_c()},\n"
-            vertexData.source += "};\n\n"
+                vertexData.append_source(f"\t{vertex.to_c()},\n")
+            vertexData.append_source("};\n\n")
 
         staticData.append(transformData)
         staticData.append(vertexData)
         staticData.append(modifData)
-        staticData.source += "};\n\n"
+        staticData.append_source("};\n\n")
 
-        staticData.header += f"extern SkinAnimatedLimbData {self.name};\n"
-        staticData.source += (
+        staticData.append_header(f"extern SkinAnimatedLimbData {self.name};\n")
+        staticData.append_source(
             f"SkinAnimatedLimbData {self.name} = {{\n"
             + f"\t{self.totalVtxCount}, {self.limbModifCount},\n"
             + f"\t{modifName}, {self.draw.name}\n"
@@ -493,11 +493,17 @@ class OOTVert(F3DVert):
         self.transforms.sort(key=lambda transform: transform.limbIndex)
 
     def toVtx(
-        self, mesh, texDimensions, transformMatrix: mathutils.Matrix, isPointSampled: bool, tex_scale=(1, 1)
+        self,
+        mesh,
+        texDimensions,
+        transformMatrix: mathutils.Matrix,
+        isPointSampled: bool,
+        tex_scale=(1, 1),
+        normalMatrix: Optional[mathutils.Matrix] = None,
     ) -> OOTVtx:
         position = self.convertPosition(transformMatrix)
         uv = self.convertUV(texDimensions, isPointSampled, tex_scale)
-        colorOrNormal, packedNormal = self.convertNormalRGB(transformMatrix)
+        colorOrNormal, packedNormal = self.convertNormalRGB(transformMatrix, normalMatrix)
         intTransforms: list[IntTransform] = []
         for transform in self.transforms:
             intTransforms.append(
@@ -523,6 +529,12 @@ class OOTVert(F3DVert):
             and self.transforms == other.transforms
         )
 
+    def key(self) -> tuple:
+        transforms = tuple(
+            (transform.limbIndex, tuple(transform.pos), transform.weight) for transform in self.transforms
+        )
+        return super().key() + (transforms,)
+
 
 @dataclass
 class SkinAnimatedLimbData:
@@ -8,6 +8,7 @@ from bpy.ops import object
 from mathutils import Matrix, Vector
 
 from ...utility import PluginError, ExportUtils, raisePluginError, ootGetSceneOrRoomHeader
+from ...game_data import game_data
 from ..utility import ExportInfo, RemoveInfo, sceneNameFromID, is_hackeroot
 from ..constants import ootEnumMusicSeq, ootEnumSceneID
 from ..importer import parseScene
@@ -172,13 +173,23 @@ class OOT_ExportScene(Operator):
                     settings.auto_add_room_objects,
                 )
 
-                SceneExport.export(
+                scene = SceneExport.export(
                     obj,
                     finalTransform,
                     exportInfo,
                 )
 
-                self.report({"INFO"}, "Success!")
+                # the static collision lookup is built when the scene loads, warn if it won't fit in memory
+                bgCheckReport = None
+                if game_data.z64.is_oot() and scene.colHeader is not None:
+                    cameraMode = scene.mainHeader.infos.sceneCamType if scene.mainHeader.infos is not None else "0x00"
+                    bgCheckReport = scene.colHeader.getBgCheckReport(cameraMode)
+
+                if bgCheckReport is not None and not bgCheckReport.fits:
+                    print("\n".join(bgCheckReport.getLines()))
+                    self.report({"WARNING"}, bgCheckReport.getSummary())
+                else:
+                    self.report({"INFO"}, "Success!")
 
                 # don't select the scene
                 for elem in context.selectable_objects:
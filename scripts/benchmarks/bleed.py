@@ -0,0 +1,77 @@
+import importlib
+import sys
+import time
+from pathlib import Path
+
+import bpy
+
+"""
+A script that times BleedGraphics.bleed_fModel on a synthetic FModel with an increasing number of tri groups.
+
+Usage:
+blender --background --python-exit-code 1 --python bleed.py -- [tri group counts...]
+
+Example:
+blender --background --python-exit-code 1 --python bleed.py -- 1000 4000 16000
+"""
+args = sys.argv[(sys.argv.index("--") + 1) :] if "--" in sys.argv else []
+triGroupCounts = [int(arg) for arg in args] or [1000, 4000, 16000]
+materialCount = 8
+
+# import the addon from this checkout, whatever its folder is named
+repoPath = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(repoPath.parent))
+f3d_gbi = importlib.import_module(f"{repoPath.name}.fast64_internal.f3d.f3d_gbi")
+f3d_bleed = importlib.import_module(f"{repoPath.name}.fast64_internal.f3d.f3d_bleed")
+
+
+def createMaterial(fModel: "f3d_gbi.FModel", index: int) -> "f3d_gbi.FMaterial":
+    fMaterial = f3d_gbi.FMaterial(f"bleed_benchmark_{index}", fModel.DLFormat)
+    fMaterial.material.commands.extend(
+        [
+            f3d_gbi.DPPipeSync(),
+            f3d_gbi.SPGeometryMode({"G_CULL_FRONT"}, {"G_CULL_BACK", "G_LIGHTING"}),
+            f3d_gbi.DPSetEnvColor(255, 255, 255, 255),
+            f3d_gbi.DPSetPrimColor(0, 0, index, index, index, 255),
+            f3d_gbi.SPEndDisplayList(),
+        ]
+    )
+    if fMaterial.revert is not None:
+        fMaterial.revert.commands.extend([f3d_gbi.DPPipeSync(), f3d_gbi.SPEndDisplayList()])
+    fModel.materials[(f"bleed_benchmark_{index}", None, None)] = (fMaterial, (32, 32))
+    return fMaterial
+
+
+def createModel(triGroupCount: int) -> "f3d_gbi.FModel":
+    """A model with one mesh that draws triGroupCount tri groups, cycling through a fixed set of materials"""
+    fModel = f3d_gbi.FModel(
+        "bleed_benchmark", f3d_gbi.DLFormat.Static, f3d_gbi.GfxMatWriteMethod.WriteDifferingAndRevert
+    )
+    fMaterials = [createMaterial(fModel, i) for i in range(materialCount)]
+    fMesh = f3d_gbi.FMesh("bleed_benchmark", fModel.DLFormat)
+    fModel.meshes[fMesh.name] = fMesh
+    for i in range(triGroupCount):
+        fMaterial = fMaterials[i % materialCount]
+        triGroup = f3d_gbi.FTriGroup(fMesh.name, i, fMaterial)
+        triGroup.triList.commands.extend(
+            [
+                f3d_gbi.SPVertex(triGroup.vertexList, 0, 6, 0),
+                f3d_gbi.SP2Triangles(0, 1, 2, 0, 3, 4, 5, 0),
+                f3d_gbi.SPEndDisplayList(),
+            ]
+        )
+        fMesh.triangleGroups.append(triGroup)
+        fMesh.add_material_call(fMaterial)
+        fMesh.draw.commands.append(f3d_gbi.SPDisplayList(triGroup.triList))
+    fMesh.draw.commands.append(f3d_gbi.SPEndDisplayList())
+    return fModel
+
+
+for triGroupCount in triGroupCounts:
+    fModel = createModel(triGroupCount)
+
+    start = time.perf_counter()
+    f3d_bleed.BleedGraphics().bleed_fModel(fModel, fModel.meshes)
+    elapsed = time.perf_counter() - start
+
+    print(f"{triGroupCount} tri groups: {elapsed:.3f}s ({elapsed / triGroupCount * 1e6:.2f} us per tri group)")
@@ -0,0 +1,83 @@
+import importlib
+import sys
+import time
+from pathlib import Path
+
+import bpy
+
+"""
+A script that times the triangle strip ordering done by saveTriangleStrip on grid meshes of increasing size.
+
+Usage:
+blender --background --python-exit-code 1 --python triangle_strip.py -- [triangle counts...]
+
+Example:
+blender --background --python-exit-code 1 --python triangle_strip.py -- 1000 10000 100000
+"""
+args = sys.argv[(sys.argv.index("--") + 1) :] if "--" in sys.argv else []
+triangleCounts = [int(arg) for arg in args] or [1000, 10000, 100000]
+
+# import the addon from this checkout, whatever its folder is named
+repoPath = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(repoPath.parent))
+f3d_writer = importlib.import_module(f"{repoPath.name}.fast64_internal.f3d.f3d_writer")
+
+
+class OrderRecorder:
+    """Stands in for a TriangleConverter, only records the face order"""
+
+    def __init__(self, infoDict):
+        self.triConverterInfo = type("TriConverterInfo", (), {"infoDict": infoDict})()
+        self.currentGroupIndex = None
+        self.faces = []
+
+    def addFace(self, face, stOffset):
+        self.faces.append(face.index)
+
+    def finish(self, terminateDL):
+        pass
+
+
+def createGridMesh(triangleCount: int) -> bpy.types.Mesh:
+    width = int((triangleCount / 2) ** 0.5) + 1
+    verts = [(x, y, 0) for y in range(width + 1) for x in range(width + 1)]
+    faces = []
+    for y in range(width):
+        for x in range(width):
+            a = y * (width + 1) + x
+            faces.append((a, a + 1, a + width + 2, a + width + 1))
+    mesh = bpy.data.meshes.new("triangle_strip_benchmark")
+    mesh.from_pydata(verts, [], faces)
+    mesh.calc_loop_triangles()
+    return mesh
+
+
+def getSmoothMeshInfo(mesh: bpy.types.Mesh, triangleCount: int):
+    """MeshInfo as getInfoDict would build it for a mesh where every shared edge is valid"""
+    faces = list(mesh.loop_triangles)[:triangleCount]
+    infoDict = f3d_writer.MeshInfo()
+    for face in faces:
+        infoDict.validNeighbors[face] = []
+        for edgeKey in face.edge_keys:
+            infoDict.edge.setdefault(edgeKey, []).append(face)
+    for edgeKey, edgeFaces in infoDict.edge.items():
+        for i, face in enumerate(edgeFaces):
+            for otherFace in edgeFaces[i + 1 :]:
+                infoDict.edgeValid[(otherFace, face)] = True
+                infoDict.validNeighbors[face].append(otherFace)
+                infoDict.validNeighbors[otherFace].append(face)
+    return faces, infoDict
+
+
+for triangleCount in triangleCounts:
+    mesh = createGridMesh(triangleCount)
+    faces, infoDict = getSmoothMeshInfo(mesh, triangleCount)
+    recorder = OrderRecorder(infoDict)
+
+    start = time.perf_counter()
+    f3d_writer.saveTriangleStrip(recorder, faces, None, mesh, True)
+    elapsed = time.perf_counter() - start
+
+    assert len(recorder.faces) == len(faces)
+    print(f"{len(faces)} triangles: {elapsed:.3f}s ({elapsed / len(faces) * 1e6:.2f} us per triangle)")
+    bpy.data.meshes.remove(mesh)
@@ -0,0 +1,41 @@
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import bpy
+
+"""
+A script that checks the non CI texture encoders against golden output.
+texture_encoding.json holds a float image's pixels (in image.pixels order, one RGBA row per pixel)
+and the bytes the per pixel encoders produced for them before they were vectorized, for every format.
+The first pixels hit rounding ties and the 0.5 alpha threshold, the rest are random colors.
+
+Usage:
+blender --background --python-exit-code 1 --python texture_encoding.py
+"""
+
+# import the addon from this checkout, whatever its folder is named
+repoPath = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(repoPath.parent))
+f3d_texture_writer = importlib.import_module(f"{repoPath.name}.fast64_internal.f3d.f3d_texture_writer")
+
+with open(Path(__file__).with_suffix(".json")) as fixtureFile:
+    fixture = json.load(fixtureFile)
+
+# a float buffer keeps the exact float32 pixel values
+image = bpy.data.images.new("texture_encoding", fixture["width"], fixture["height"], alpha=True, float_buffer=True)
+image.pixels.foreach_set([value for pixel in fixture["pixels"] for value in pixel])
+
+failed = []
+for texFmt, expected in fixture["expected"].items():
+    data = bytes(f3d_texture_writer.convertNonCITexture(image, texFmt)).hex()
+    if data == expected:
+        print(f"{texFmt}: ok")
+    else:
+        print(f"{texFmt}: expected {expected}, got {data}")
+        failed.append(texFmt)
+
+bpy.data.images.remove(image)
+if failed:
+    raise Exception(f"Texture encoding differs from golden output for {', '.join(failed)}")